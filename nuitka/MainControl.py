@@ -23,6 +23,7 @@ C/API, to compile it to either an executable or an extension module.
 """
 
 from .tree import (
+    ReformulationClasses,
     Recursion,
     Building
 )
@@ -31,6 +32,7 @@ from . import (
     Tracing,
     TreeXML,
     Options,
+    Timing,
     Utils
 )
 
@@ -41,7 +43,10 @@ from .codegen import CodeGeneration
 from .optimizations import Optimization
 from .finalizations import Finalization
 
-import sys, os
+from .Builtins import builtin_anon_names
+
+from io import BytesIO
+import sys, os, pickle
 
 def createNodeTree( filename ):
     """ Create a node tree.
@@ -52,25 +57,32 @@ def createNodeTree( filename ):
 
     """
 
-    # First, build the raw node tree from the source code.
-    result = Building.buildModuleTree(
-        filename = filename,
-        package  = None,
-        is_top   = True,
-        is_main  = not Options.shallMakeModule()
-    )
+    with Timing.timedPhase( "building" ):
+        # First, build the raw node tree from the source code.
+        result = Building.buildModuleTree(
+            filename = filename,
+            package  = None,
+            is_top   = True,
+            is_main  = not Options.shallMakeModule()
+        )
 
-    # Second, do it for the directories given.
-    for plugin_filename in Options.getShallFollowExtra():
-        Recursion.checkPluginPath(
-            plugin_filename = plugin_filename,
-            module_package  = None
+        # Second, do it for the directories given.
+        for plugin_filename in Options.getShallFollowExtra():
+            Recursion.checkPluginPath(
+                plugin_filename = plugin_filename,
+                module_package  = None
+            )
+
+    # Then optimize the tree and potentially recursed modules, this also
+    # builds the trees of the recursed modules.
+    with Timing.timedPhase( "optimization" ):
+        Optimization.optimizeWhole(
+            main_module = result
         )
 
-    # Then optimize the tree and potentially recursed modules.
-    Optimization.optimizeWhole(
-        main_module = result
-    )
+        # Only now all modules are known, and slots inferred for classes can
+        # be checked for conflicts with their uses.
+        ReformulationClasses.removeConflictingSlots()
 
     return result
 
@@ -119,20 +131,34 @@ def getResultPath( main_module ):
         )
     )
 
-def _cleanSourceDirectory( source_dir ):
-    if Utils.isDir( source_dir ):
-        for path, _filename in Utils.listDir( source_dir ):
-            if Utils.getExtension( path ) in ( ".cpp", ".hpp", ".o", ".os" ):
-                Utils.deleteFile( path, True )
-    else:
+def _prepareSourceDirectory( source_dir ):
+    if not Utils.isDir( source_dir ):
         Utils.makePath( source_dir )
 
-    static_source_dir = Utils.joinpath( source_dir, "static" )
+    # Files written during this run.
+    _written_filenames.clear()
+
+def _cleanSourceDirectory( source_dir ):
+    """ Remove what a previous run generated, but this one did not.
+
+        Generated files and their object files are kept between runs, so that
+        Scons only needs to compile modules that changed. Left over source
+        files would be compiled and linked too though, so they can only do
+        harm.
+    """
+
+    for path, _filename in Utils.listDir( source_dir ):
+        extension = Utils.getExtension( path )
+
+        if extension in ( ".cpp", ".hpp" ):
+            source_path = path
+        elif extension in ( ".o", ".os" ):
+            source_path = path[ : -len( extension ) ] + ".cpp"
+        else:
+            continue
 
-    if Utils.isDir( static_source_dir ):
-        for path, _filename in sorted( Utils.listDir( static_source_dir ) ):
-            if Utils.getExtension( path ) in ( ".o", ".os" ):
-                Utils.deleteFile( path, True )
+        if source_path not in _written_filenames:
+            Utils.deleteFile( path, True )
 
 def _pickSourceFilenames( source_dir, modules ):
     collision_filenames = set()
@@ -175,17 +201,224 @@ def _pickSourceFilenames( source_dir, modules ):
         cpp_filename = base_filename + ".cpp"
         hpp_filename = base_filename + ".hpp"
 
-        module_filenames[ module ] = ( cpp_filename, hpp_filename )
+        # The constants used by the module only.
+        constants_filename = Utils.joinpath(
+            source_dir,
+            "__constants." + Utils.basename( base_filename ) + ".hpp"
+        )
+
+        module_filenames[ module ] = (
+            cpp_filename,
+            hpp_filename,
+            constants_filename
+        )
 
     return module_filenames
 
+def _functionOrder( function_body ):
+    return (
+        function_body.getSourceReference().getLineNumber(),
+        function_body.getFunctionName()
+    )
+
+def _generateModuleCode( global_context, module, main_module, other_modules,
+                         constants_filename ):
+    source_code, header_code, module_context = \
+      CodeGeneration.generateModuleCode(
+        global_context   = global_context,
+        module           = module,
+        module_name      = module.getFullName(),
+        other_modules    = other_modules if module.isMainModule() else (),
+        constants_header = Utils.basename( constants_filename )
+    )
+
+    # The main of an executable module gets a bit different code.
+    if module is main_module and not Options.shallMakeModule():
+        source_code = CodeGeneration.generateMainCode(
+            context = module_context,
+            module  = module,
+            codes   = source_code
+        )
+
+    constants_code = CodeGeneration.generateModuleConstantsDeclarationCode(
+        context = module_context
+    )
+
+    return source_code, header_code, constants_code
+
+# Objects that "pickle" cannot transfer, but that may be part of constants,
+# these are given to the other process by index into this tuple.
+_unpicklable_constants = ( Ellipsis, NotImplemented ) + \
+  tuple( builtin_anon_names.values() )
+
+class _RequestsPickler( pickle.Pickler ):
+    def persistent_id( self, obj ):
+        for count, constant in enumerate( _unpicklable_constants ):
+            if obj is constant:
+                return str( count )
+
+        return None
+
+class _RequestsUnpickler( pickle.Unpickler ):
+    def persistent_load( self, pid ):
+        return _unpicklable_constants[ int( pid ) ]
+
+# The code generation task of the worker processes, inherited from the parent
+# process when forking them, as node trees cannot be pickled.
+_generation_task = None
+
+def _generateModuleCodeWorker( index ):
+    global_context, modules, main_module, other_modules, module_filenames = \
+      _generation_task
+
+    previous_requests = CodeGeneration.getGlobalRequests( global_context )
+
+    start_times = Timing.getTimes()
+
+    module = modules[ index ]
+
+    source_code, header_code, constants_code = _generateModuleCode(
+        global_context     = global_context,
+        module             = module,
+        main_module        = main_module,
+        other_modules      = other_modules,
+        constants_filename = module_filenames[ module ][2]
+    )
+
+    times = Timing.getTimesSince( start_times )
+
+    requests_file = BytesIO()
+
+    _RequestsPickler( requests_file, pickle.HIGHEST_PROTOCOL ).dump(
+        CodeGeneration.getNewGlobalRequests(
+            global_context = global_context,
+            previous       = previous_requests
+        )
+    )
+
+    return source_code, header_code, constants_code, \
+           requests_file.getvalue(), times
+
+def _generateModulesCode( global_context, modules, main_module, other_modules,
+                          module_filenames ):
+    """ Generate the code of modules, in parallel processes if allowed.
+
+        Modules only share the global context and the helper code, so each
+        process reports what it added to these, and that is merged here. The
+        result is the same as with generating code in this process.
+    """
+
+    # Many things get updated there, pylint: disable=W0603
+    global _generation_task
+
+    job_limit = min( Options.getJobLimit(), len( modules ) )
+
+    # Without "fork", the node trees would have to be given to the processes,
+    # but that is not possible.
+    if job_limit <= 1 or not hasattr( os, "fork" ):
+        module_codes = []
+
+        for module in modules:
+            start_times = Timing.getTimes()
+
+            module_codes.append(
+                _generateModuleCode(
+                    global_context     = global_context,
+                    module             = module,
+                    main_module        = main_module,
+                    other_modules      = other_modules,
+                    constants_filename = module_filenames[ module ][2]
+                )
+            )
+
+            Timing.addModuleTimes(
+                module_name = module.getFullName(),
+                step        = "code_generation",
+                times       = Timing.getTimesSince( start_times )
+            )
+
+        return module_codes
+
+    import multiprocessing
+
+    if hasattr( multiprocessing, "get_context" ):
+        multiprocessing = multiprocessing.get_context( "fork" )
+
+    _generation_task = global_context, modules, main_module, other_modules, \
+                       module_filenames
+
+    pool = multiprocessing.Pool( job_limit )
+
+    try:
+        results = pool.map(
+            _generateModuleCodeWorker,
+            range( len( modules ) ),
+            chunksize = 1
+        )
+    finally:
+        pool.terminate()
+        pool.join()
+
+        _generation_task = None
+
+    module_codes = []
+
+    for module, ( source_code, header_code, constants_code, requests, times ) in \
+        zip( modules, results ):
+        CodeGeneration.mergeGlobalRequests(
+            global_context = global_context,
+            requests       = _RequestsUnpickler( BytesIO( requests ) ).load()
+        )
+
+        Timing.addModuleTimes(
+            module_name = module.getFullName(),
+            step        = "code_generation",
+            times       = times
+        )
+
+        module_codes.append( ( source_code, header_code, constants_code ) )
+
+    return module_codes
+
+def _writeUnitySources( source_dir, module_sizes ):
+    """ Write files that include several modules each, to be compiled instead.
+
+        There are as many of these as jobs are allowed, and the modules are
+        distributed by their size, so they take about the same time to compile.
+    """
+
+    unity_count = min( Options.getJobLimit(), len( module_sizes ) )
+
+    unity_files = [ [] for _count in range( unity_count ) ]
+    unity_sizes = [ 0 ] * unity_count
+
+    # Largest first, each to the smallest unity file so far.
+    for cpp_filename in sorted(
+            module_sizes,
+            key = lambda cpp_filename : ( -module_sizes[ cpp_filename ],
+                                          cpp_filename )
+        ):
+        index = unity_sizes.index( min( unity_sizes ) )
+
+        unity_files[ index ].append( cpp_filename )
+        unity_sizes[ index ] += module_sizes[ cpp_filename ]
+
+    for count, cpp_filenames in enumerate( unity_files ):
+        writeSourceCode(
+            filename    = Utils.joinpath( source_dir, "__unity_%d.cpp" % count ),
+            source_code = "".join(
+                '#include "%s"\n' % Utils.basename( cpp_filename )
+                for cpp_filename in
+                sorted( cpp_filenames )
+            )
+        )
+
 def makeSourceDirectory( main_module ):
     assert main_module.isPythonModule()
 
     source_dir = getSourceDirectoryPath( main_module )
 
-    # First remove old object files and old generated files, they can only do harm.
-    _cleanSourceDirectory( source_dir )
+    _prepareSourceDirectory( source_dir )
 
     # The global context used to generate code.
     global_context = CodeGeneration.makeGlobalContext()
@@ -207,8 +440,9 @@ def makeSourceDirectory( main_module ):
     )
 
     # Prepare code generation, i.e. execute finalization for it.
-    for module in sorted( modules, key = lambda x : x.getFullName() ):
-        Finalization.prepareCodeGeneration( module )
+    with Timing.timedPhase( "finalization" ):
+        for module in sorted( modules, key = lambda x : x.getFullName() ):
+            Finalization.prepareCodeGeneration( module )
 
     # Pick filenames.
     module_filenames = _pickSourceFilenames(
@@ -218,24 +452,37 @@ def makeSourceDirectory( main_module ):
 
     module_hpps = []
 
-    for module in sorted( modules, key = lambda x : x.getFullName() ):
-        cpp_filename, hpp_filename = module_filenames[ module ]
-
-        source_code, header_code, module_context = \
-          CodeGeneration.generateModuleCode(
-            global_context = global_context,
-            module         = module,
-            module_name    = module.getFullName(),
-            other_modules  = other_modules if module.isMainModule() else ()
+    modules = sorted( modules, key = lambda x : x.getFullName() )
+
+    # Code names of functions are assigned when first used, which may be from
+    # another module, make sure the order of code generation doesn't matter.
+    for module in modules:
+        for function_body in sorted( module.getFunctions(), key = _functionOrder ):
+            function_body.getCodeName()
+
+    with Timing.timedPhase( "code_generation" ):
+        module_codes = _generateModulesCode(
+            global_context   = global_context,
+            modules          = modules,
+            main_module      = main_module,
+            other_modules    = other_modules,
+            module_filenames = module_filenames
         )
 
-        # The main of an executable module gets a bit different code.
-        if module is main_module and not Options.shallMakeModule():
-            source_code = CodeGeneration.generateMainCode(
-                context = module_context,
-                module  = module,
-                codes   = source_code
-            )
+    module_sizes = {}
+
+    for module, ( source_code, header_code, constants_code ) in \
+        zip( modules, module_codes ):
+        cpp_filename, hpp_filename, constants_filename = \
+          module_filenames[ module ]
+
+        module_sizes[ cpp_filename ] = len( source_code )
+
+        Timing.addModuleValue(
+            module.getFullName(),
+            "generated_size",
+            len( source_code ) + len( header_code )
+        )
 
         module_hpps.append( hpp_filename )
 
@@ -249,12 +496,10 @@ def makeSourceDirectory( main_module ):
             source_code  = header_code
         )
 
-    writeSourceCode(
-        filename    = Utils.joinpath( source_dir, "__constants.hpp" ),
-        source_code = CodeGeneration.generateConstantsDeclarationCode(
-            context = global_context
+        writeSourceCode(
+            filename     = constants_filename,
+            source_code  = constants_code
         )
-    )
 
     writeSourceCode(
         filename    = Utils.joinpath( source_dir, "__constants.cpp" ),
@@ -286,6 +531,12 @@ def makeSourceDirectory( main_module ):
         source_code = "".join( module_hpp_include )
     )
 
+    if Options.isUnityBuild():
+        _writeUnitySources( source_dir, module_sizes )
+
+    # Remove old object files and old generated files not written this time.
+    _cleanSourceDirectory( source_dir )
+
 def runScons( main_module, quiet ):
     python_version = "%d.%d" % ( sys.version_info[0], sys.version_info[1] )
 
@@ -305,18 +556,19 @@ def runScons( main_module, quiet ):
         return "true" if value else "false"
 
     options = {
-        "name"           : Utils.basename( getTreeFilenameWithSuffix( main_module, "" ) ),
-        "result_file"    : getResultPath( main_module ),
-        "source_dir"     : getSourceDirectoryPath( main_module ),
-        "debug_mode"     : asBoolStr( Options.isDebug() ),
-        "unstriped_mode" : asBoolStr( Options.isUnstriped() ),
-        "module_mode"    : asBoolStr( Options.shallMakeModule() ),
-        "optimize_mode"  : asBoolStr( Options.isOptimize() ),
-        "full_compat"    : asBoolStr( Options.isFullCompat() ),
-        "experimental"   : asBoolStr( Options.isExperimental() ),
-        "python_version" : python_version,
-        "lto_mode"       : asBoolStr( Options.isLto() ),
-        "clang_mode"     : asBoolStr( Options.isClang() )
+        "name"            : Utils.basename( getTreeFilenameWithSuffix( main_module, "" ) ),
+        "result_file"     : getResultPath( main_module ),
+        "source_dir"      : getSourceDirectoryPath( main_module ),
+        "debug_mode"      : asBoolStr( Options.isDebug() ),
+        "unstriped_mode"  : asBoolStr( Options.isUnstriped() ),
+        "module_mode"     : asBoolStr( Options.shallMakeModule() ),
+        "optimize_mode"   : asBoolStr( Options.isOptimize() ),
+        "full_compat"     : asBoolStr( Options.isFullCompat() ),
+        "experimental"    : asBoolStr( Options.isExperimental() ),
+        "python_version"  : python_version,
+        "lto_mode"        : asBoolStr( Options.isLto() ),
+        "clang_mode"      : asBoolStr( Options.isClang() ),
+        "switch_interval" : str( Options.getSwitchInterval() )
     }
 
     if Options.isWindowsTarget():
@@ -328,19 +580,44 @@ def runScons( main_module, quiet ):
     if Options.isPortableMode():
         options[ "portable_mode" ] = "true"
 
+    if Options.isPrecompiledHeader():
+        options[ "pch_mode" ] = "true"
+
+    if Options.isUnityBuild():
+        options[ "unity_mode" ] = "true"
+
+    if Options.isCompileCache():
+        options[ "cache_dir" ] = Options.getCompileCacheDir()
+        options[ "cache_size" ] = str( Options.getCompileCacheSize() )
+
     return SconsInterface.runScons( options, quiet ), options
 
+# Filenames written to the source directory, to detect collisions and left
+# overs from previous runs.
+_written_filenames = set()
+
 def writeSourceCode( filename, source_code ):
     # Prevent accidental overwriting. When this happens the collision detection or
     # something else has failed.
-    assert not Utils.isFile( filename ), filename
+    assert filename not in _written_filenames, filename
+
+    _written_filenames.add( filename )
 
     if Utils.python_version >= 300:
-        with open( filename, "wb" ) as output_file:
-            output_file.write( source_code.encode( "latin1" ) )
+        source_code = source_code.encode( "latin1" )
+        mode = "b"
     else:
-        with open( filename, "w" ) as output_file:
-            output_file.write( source_code )
+        mode = ""
+
+    # Unchanged files are not written again, so their time stamp is kept, and
+    # Scons will not even look at them and their object files.
+    if Utils.isFile( filename ):
+        with open( filename, "r" + mode ) as input_file:
+            if input_file.read() == source_code:
+                return
+
+    with open( filename, "w" + mode ) as output_file:
+        output_file.write( source_code )
 
 
 def callExec( args, clean_path, add_path ):
@@ -412,9 +689,10 @@ def executeModule( tree, clean_path ):
 def compileTree( main_module ):
     if not Options.shallOnlyExecGcc():
         # Now build the target language code for the whole tree.
-        makeSourceDirectory(
-            main_module = main_module
-        )
+        with Timing.timedPhase( "source_directory" ):
+            makeSourceDirectory(
+                main_module = main_module
+            )
     else:
         source_dir = getSourceDirectoryPath( main_module )
 
@@ -423,9 +701,10 @@ def compileTree( main_module ):
 
 
     # Run the Scons to build things.
-    result, options = runScons(
-        main_module  = main_module,
-        quiet        = not Options.isShowScons()
-    )
+    with Timing.timedPhase( "scons" ):
+        result, options = runScons(
+            main_module  = main_module,
+            quiet        = not Options.isShowScons()
+        )
 
     return result, options
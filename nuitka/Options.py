@@ -25,7 +25,7 @@ from . import Utils
 
 from optparse import OptionParser, OptionGroup
 
-import sys, logging
+import os, sys, logging
 
 # Indicator if we were called as "nuitka-python" in which case we assume some
 # other defaults and work a bit different with parameters.
@@ -224,6 +224,23 @@ codegen_group.add_option(
     help    = """Disable all unnecessary optimizations on Python level. Defaults to off."""
 )
 
+codegen_group.add_option(
+    "--infer-slots",
+    action  = "store_true",
+    dest    = "infer_slots",
+    default = False,
+    help    = """\
+Give classes that derive from "object" only, and assign instance attributes only
+as "self.name" in their methods, these names as "__slots__". Their instances
+then only get a dictionary if other attributes are set, which saves a lot of
+memory. Classes used as one of several bases anywhere in the program are left
+alone, as are all classes if "__class__" is assigned anywhere. Such classes must
+not be combined with other bases outside of the program, and the "__dict__" and
+"vars()" of their instances don't contain these attributes. For pickling, they
+get "__getstate__" and "__setstate__" methods that give the same state as
+without slots. Defaults to off."""
+)
+
 parser.add_option_group( codegen_group )
 
 outputdir_group = OptionGroup(
@@ -350,6 +367,60 @@ Enforce the use of clang (clang 3.0 or higher).
 Defaults to off."""
 )
 
+parser.add_option(
+    "--pch",
+    action  = "store_true",
+    dest    = "pch",
+    default = False,
+    help    = """\
+Compile the common prelude of all C++ files once as a precompiled header, and
+use it for all files (g++ only). Defaults to off."""
+)
+
+parser.add_option(
+    "--unity-build",
+    action  = "store_true",
+    dest    = "unity_build",
+    default = False,
+    help    = """\
+Compile the modules combined into as many C++ files as jobs are allowed,
+instead of each one on its own. Defaults to off."""
+)
+
+parser.add_option(
+    "--compile-cache",
+    action  = "store_true",
+    dest    = "compile_cache",
+    default = False,
+    help    = """\
+Keep object files of compiled C++ files in a cache directory, and re-use them,
+also for other programs, when the preprocessed source, the compiler and its
+options are the same. The first build with it takes longer, because every file
+is also preprocessed to identify it. Defaults to off."""
+)
+
+parser.add_option(
+    "--compile-cache-dir",
+    action  = "store",
+    dest    = "compile_cache_dir",
+    metavar = "DIRECTORY",
+    default = None,
+    help    = """\
+Directory of the compile cache. Defaults to a "Nuitka" directory in the user
+cache directory."""
+)
+
+parser.add_option(
+    "--compile-cache-size",
+    action  = "store",
+    dest    = "compile_cache_size",
+    metavar = "MEGABYTES",
+    default = "1024",
+    help    = """\
+Size limit of the compile cache, least recently used files are removed when it
+is exceeded. Defaults to %default."""
+)
+
 tracing_group = OptionGroup(
     parser,
     "Tracing features"
@@ -372,6 +443,29 @@ tracing_group.add_option(
     help    = """Provide progress information and statistics. Defaults to off."""
 )
 
+tracing_group.add_option(
+    "--report-timing",
+    action  = "store",
+    dest    = "report_timing",
+    metavar = "FILENAME",
+    default = None,
+    help    = """\
+Write the time taken and the peak memory usage for each phase of the
+compilation and for each module, with optimization and code generation
+statistics, as JSON to the given file. Defaults to off."""
+)
+
+tracing_group.add_option(
+    "--profile-compiler",
+    action  = "store",
+    dest    = "profile_compiler",
+    metavar = "DIRECTORY",
+    default = None,
+    help    = """\
+Profile each phase of the compilation, and write "cProfile" data to a file
+for each of them in the given directory. Defaults to off."""
+)
+
 tracing_group.add_option(
     "--verbose",
     action  = "store_true",
@@ -391,8 +485,19 @@ parser.add_option(
     metavar = "N",
     default = Utils.getCoreCount(),
     help    = """\
-Specify the allowed number of parallel C++ compiler jobs. Defaults to the system
-CPU count.""",
+Specify the allowed number of parallel C++ code generation and compiler jobs.
+Defaults to the system CPU count.""",
+)
+
+parser.add_option(
+    "--switch-interval",
+    action  = "store",
+    dest    = "switch_interval",
+    metavar = "MICROSECONDS",
+    default = 5000,
+    help    = """\
+Time a thread may keep running, while other threads exist, before it releases
+the GIL for them. Defaults to 5000 micro seconds, same as CPython3.""",
 )
 
 parser.add_option(
@@ -447,6 +552,12 @@ if not positional_args:
 
     sys.exit( "\nError, need positional argument with python module or main program." )
 
+if not options.compile_cache_size.isdigit():
+    sys.exit(
+        "Error, compile cache size must be a number of mega bytes, not '%s'." %
+          options.compile_cache_size
+    )
+
 if options.verbose:
     logging.getLogger().setLevel( logging.DEBUG )
 
@@ -501,6 +612,9 @@ def isDebug():
 def isOptimize():
     return not options.no_optimize
 
+def shallInferSlots():
+    return options.infer_slots
+
 def isUnstriped():
     return options.unstriped
 
@@ -531,12 +645,44 @@ def isShowScons():
 def getJobLimit():
     return int( options.jobs )
 
+def getSwitchInterval():
+    return int( options.switch_interval )
+
 def isLto():
     return options.lto
 
 def isClang():
     return options.clang
 
+def isPrecompiledHeader():
+    return options.pch
+
+def isUnityBuild():
+    return options.unity_build
+
+def getCompileCacheDir():
+    if options.compile_cache_dir is not None:
+        return options.compile_cache_dir
+
+    if os.name == "nt":
+        cache_base = os.environ.get(
+            "LOCALAPPDATA",
+            os.path.expanduser( "~" )
+        )
+    else:
+        cache_base = os.environ.get(
+            "XDG_CACHE_HOME",
+            os.path.expanduser( os.path.join( "~", ".cache" ) )
+        )
+
+    return os.path.join( cache_base, "Nuitka" )
+
+def isCompileCache():
+    return options.compile_cache and getCompileCacheSize() > 0
+
+def getCompileCacheSize():
+    return int( options.compile_cache_size )
+
 def isWindowsTarget():
     return options.windows_target
 
@@ -549,6 +695,12 @@ def isFullCompat():
 def isShowProgress():
     return options.show_progress
 
+def getTimingReportFilename():
+    return options.report_timing
+
+def getCompilerProfileDir():
+    return options.profile_compiler
+
 def isRemoveBuildDir():
     return options.remove_build
 
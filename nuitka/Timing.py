@@ -0,0 +1,167 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Timing of the compilation, to find out where the time goes.
+
+With "--report-timing" the phases of the compilation record their time taken
+and the peak memory usage, and modules record their statistics, all of which
+is written to a JSON file at the end. With "--profile-compiler" the phases
+are also profiled, each to a file of its own.
+
+"""
+
+from . import Options, Utils
+
+from contextlib import contextmanager
+
+import os, sys, time
+
+_report_filename = Options.getTimingReportFilename()
+_profile_dir = Options.getCompilerProfileDir()
+
+_phases = []
+_modules = {}
+
+# The phases currently running, innermost last, with their profile if any.
+# Phases are nested, e.g. code generation is part of making the source
+# directory, the report gives their parent, and only the innermost one is
+# profiled, so the profile of a phase doesn't include its nested phases.
+_active_phases = []
+
+def getTimes():
+    """ Get the wall clock time, and the CPU time of Nuitka and its children.
+
+    """
+    times = os.times()
+
+    return time.time(), times[0] + times[1], times[2] + times[3]
+
+def getTimesSince( start ):
+    return tuple(
+        now - before
+        for now, before in
+        zip( getTimes(), start )
+    )
+
+def _getPeakMemory():
+    """ Get the peak memory usage of Nuitka and its children in KB.
+
+    """
+    try:
+        import resource
+    except ImportError:
+        return None, None
+
+    factor = 1024 if sys.platform == "darwin" else 1
+
+    return (
+        resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss // factor,
+        resource.getrusage( resource.RUSAGE_CHILDREN ).ru_maxrss // factor
+    )
+
+@contextmanager
+def timedPhase( name ):
+    """ Record time and memory usage of a phase, and profile it if asked to.
+
+        The times of a phase include the ones of phases nested in it.
+    """
+
+    phase_report = {
+        "name"   : name,
+        "parent" : _active_phases[-1][0][ "name" ] if _active_phases else None
+    }
+
+    # In order of their start, so parents come first.
+    _phases.append( phase_report )
+
+    profile = None
+
+    if _profile_dir is not None:
+        import cProfile
+
+        # Pause the profile of the parent phase while this one runs.
+        if _active_phases:
+            _active_phases[-1][1].disable()
+
+        profile = cProfile.Profile()
+
+    _active_phases.append( ( phase_report, profile ) )
+
+    if profile is not None:
+        profile.enable()
+
+    start = getTimes()
+
+    try:
+        yield
+    finally:
+        wall_time, cpu_time, children_cpu_time = getTimesSince( start )
+
+        _active_phases.pop()
+
+        if profile is not None:
+            profile.disable()
+
+            if not Utils.isDir( _profile_dir ):
+                Utils.makePath( _profile_dir )
+
+            profile.dump_stats(
+                Utils.joinpath( _profile_dir, "%s.prof" % name )
+            )
+
+            if _active_phases:
+                _active_phases[-1][1].enable()
+
+        peak_memory, children_peak_memory = _getPeakMemory()
+
+        phase_report.update(
+            {
+                "wall_time"               : wall_time,
+                "cpu_time"                : cpu_time,
+                "children_cpu_time"       : children_cpu_time,
+                "peak_memory_kb"          : peak_memory,
+                "children_peak_memory_kb" : children_peak_memory
+            }
+        )
+
+def addModuleTimes( module_name, step, times ):
+    if _report_filename is not None:
+        module_report = _modules.setdefault( module_name, {} )
+
+        module_report[ step + "_wall_time" ] = times[0]
+        module_report[ step + "_cpu_time" ] = times[1]
+
+def addModuleValue( module_name, key, value ):
+    if _report_filename is not None:
+        _modules.setdefault( module_name, {} )[ key ] = value
+
+def writeReport():
+    if _report_filename is None:
+        return
+
+    import json
+
+    with open( _report_filename, "w" ) as output_file:
+        json.dump(
+            {
+                "phases"  : _phases,
+                "modules" : _modules
+            },
+            output_file,
+            indent    = 2,
+            sort_keys = True
+        )
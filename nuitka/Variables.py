@@ -41,6 +41,12 @@ class Variable:
 
         self.version_number = 0
 
+        # Type shapes of the values and of their iteration values, decided by
+        # constraint collection, if all assignments agree. These are hints for
+        # code generation, "None" indicates unknown.
+        self.type_shape = None
+        self.iteration_type_shape = None
+
     def getName( self ):
         return self.variable_name
 
@@ -79,6 +85,18 @@ class Variable:
     def setHasDelIndicator( self ):
         self.has_del = True
 
+    def getTypeShape( self ):
+        return self.type_shape
+
+    def setTypeShape( self, type_shape ):
+        self.type_shape = type_shape
+
+    def getIterationTypeShape( self ):
+        return self.iteration_type_shape
+
+    def setIterationTypeShape( self, type_shape ):
+        self.iteration_type_shape = type_shape
+
     def allocateTargetNumber( self ):
         self.version_number += 1
 
@@ -464,12 +482,32 @@ class ModuleVariable( Variable ):
 
         self.module = module
 
+        # Count of assignments, and the function body, if the one assignment
+        # is from a "def" of the module.
+        self.assignment_count = 0
+        self.assigned_function = None
+
     def __repr__( self ):
         return "<ModuleVariable '%s' of '%s'>" % (
             self.variable_name,
             self.getModuleName()
         )
 
+    def addAssignment( self, function_body ):
+        self.assignment_count += 1
+        self.assigned_function = function_body
+
+    def getDefinedFunction( self ):
+        """ The function body, if the variable is only assigned by its "def".
+
+            At run time, the module dictionary may still be changed, so the
+            value must be checked before relying on it.
+        """
+        if self.assignment_count == 1 and not self.has_del:
+            return self.assigned_function
+        else:
+            return None
+
     def isModuleVariable( self ):
         return True
 
@@ -531,6 +569,10 @@ class TempVariable( Variable ):
 
         self.needs_free = None
 
+        # For stackless generators, temporary variables that live across a
+        # "yield" are stored in the generator context, under a unique number.
+        self.context_number = None
+
     def __repr__( self ):
         return "<TempVariable '%s' of '%s'>" % (
             self.getName(),
@@ -557,16 +599,36 @@ class TempVariable( Variable ):
 
         self.declared = True
 
+    def markAsInContext( self, context_number ):
+        # Declared as part of the context, not at the first assignment.
+        self.markAsDeclared()
+
+        self.context_number = context_number
+
+    def isInContext( self ):
+        return self.context_number is not None
+
+    def getContextName( self ):
+        assert self.context_number is not None, self
+
+        return "%s_%d" % ( self.getName(), self.context_number )
+
     def getDeclarationTypeCode( self, in_context ):
         assert self.needs_free is not None, self
 
         if self.needs_free:
-            return "PyObjectTemporary"
+            if in_context:
+                return "PyObjectContextTemporary"
+            else:
+                return "PyObjectTemporary"
         else:
             return "PyObject *"
 
     def getCodeName( self ):
-        return "python_tmp_%s" % self.getName()
+        if self.context_number is None:
+            return "python_tmp_%s" % self.getName()
+        else:
+            return "python_tmp_%s" % self.getContextName()
 
     def getDeclarationInitValueCode( self ):
         # Virtual method, pylint: disable=R0201
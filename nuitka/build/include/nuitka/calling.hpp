@@ -78,6 +78,17 @@ extern PyObject *CALL_FUNCTION_WITH_ARGS( PyObject *called, PyObject *arg1, PyOb
 extern PyObject *CALL_FUNCTION_WITH_ARGS( PyObject *called, PyObject *arg1, PyObject *arg2, PyObject *arg3, PyObject *arg4 );
 extern PyObject *CALL_FUNCTION_WITH_ARGS( PyObject *called, PyObject *arg1, PyObject *arg2, PyObject *arg3, PyObject *arg4, PyObject *arg5 );
 
+// Method call variants, for an attribute looked up before the arguments were
+// made, see "PyObjectMethodKeeper".
+class PyObjectMethodKeeper;
+
+extern PyObject *CALL_METHOD_NO_ARGS( PyObjectMethodKeeper &method );
+extern PyObject *CALL_METHOD_WITH_ARGS( PyObjectMethodKeeper &method, PyObject *arg1 );
+extern PyObject *CALL_METHOD_WITH_ARGS( PyObjectMethodKeeper &method, PyObject *arg1, PyObject *arg2 );
+extern PyObject *CALL_METHOD_WITH_ARGS( PyObjectMethodKeeper &method, PyObject *arg1, PyObject *arg2, PyObject *arg3 );
+extern PyObject *CALL_METHOD_WITH_ARGS( PyObjectMethodKeeper &method, PyObject *arg1, PyObject *arg2, PyObject *arg3, PyObject *arg4 );
+extern PyObject *CALL_METHOD_WITH_ARGS( PyObjectMethodKeeper &method, PyObject *arg1, PyObject *arg2, PyObject *arg3, PyObject *arg4, PyObject *arg5 );
+
 NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_POSARGS( PyObject *function_object, PyObject *positional_args )
 {
     return CALL_FUNCTION(
@@ -21,6 +21,24 @@
 // Create a frame object for the given code object and module
 extern PyFrameObject *MAKE_FRAME( PyCodeObject *code, PyObject *module );
 
+// Number of released frames kept around for re-use.
+#ifndef NUITKA_FRAME_FREE_LIST_SIZE
+#define NUITKA_FRAME_FREE_LIST_SIZE 200
+#endif
+
+// Counters for the frames newly allocated, taken from the free list, and the
+// times a function could not use its cached frame, because it was still in
+// use, e.g. due to recursion or a traceback referencing it.
+typedef struct
+{
+    long allocated;
+    long reused;
+    long missed;
+    long pooled;
+} FrameStatistics;
+
+extern FrameStatistics frame_statistics;
+
 // Create a code object for the given filename and function name
 #if PYTHON_VERSION < 300
 extern PyCodeObject *MAKE_CODEOBJ( PyObject *filename, PyObject *function_name, int line, PyObject *argnames, int arg_count, int flags );
@@ -74,6 +74,10 @@ struct Nuitka_FunctionObject {
 #endif
 
     long m_counter;
+
+    // Size of the storage for an inline context after the object, which is
+    // kept when the object is put into the free list for re-use.
+    size_t m_context_capacity;
 };
 
 extern PyTypeObject Nuitka_Function_Type;
@@ -97,6 +101,17 @@ extern PyObject *Nuitka_Function_New( function_arg_parser code, direct_arg_parse
 extern PyObject *Nuitka_Function_New( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, releaser cleanup );
 #endif
 
+// Make a function with a context of the given size stored inline after the
+// function object, the storage is available as "m_context" and must be
+// initialized by the caller. The cleanup must destroy it, but not release it.
+#if PYTHON_VERSION < 300
+extern PyObject *Nuitka_Function_New( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *module, PyObject *doc, size_t context_size, releaser cleanup );
+#elif PYTHON_VERSION < 330
+extern PyObject *Nuitka_Function_New( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, size_t context_size, releaser cleanup );
+#else
+extern PyObject *Nuitka_Function_New( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, size_t context_size, releaser cleanup );
+#endif
+
 static inline bool Nuitka_Function_Check( PyObject *object )
 {
     return Py_TYPE( object ) == &Nuitka_Function_Type;
@@ -69,14 +69,24 @@ typedef struct {
     // Was it ever used, is it still running, or already finished.
     Generator_Status m_status;
 
+    // Stackless generators do not run on a fiber, but return from their code
+    // on each yield, and continue at the recorded resume point on next entry.
+    bool m_stackless;
+    int m_resume_point;
+
 } Nuitka_GeneratorObject;
 
 extern PyTypeObject Nuitka_Generator_Type;
 
 typedef void (*yielder_func)( Nuitka_GeneratorObject * );
 
+// Returns the yielded value, or NULL with an exception set, when finished.
+typedef PyObject *(*resumable_func)( Nuitka_GeneratorObject * );
+
 extern PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup );
 extern PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject *code_object );
+extern PyObject *Nuitka_Generator_New( resumable_func code, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup );
+extern PyObject *Nuitka_Generator_New( resumable_func code, PyObject *name, PyCodeObject *code_object );
 
 static inline bool Nuitka_Generator_Check( PyObject *object )
 {
@@ -38,8 +38,39 @@ extern "C" void initFiber( Fiber *to );
 
 extern "C" void swapFiber( Fiber *to, Fiber *from );
 
-extern "C" void prepareFiber( Fiber *to, void *code, unsigned long arg );
+extern "C" bool prepareFiber( Fiber *to, void *code, unsigned long arg );
 
 extern "C" void releaseFiber( Fiber *to );
 
+#if !defined( _WIN32 )
+
+// Size of the stack given to each generator, the address space is reserved,
+// but memory is only used for the pages that get touched. Can be overridden
+// with a define at compile time.
+#ifndef NUITKA_FIBER_STACK_SIZE
+#define NUITKA_FIBER_STACK_SIZE (1024*1024)
+#endif
+
+// Number of released stacks kept around for re-use.
+#ifndef NUITKA_FIBER_STACK_POOL_SIZE
+#define NUITKA_FIBER_STACK_POOL_SIZE 64
+#endif
+
+// Counters for the stacks in use, in the pool, and the highest number of
+// stacks in use at the same time.
+typedef struct
+{
+    long live;
+    long pooled;
+    long peak_live;
+    long allocated;
+} FiberStackStatistics;
+
+extern FiberStackStatistics fiber_stack_statistics;
+
+extern void *allocateFiberStack();
+extern void releaseFiberStack( void *stack );
+
+#endif
+
 #endif
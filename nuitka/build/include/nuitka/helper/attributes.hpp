@@ -0,0 +1,260 @@
+//     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_ATTRIBUTES_H__
+#define __NUITKA_HELPER_ATTRIBUTES_H__
+
+// Cache of an attribute lookup, for objects using the generic attribute lookup
+// of "object". What the type gave for the name stays valid while the type has
+// the same version tag, as changes of the type or its bases clear the tag. For
+// the instance dictionary, the slot the value was last found in is tried first,
+// which instances of the same class tend to share.
+typedef struct {
+    PyTypeObject *type;
+    unsigned int version_tag;
+
+    // Borrowed, the type or its bases hold the reference while unchanged.
+    PyObject *descr;
+
+#if PYTHON_VERSION < 330
+    Py_ssize_t dict_index;
+#endif
+} Nuitka_AttributeCache;
+
+// Look up in the instance dictionary, and remember the slot if possible.
+extern PyObject *LOOKUP_INSTANCE_DICT_CACHE_FILL( PyDictObject *dict, PyObject *attr_name, Nuitka_AttributeCache *cache );
+
+static inline PyObject *LOOKUP_INSTANCE_DICT_CACHED( PyDictObject *dict, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+#if PYTHON_VERSION < 330
+    Py_ssize_t index = cache->dict_index;
+
+    if ( index <= dict->ma_mask && dict->ma_table[ index ].me_key == attr_name )
+    {
+        return dict->ma_table[ index ].me_value;
+    }
+#endif
+
+    return LOOKUP_INSTANCE_DICT_CACHE_FILL( dict, attr_name, cache );
+}
+
+// Look up in the dictionary of the instance, if it has one, borrowed result.
+static inline PyObject *LOOKUP_INSTANCE_DICT_ATTRIBUTE( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+    Py_ssize_t dict_offset = Py_TYPE( source )->tp_dictoffset;
+
+    if ( dict_offset != 0 )
+    {
+        PyObject **dict_pointer;
+
+        if (likely( dict_offset > 0 ))
+        {
+            dict_pointer = (PyObject **)( (char *)source + dict_offset );
+        }
+        else
+        {
+            dict_pointer = _PyObject_GetDictPtr( source );
+        }
+
+        if ( dict_pointer != NULL && *dict_pointer != NULL )
+        {
+            return LOOKUP_INSTANCE_DICT_CACHED( (PyDictObject *)*dict_pointer, attr_name, cache );
+        }
+    }
+
+    return NULL;
+}
+
+// Does what "PyObject_GenericGetAttr" does, but with what the type gave for
+// the name taken from the cache.
+static inline PyObject *LOOKUP_ATTRIBUTE_FROM_CACHE( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+    PyTypeObject *type = Py_TYPE( source );
+
+    PyObject *descr = cache->descr;
+    descrgetfunc func = NULL;
+
+    if ( descr != NULL )
+    {
+        // Slots are read from their offset in the object directly, if set.
+        if ( Py_TYPE( descr ) == &PyMemberDescr_Type )
+        {
+            PyMemberDescrObject *member_descr = (PyMemberDescrObject *)descr;
+            PyMemberDef *member = member_descr->d_member;
+
+            if ( member->type == T_OBJECT_EX && ( member->flags & READ_RESTRICTED ) == 0 && PyObject_TypeCheck( source, member_descr->d_type ) )
+            {
+                PyObject *result = *(PyObject **)( (char *)source + member->offset );
+
+                if ( result != NULL )
+                {
+                    return INCREASE_REFCOUNT( result );
+                }
+            }
+        }
+
+        // The descriptor could be released by what it calls.
+        Py_INCREF( descr );
+
+#if PYTHON_VERSION < 300
+        if ( PyType_HasFeature( Py_TYPE( descr ), Py_TPFLAGS_HAVE_CLASS ) )
+#endif
+        {
+            func = Py_TYPE( descr )->tp_descr_get;
+
+            if ( func != NULL && PyDescr_IsData( descr ) )
+            {
+                PyObject *result = func( descr, source, (PyObject *)type );
+                Py_DECREF( descr );
+
+                if (unlikely( result == NULL ))
+                {
+                    throw PythonException();
+                }
+
+                return result;
+            }
+        }
+    }
+
+    PyObject *result = LOOKUP_INSTANCE_DICT_ATTRIBUTE( source, attr_name, cache );
+
+    if ( result != NULL )
+    {
+        Py_XDECREF( descr );
+
+        return INCREASE_REFCOUNT( result );
+    }
+
+    if ( func != NULL )
+    {
+        PyObject *result = func( descr, source, (PyObject *)type );
+        Py_DECREF( descr );
+
+        if (unlikely( result == NULL ))
+        {
+            throw PythonException();
+        }
+
+        return result;
+    }
+
+    if ( descr != NULL )
+    {
+        return descr;
+    }
+
+    // Let the lookup of the type raise the error.
+    return LOOKUP_ATTRIBUTE( source, attr_name );
+}
+
+static inline bool IS_ATTRIBUTE_CACHE_VALID( PyTypeObject *type, Nuitka_AttributeCache *cache )
+{
+    return cache->type == type && cache->version_tag == type->tp_version_tag && PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) && type->tp_getattro == PyObject_GenericGetAttr;
+}
+
+// Remember what the type gives for the name, if it can be re-used, and tell
+// if the cache can be used.
+extern bool FILL_ATTRIBUTE_CACHE( PyTypeObject *type, PyObject *attr_name, Nuitka_AttributeCache *cache );
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE_CACHED( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+    assertObject( source );
+    assertObject( attr_name );
+
+    PyTypeObject *type = Py_TYPE( source );
+
+    if (likely( IS_ATTRIBUTE_CACHE_VALID( type, cache ) || FILL_ATTRIBUTE_CACHE( type, attr_name, cache ) ))
+    {
+        return LOOKUP_ATTRIBUTE_FROM_CACHE( source, attr_name, cache );
+    }
+    else
+    {
+        return LOOKUP_ATTRIBUTE( source, attr_name );
+    }
+}
+
+// Keeps what an attribute lookup for a call gave. A function found on the
+// type, and not shadowed by the instance, is not bound to the instance, which
+// is kept instead, to be passed as the first argument, see "CALL_METHOD".
+class PyObjectMethodKeeper
+{
+public:
+    explicit PyObjectMethodKeeper()
+    {
+        this->called = NULL;
+        this->self = NULL;
+    }
+
+    ~PyObjectMethodKeeper()
+    {
+        Py_XDECREF( this->called );
+        Py_XDECREF( this->self );
+    }
+
+    inline void lookup( PyObject *source, PyObject *attr_name, Nuitka_AttributeCache *cache )
+    {
+        assertObject( source );
+        assertObject( attr_name );
+
+        PyTypeObject *type = Py_TYPE( source );
+
+        if (likely( IS_ATTRIBUTE_CACHE_VALID( type, cache ) || FILL_ATTRIBUTE_CACHE( type, attr_name, cache ) ))
+        {
+            PyObject *descr = cache->descr;
+
+            // Functions are no data descriptors, so the instance dictionary
+            // is looked at first.
+            if ( descr != NULL && ( Nuitka_Function_Check( descr ) || PyFunction_Check( descr ) ) && LOOKUP_INSTANCE_DICT_ATTRIBUTE( source, attr_name, cache ) == NULL )
+            {
+                this->called = INCREASE_REFCOUNT( descr );
+                this->self = INCREASE_REFCOUNT( source );
+            }
+            else
+            {
+                this->called = LOOKUP_ATTRIBUTE_FROM_CACHE( source, attr_name, cache );
+            }
+        }
+        else
+        {
+            this->called = LOOKUP_ATTRIBUTE( source, attr_name );
+        }
+    }
+
+    inline PyObject *getCalled() const
+    {
+        assertObject( this->called );
+
+        return this->called;
+    }
+
+    // The object to pass as first argument, or NULL if the attribute is to
+    // be called as it is.
+    inline PyObject *getSelf() const
+    {
+        return this->self;
+    }
+
+private:
+
+    PyObjectMethodKeeper( const PyObjectMethodKeeper &other ) { assert( false ); }
+
+    PyObject *called;
+    PyObject *self;
+};
+
+#endif
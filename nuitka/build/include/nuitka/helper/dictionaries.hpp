@@ -84,6 +84,132 @@ static PyObject *GET_STRING_DICT_VALUE( PyDictObject *dict, Nuitka_StringObject
     return GET_STRING_DICT_ENTRY( dict, key )->me_value;
 }
 
+#if PYTHON_VERSION < 300
+typedef long dict_hash_t;
+#else
+typedef Py_hash_t dict_hash_t;
+#endif
+
+typedef PyDictEntry *(*dict_lookup_func)( PyDictObject *mp, PyObject *key, dict_hash_t hash );
+
+// The lookup functions of CPython, for dictionaries with only string keys,
+// and for others, set by "enhancePythonTypes".
+extern dict_lookup_func python_lookdict_string;
+extern dict_lookup_func python_lookdict;
+
+// Lookup functions for the module dictionaries of compiled modules, that
+// count the lookups that found no value in a version of the dictionary.
+// Adding a key to a dictionary does such a lookup first, so while the
+// version is unchanged, a name known to be missing from it, still is. Our
+// own lookups don't use them, so only other code changes the version.
+template <size_t *version>
+static PyDictEntry *Nuitka_lookdict( PyDictObject *mp, PyObject *key, dict_hash_t hash )
+{
+    PyDictEntry *result = python_lookdict( mp, key, hash );
+
+    if ( result != NULL && result->me_value == NULL )
+    {
+        *version += 1;
+    }
+
+    return result;
+}
+
+template <size_t *version>
+static PyDictEntry *Nuitka_lookdict_string( PyDictObject *mp, PyObject *key, dict_hash_t hash )
+{
+    PyDictEntry *result = python_lookdict_string( mp, key, hash );
+
+    // For a non-string key, CPython switches the dictionary to the general
+    // lookup function, keep tracking it with that.
+    if (unlikely( mp->ma_lookup != Nuitka_lookdict_string<version> ))
+    {
+        assert( mp->ma_lookup == python_lookdict );
+
+        mp->ma_lookup = Nuitka_lookdict<version>;
+    }
+
+    if ( result->me_value == NULL )
+    {
+        *version += 1;
+    }
+
+    return result;
+}
+
+template <size_t *version>
+static void TRACK_DICT_VERSION( PyDictObject *dict )
+{
+    if ( dict->ma_lookup == python_lookdict_string )
+    {
+        dict->ma_lookup = Nuitka_lookdict_string<version>;
+    }
+    else
+    {
+        assert( dict->ma_lookup == python_lookdict );
+
+        dict->ma_lookup = Nuitka_lookdict<version>;
+    }
+}
+
+// Where a string key was last found in a dictionary. The entry is only used
+// while the dictionary still has the same table, and it still holds the key
+// there, so it cannot become wrong, only outdated.
+struct Nuitka_DictEntryCache
+{
+    PyDictEntry *table;
+    Py_ssize_t mask;
+    PyDictEntry *entry;
+};
+
+static inline PyObject *GET_CACHED_DICT_VALUE( PyDictObject *dict, Nuitka_StringObject *key, Nuitka_DictEntryCache *cache )
+{
+    if (likely( cache->table == dict->ma_table && cache->mask == dict->ma_mask && cache->entry->me_key == (PyObject *)key ))
+    {
+        return cache->entry->me_value;
+    }
+    else
+    {
+        return NULL;
+    }
+}
+
+// This uses the general lookup function of CPython directly, so it doesn't
+// change the version of tracked dictionaries.
+static PyObject *GET_STRING_DICT_VALUE( PyDictObject *dict, Nuitka_StringObject *key, Nuitka_DictEntryCache *cache )
+{
+    assert( PyDict_CheckExact( dict ) );
+    assert( Nuitka_String_Check( key ) );
+
+#if PYTHON_VERSION < 300
+    long hash = key->ob_shash;
+#else
+    long hash = key->hash;
+#endif
+
+    if ( hash == -1 )
+    {
+        hash = PyObject_Hash( (PyObject *)key );
+    }
+
+    PyDictEntry *entry = python_lookdict( dict, (PyObject *)key, hash );
+
+    // Comparing with keys that are not strings can fail.
+    if (unlikely( entry == NULL ))
+    {
+        throw PythonException();
+    }
+
+    if ( entry->me_value != NULL )
+    {
+        cache->table = dict->ma_table;
+        cache->mask = dict->ma_mask;
+        cache->entry = entry;
+    }
+
+    return entry->me_value;
+}
+
 #else
 
 // Quick dictionary lookup for a string value.
@@ -202,6 +202,123 @@ NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD( PyObject *operand1,
     throw PythonException();
 }
 
+// Concatenate to a string value in variable storage that holds the only
+// reference to it. Like CPython does for "s += t" and "s = s + t", the value
+// is resized in place rather than copied. Returns false if that's not possible
+// and nothing was done. On failure, the storage is cleared, as the value may
+// be lost already.
+NUITKA_MAY_BE_UNUSED static bool STRING_CONCAT_INPLACE( PyObject **operand1, PyObject *operand2 )
+{
+    PyObject *operand = *operand1;
+
+    assertObject( operand );
+    assertObject( operand2 );
+
+    // The added value may be borrowed from the very same variable.
+    if ( Py_REFCNT( operand ) != 1 || operand == operand2 )
+    {
+        return false;
+    }
+
+#if PYTHON_VERSION < 300
+    if ( PyString_CheckExact( operand ) && PyString_CheckExact( operand2 ) )
+    {
+        // Interned strings don't count the reference of the interning dict.
+        if ( PyString_CHECK_INTERNED( operand ) )
+        {
+            return false;
+        }
+
+        Py_ssize_t operand1_size = PyString_GET_SIZE( operand );
+        Py_ssize_t operand2_size = PyString_GET_SIZE( operand2 );
+
+        if (unlikely( operand2_size > PY_SSIZE_T_MAX - operand1_size ))
+        {
+            return false;
+        }
+
+        if (unlikely( _PyString_Resize( operand1, operand1_size + operand2_size ) == -1 ))
+        {
+            throw PythonException();
+        }
+
+        memcpy(
+            PyString_AS_STRING( *operand1 ) + operand1_size,
+            PyString_AS_STRING( operand2 ),
+            operand2_size
+        );
+
+        return true;
+    }
+
+    if ( PyUnicode_CheckExact( operand ) && PyUnicode_CheckExact( operand2 ) )
+    {
+        Py_ssize_t operand1_size = PyUnicode_GET_SIZE( operand );
+        Py_ssize_t operand2_size = PyUnicode_GET_SIZE( operand2 );
+
+        if (unlikely( operand2_size > PY_SSIZE_T_MAX / (Py_ssize_t)sizeof( Py_UNICODE ) - operand1_size ))
+        {
+            return false;
+        }
+
+        if (unlikely( PyUnicode_Resize( operand1, operand1_size + operand2_size ) == -1 ))
+        {
+            Py_DECREF( *operand1 );
+            *operand1 = NULL;
+
+            throw PythonException();
+        }
+
+        memcpy(
+            PyUnicode_AS_UNICODE( *operand1 ) + operand1_size,
+            PyUnicode_AS_UNICODE( operand2 ),
+            operand2_size * sizeof( Py_UNICODE )
+        );
+
+        return true;
+    }
+#else
+    if ( PyUnicode_CheckExact( operand ) && PyUnicode_CheckExact( operand2 ) )
+    {
+        // Does the resizing in place, if the value allows it.
+        PyUnicode_Append( operand1, operand2 );
+
+        if (unlikely( *operand1 == NULL ))
+        {
+            throw PythonException();
+        }
+
+        return true;
+    }
+
+    if ( PyBytes_CheckExact( operand ) && PyBytes_CheckExact( operand2 ) )
+    {
+        Py_ssize_t operand1_size = PyBytes_GET_SIZE( operand );
+        Py_ssize_t operand2_size = PyBytes_GET_SIZE( operand2 );
+
+        if (unlikely( operand2_size > PY_SSIZE_T_MAX - operand1_size ))
+        {
+            return false;
+        }
+
+        if (unlikely( _PyBytes_Resize( operand1, operand1_size + operand2_size ) == -1 ))
+        {
+            throw PythonException();
+        }
+
+        memcpy(
+            PyBytes_AS_STRING( *operand1 ) + operand1_size,
+            PyBytes_AS_STRING( operand2 ),
+            operand2_size
+        );
+
+        return true;
+    }
+#endif
+
+    return false;
+}
+
 static PyObject *SEQUENCE_REPEAT( ssizeargfunc repeatfunc, PyObject *seq, PyObject *n )
 {
     if (unlikely( !PyIndex_Check( n ) ))
@@ -832,4 +949,171 @@ NUITKA_MAY_BE_UNUSED static PyObject *POWER_OPERATION_INPLACE( PyObject *operand
     return result;
 }
 
+#if PYTHON_VERSION < 300
+
+// Variants of the above for operands expected to be "int", as given by the
+// type shape suffix, e.g. "_INT_OBJECT". The "int" values are computed with C
+// "long", an overflow, where the result becomes "long", is left to the general
+// variant. Shapes of constants are exact, but these of variables or results
+// only expected, e.g. an "int" result may have overflowed to "long", so the
+// operands are checked still, and other types use the general variant.
+
+static inline PyObject *_BINARY_OPERATION_ADD_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    assert( PyInt_CheckExact( operand1 ) );
+    assert( PyInt_CheckExact( operand2 ) );
+
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    // Wrapping around is defined for unsigned values only.
+    long x = (long)( (unsigned long)a + b );
+
+    if (likely( ( x ^ a ) >= 0 || ( x ^ b ) >= 0 ))
+    {
+        return PyInt_FromLong( x );
+    }
+
+    return BINARY_OPERATION_ADD( operand1, operand2 );
+}
+
+static inline PyObject *_BINARY_OPERATION_SUB_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    assert( PyInt_CheckExact( operand1 ) );
+    assert( PyInt_CheckExact( operand2 ) );
+
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    long x = (long)( (unsigned long)a - b );
+
+    if (likely( ( x ^ a ) >= 0 || ( x ^ ~b ) >= 0 ))
+    {
+        return PyInt_FromLong( x );
+    }
+
+    return BINARY_OPERATION_SUB( operand1, operand2 );
+}
+
+static inline PyObject *_BINARY_OPERATION_MUL_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    assert( PyInt_CheckExact( operand1 ) );
+    assert( PyInt_CheckExact( operand2 ) );
+
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    long longprod = (long)( (unsigned long)a * b );
+    double doubleprod = (double)a * (double)b;
+
+    // Same check as CPython does, the product as "double" is close enough
+    // to tell if the "long" product overflowed.
+    if (likely( (double)longprod == doubleprod ))
+    {
+        return PyInt_FromLong( longprod );
+    }
+
+    double diff = (double)longprod - doubleprod;
+    double absdiff = diff >= 0.0 ? diff : -diff;
+    double absprod = doubleprod >= 0.0 ? doubleprod : -doubleprod;
+
+    if ( 32.0 * absdiff <= absprod )
+    {
+        return PyInt_FromLong( longprod );
+    }
+
+    return BINARY_OPERATION_MUL( operand1, operand2 );
+}
+
+static inline PyObject *_BINARY_OPERATION_REMAINDER_INT_INT( PyObject *operand1, PyObject *operand2 )
+{
+    assert( PyInt_CheckExact( operand1 ) );
+    assert( PyInt_CheckExact( operand2 ) );
+
+    long a = PyInt_AS_LONG( operand1 );
+    long b = PyInt_AS_LONG( operand2 );
+
+    // Division by zero, and overflow of "LONG_MIN % -1" are raised or dealt
+    // with by the general variant.
+    if (likely( b != 0 && !( b == -1 && a == LONG_MIN ) ))
+    {
+        long x = a % b;
+
+        // The sign of the result is the one of the right operand in Python.
+        if ( x != 0 && ( ( b ^ x ) < 0 ) )
+        {
+            x += b;
+        }
+
+        return PyInt_FromLong( x );
+    }
+
+    return BINARY_OPERATION_REMAINDER( operand1, operand2 );
+}
+
+#define NUITKA_DEFINE_INT_OPERATION_VARIANTS( name ) \
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_##name##_INT_INT( PyObject *operand1, PyObject *operand2 ) \
+{ \
+    assertObject( operand1 ); \
+    assertObject( operand2 ); \
+\
+    if (likely( PyInt_CheckExact( operand1 ) && PyInt_CheckExact( operand2 ) )) \
+    { \
+        return _BINARY_OPERATION_##name##_INT_INT( operand1, operand2 ); \
+    } \
+\
+    return BINARY_OPERATION_##name( operand1, operand2 ); \
+}
+
+NUITKA_DEFINE_INT_OPERATION_VARIANTS( ADD )
+NUITKA_DEFINE_INT_OPERATION_VARIANTS( SUB )
+NUITKA_DEFINE_INT_OPERATION_VARIANTS( MUL )
+NUITKA_DEFINE_INT_OPERATION_VARIANTS( REMAINDER )
+
+#undef NUITKA_DEFINE_INT_OPERATION_VARIANTS
+
+// In-place operations, "int" has no in-place slots, so for "int" operands,
+// these are the same as the normal operations. Otherwise the in-place API is
+// used, also for its error messages.
+#define NUITKA_DEFINE_INT_INPLACE_OPERATION_VARIANTS( name, api ) \
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_INPLACE_##name##_INT_INT( PyObject *operand1, PyObject *operand2 ) \
+{ \
+    assertObject( operand1 ); \
+    assertObject( operand2 ); \
+\
+    if (likely( PyInt_CheckExact( operand1 ) && PyInt_CheckExact( operand2 ) )) \
+    { \
+        return _BINARY_OPERATION_##name##_INT_INT( operand1, operand2 ); \
+    } \
+\
+    return BINARY_OPERATION( api, operand1, operand2 ); \
+}
+
+NUITKA_DEFINE_INT_INPLACE_OPERATION_VARIANTS( ADD, PyNumber_InPlaceAdd )
+NUITKA_DEFINE_INT_INPLACE_OPERATION_VARIANTS( SUB, PyNumber_InPlaceSubtract )
+NUITKA_DEFINE_INT_INPLACE_OPERATION_VARIANTS( MUL, PyNumber_InPlaceMultiply )
+NUITKA_DEFINE_INT_INPLACE_OPERATION_VARIANTS( REMAINDER, PyNumber_InPlaceRemainder )
+
+#undef NUITKA_DEFINE_INT_INPLACE_OPERATION_VARIANTS
+
+// With only one operand expected to be "int", the checks are the same.
+#define BINARY_OPERATION_ADD_INT_OBJECT BINARY_OPERATION_ADD_INT_INT
+#define BINARY_OPERATION_ADD_OBJECT_INT BINARY_OPERATION_ADD_INT_INT
+#define BINARY_OPERATION_SUB_INT_OBJECT BINARY_OPERATION_SUB_INT_INT
+#define BINARY_OPERATION_SUB_OBJECT_INT BINARY_OPERATION_SUB_INT_INT
+#define BINARY_OPERATION_MUL_INT_OBJECT BINARY_OPERATION_MUL_INT_INT
+#define BINARY_OPERATION_MUL_OBJECT_INT BINARY_OPERATION_MUL_INT_INT
+#define BINARY_OPERATION_REMAINDER_INT_OBJECT BINARY_OPERATION_REMAINDER_INT_INT
+#define BINARY_OPERATION_REMAINDER_OBJECT_INT BINARY_OPERATION_REMAINDER_INT_INT
+#define BINARY_OPERATION_INPLACE_ADD_INT_OBJECT BINARY_OPERATION_INPLACE_ADD_INT_INT
+#define BINARY_OPERATION_INPLACE_ADD_OBJECT_INT BINARY_OPERATION_INPLACE_ADD_INT_INT
+#define BINARY_OPERATION_INPLACE_SUB_INT_OBJECT BINARY_OPERATION_INPLACE_SUB_INT_INT
+#define BINARY_OPERATION_INPLACE_SUB_OBJECT_INT BINARY_OPERATION_INPLACE_SUB_INT_INT
+#define BINARY_OPERATION_INPLACE_MUL_INT_OBJECT BINARY_OPERATION_INPLACE_MUL_INT_INT
+#define BINARY_OPERATION_INPLACE_MUL_OBJECT_INT BINARY_OPERATION_INPLACE_MUL_INT_INT
+#define BINARY_OPERATION_INPLACE_REMAINDER_INT_OBJECT BINARY_OPERATION_INPLACE_REMAINDER_INT_INT
+#define BINARY_OPERATION_INPLACE_REMAINDER_OBJECT_INT BINARY_OPERATION_INPLACE_REMAINDER_INT_INT
+
+#endif
+
 #endif
@@ -59,7 +59,22 @@ static void CHAIN_EXCEPTION( PyObject *exception_type, PyObject *exception_value
 }
 #endif
 
-NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_TYPE( PyObject *exception_type, PyObject *exception_tb )
+// Replace the traceback of the currently set error.
+static void SET_ERROR_TRACEBACK( PyTracebackObject *traceback )
+{
+    PyObject *exception_type, *exception_value, *old_traceback;
+    PyErr_Fetch( &exception_type, &exception_value, &old_traceback );
+
+    Py_XDECREF( old_traceback );
+    PyErr_Restore( exception_type, exception_value, (PyObject *)INCREASE_REFCOUNT_X( (PyObject *)traceback ) );
+}
+
+// The "SET_EXCEPTION_*" functions make the exception of a raise statement the
+// current error, the "RAISE_EXCEPTION_*" functions throw it. Raises caught in
+// the same function use the former, and jump to the handler, avoiding the
+// C++ exception.
+
+NUITKA_MAY_BE_UNUSED static void SET_EXCEPTION_WITH_TYPE( PyObject *exception_type, PyObject *exception_tb )
 {
     PyTracebackObject *traceback = (PyTracebackObject *)exception_tb;
     assertObject( traceback );
@@ -88,18 +103,14 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_TYPE( PyO
                 Py_TYPE( value )->tp_name
             );
 
-            throw PythonException();
+            return;
         }
 #endif
 
 #if PYTHON_VERSION >= 300
         CHAIN_EXCEPTION( exception_type, value );
 #endif
-        throw PythonException(
-            exception_type,
-            value,
-            traceback
-        );
+        PyErr_Restore( exception_type, value, (PyObject *)traceback );
     }
     else if ( PyExceptionInstance_Check( exception_type ) )
     {
@@ -120,25 +131,29 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_TYPE( PyO
         PyException_SetTraceback( value, (PyObject *)traceback );
 #endif
 
-        throw PythonException(
+        PyErr_Restore(
             INCREASE_REFCOUNT( exception_type ),
             INCREASE_REFCOUNT( value ),
-            INCREASE_REFCOUNT( traceback )
+            (PyObject *)INCREASE_REFCOUNT( traceback )
         );
     }
     else
     {
         PyErr_Format( PyExc_TypeError, WRONG_EXCEPTION_TYPE_ERROR_MESSAGE, Py_TYPE( exception_type )->tp_name );
 
-        PythonException to_throw;
-        to_throw.setTraceback( INCREASE_REFCOUNT( traceback ) );
-
-        throw to_throw;
+        SET_ERROR_TRACEBACK( traceback );
     }
 }
 
+NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_TYPE( PyObject *exception_type, PyObject *exception_tb )
+{
+    SET_EXCEPTION_WITH_TYPE( exception_type, exception_tb );
+
+    throw PythonException();
+}
+
 #if PYTHON_VERSION >= 300
-NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_CAUSE( PyObject *exception_type, PyObject *exception_cause, PyObject *exception_tb )
+NUITKA_MAY_BE_UNUSED static void SET_EXCEPTION_WITH_CAUSE( PyObject *exception_type, PyObject *exception_cause, PyObject *exception_tb )
 {
     PyTracebackObject *traceback = (PyTracebackObject *)exception_tb;
 
@@ -159,7 +174,7 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_CAUSE( Py
 
         if (unlikely( exception_cause == NULL ))
         {
-            throw PythonException();
+            return;
         }
     }
     else
@@ -176,7 +191,7 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_CAUSE( Py
         Py_XDECREF( exception_cause );
 
         PyErr_Format( PyExc_TypeError, "exception causes must derive from BaseException" );
-        throw PythonException();
+        return;
     }
 
 
@@ -202,21 +217,20 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_CAUSE( Py
                 Py_TYPE( value )->tp_name
             );
 
-            throw PythonException();
+            return;
         }
 
-        PythonException to_throw( exception_type, value, traceback );
-        to_throw.setCause( exception_cause );
-        throw to_throw;
+        PyException_SetCause( value, exception_cause );
+        PyErr_Restore( exception_type, value, (PyObject *)traceback );
     }
     else if ( PyExceptionInstance_Check( exception_type ) )
     {
         Py_XDECREF( exception_cause );
 
-        throw PythonException(
+        PyErr_Restore(
             INCREASE_REFCOUNT( PyExceptionInstance_Class( exception_type ) ),
             INCREASE_REFCOUNT( exception_type ),
-            INCREASE_REFCOUNT( traceback )
+            (PyObject *)INCREASE_REFCOUNT( traceback )
         );
     }
     else
@@ -225,15 +239,19 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_CAUSE( Py
 
         PyErr_Format( PyExc_TypeError, WRONG_EXCEPTION_TYPE_ERROR_MESSAGE, Py_TYPE( exception_type )->tp_name );
 
-        PythonException to_throw;
-        to_throw.setTraceback( INCREASE_REFCOUNT( traceback ) );
-
-        throw to_throw;
+        SET_ERROR_TRACEBACK( traceback );
     }
 }
+
+NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_CAUSE( PyObject *exception_type, PyObject *exception_cause, PyObject *exception_tb )
+{
+    SET_EXCEPTION_WITH_CAUSE( exception_type, exception_cause, exception_tb );
+
+    throw PythonException();
+}
 #endif
 
-NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE( PyObject *exception_type, PyObject *value, PyObject *exception_tb )
+NUITKA_MAY_BE_UNUSED static void SET_EXCEPTION_WITH_VALUE( PyObject *exception_type, PyObject *value, PyObject *exception_tb )
 {
     assertObject( exception_type );
     PyTracebackObject *traceback = (PyTracebackObject *)exception_tb;
@@ -265,15 +283,11 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE( Py
             Py_XDECREF( value );
             Py_XDECREF( traceback );
 
-            throw PythonException();
+            return;
         }
 #endif
 
-        throw PythonException(
-            exception_type,
-            value,
-            traceback
-        );
+        PyErr_Restore( exception_type, value, (PyObject *)traceback );
     }
     else if ( PyExceptionInstance_Check( exception_type ) )
     {
@@ -284,28 +298,33 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE( Py
                 "instance exception may not have a separate value"
             );
 
-            throw PythonException();
+            return;
         }
 
         // The type is rather a value, so we are overriding it here.
         value = exception_type;
         exception_type = PyExceptionInstance_Class( exception_type );
 
-        throw PythonException(
+        PyErr_Restore(
             INCREASE_REFCOUNT( exception_type ),
             INCREASE_REFCOUNT( value ),
-            INCREASE_REFCOUNT_X( traceback )
+            (PyObject *)INCREASE_REFCOUNT_X( traceback )
         );
     }
     else
     {
         PyErr_Format( PyExc_TypeError, WRONG_EXCEPTION_TYPE_ERROR_MESSAGE, Py_TYPE( exception_type )->tp_name );
-
-        throw PythonException();
     }
 }
 
-NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE_NO_NORMALIZE( PyObject *exception_type, PyObject *value, PyObject *tb )
+NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE( PyObject *exception_type, PyObject *value, PyObject *exception_tb )
+{
+    SET_EXCEPTION_WITH_VALUE( exception_type, value, exception_tb );
+
+    throw PythonException();
+}
+
+NUITKA_MAY_BE_UNUSED static void SET_EXCEPTION_WITH_VALUE_NO_NORMALIZE( PyObject *exception_type, PyObject *value, PyObject *tb )
 {
     PyTracebackObject *traceback = (PyTracebackObject *)tb;
 
@@ -314,10 +333,10 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE_NO_
 
     if ( PyExceptionClass_Check( exception_type ) )
     {
-        throw PythonException(
+        PyErr_Restore(
             INCREASE_REFCOUNT( exception_type ),
             INCREASE_REFCOUNT( value ),
-            INCREASE_REFCOUNT_X( traceback )
+            (PyObject *)INCREASE_REFCOUNT_X( traceback )
         );
     }
     else if ( PyExceptionInstance_Check( exception_type ) )
@@ -328,10 +347,10 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE_NO_
         value = exception_type;
         exception_type = PyExceptionInstance_Class( exception_type );
 
-        throw PythonException(
+        PyErr_Restore(
             INCREASE_REFCOUNT( exception_type ),
             INCREASE_REFCOUNT( value ),
-            INCREASE_REFCOUNT_X( traceback )
+            (PyObject *)INCREASE_REFCOUNT_X( traceback )
         );
     }
     else
@@ -339,13 +358,17 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE_NO_
         assert( false );
 
         PyErr_Format( PyExc_TypeError, WRONG_EXCEPTION_TYPE_ERROR_MESSAGE, Py_TYPE( exception_type )->tp_name );
-
-        throw PythonException();
     }
 }
 
+NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RAISE_EXCEPTION_WITH_VALUE_NO_NORMALIZE( PyObject *exception_type, PyObject *value, PyObject *tb )
+{
+    SET_EXCEPTION_WITH_VALUE_NO_NORMALIZE( exception_type, value, tb );
+
+    throw PythonException();
+}
 
-NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static inline void RAISE_EXCEPTION_WITH_TRACEBACK( PyObject *exception_type, PyObject *value, PyObject *traceback )
+NUITKA_MAY_BE_UNUSED static inline void SET_EXCEPTION_WITH_TRACEBACK( PyObject *exception_type, PyObject *value, PyObject *traceback )
 {
     if ( traceback == Py_None )
     {
@@ -356,10 +379,17 @@ NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static inline void RAISE_EXCEPTION_WITH_TR
     if( traceback != NULL && !PyTraceBack_Check( traceback ) )
     {
         PyErr_Format( PyExc_TypeError, "raise: arg 3 must be a traceback or None" );
-        throw PythonException();
+        return;
     }
 
-    RAISE_EXCEPTION_WITH_VALUE( exception_type, value, traceback );
+    SET_EXCEPTION_WITH_VALUE( exception_type, value, traceback );
+}
+
+NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static inline void RAISE_EXCEPTION_WITH_TRACEBACK( PyObject *exception_type, PyObject *value, PyObject *traceback )
+{
+    SET_EXCEPTION_WITH_TRACEBACK( exception_type, value, traceback );
+
+    throw PythonException();
 }
 
 NUITKA_NO_RETURN NUITKA_MAY_BE_UNUSED static void RERAISE_EXCEPTION( void )
@@ -0,0 +1,66 @@
+//     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_RANGES_H__
+#define __NUITKA_HELPER_RANGES_H__
+
+#if PYTHON_VERSION < 300
+
+// Iterator over the values of "range" with C long counters, used when it is
+// only iterated over, e.g. in "for i in range(n)" loops. The list is never
+// created, and int objects are only made for values actually produced.
+typedef struct {
+    PyObject_HEAD
+
+    long current;
+    long step;
+    unsigned long remaining;
+} Nuitka_RangeIteratorObject;
+
+extern PyTypeObject Nuitka_RangeIterator_Type;
+
+static inline bool Nuitka_RangeIterator_Check( PyObject *object )
+{
+    return Py_TYPE( object ) == &Nuitka_RangeIterator_Type;
+}
+
+// Produce the next value, or NULL when exhausted, never sets an exception.
+static inline PyObject *Nuitka_RangeIterator_Next( Nuitka_RangeIteratorObject *iterator )
+{
+    if ( iterator->remaining == 0 )
+    {
+        return NULL;
+    }
+
+    PyObject *result = PyInt_FromLong( iterator->current );
+
+    iterator->remaining -= 1;
+
+    // Unsigned arithmetic, as the step after the last value may overflow.
+    iterator->current = (long)( (unsigned long)iterator->current + (unsigned long)iterator->step );
+
+    return result;
+}
+
+#endif
+
+// For quicker "iter( range( ... ) )" functionality.
+extern PyObject *BUILTIN_ITER_RANGE3( PyObject *low, PyObject *high, PyObject *step );
+extern PyObject *BUILTIN_ITER_RANGE2( PyObject *low, PyObject *high );
+extern PyObject *BUILTIN_ITER_RANGE( PyObject *boundary );
+
+#endif
@@ -20,7 +20,10 @@
 
 extern PyObject *BUILTIN_CHR( unsigned char c );
 
-NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source, PyObject *const_subscript, Py_ssize_t int_subscript )
+// The "*_NO_THROW" variants return NULL with the error set, for code that
+// checks it, and jumps to a handler of the same function, instead of throwing.
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST_NO_THROW( PyObject *source, PyObject *const_subscript, Py_ssize_t int_subscript )
 {
     assertObject( source );
     assertObject( const_subscript );
@@ -41,7 +44,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source,
                 if ( -int_subscript > list_size )
                 {
                     PyErr_Format( PyExc_IndexError, "list index out of range" );
-                    throw PythonException();
+                    return NULL;
                 }
 
                 int_subscript += list_size;
@@ -51,7 +54,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source,
                 if ( int_subscript >= list_size )
                 {
                     PyErr_Format( PyExc_IndexError, "list index out of range" );
-                    throw PythonException();
+                    return NULL;
                 }
             }
 
@@ -68,7 +71,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source,
                 if ( -int_subscript > string_size )
                 {
                     PyErr_Format( PyExc_IndexError, "string index out of range" );
-                    throw PythonException();
+                    return NULL;
                 }
 
                 int_subscript += string_size;
@@ -78,7 +81,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source,
                 if ( int_subscript >= string_size )
                 {
                     PyErr_Format( PyExc_IndexError, "string index out of range" );
-                    throw PythonException();
+                    return NULL;
                 }
             }
 
@@ -106,18 +109,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source,
 #endif
             Py_TYPE( source )->tp_name
         );
-        throw PythonException();
-    }
-
-    if (unlikely( result == NULL ))
-    {
-        throw PythonException();
+        return NULL;
     }
 
     return result;
 }
 
-NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT( PyObject *source, PyObject *subscript )
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_NO_THROW( PyObject *source, PyObject *subscript )
 {
     assertObject( source );
     assertObject( subscript );
@@ -135,12 +133,19 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT( PyObject *source, PyObje
     {
         if ( PyIndex_Check( subscript ) )
         {
-            result = PySequence_GetItem( source, CONVERT_TO_INDEX( subscript ) );
+            Py_ssize_t index = PyNumber_AsSsize_t( subscript, NULL );
+
+            if (unlikely( index == -1 && ERROR_OCCURED() ))
+            {
+                return NULL;
+            }
+
+            result = PySequence_GetItem( source, index );
         }
         else if ( type->tp_as_sequence->sq_item )
         {
             PyErr_Format( PyExc_TypeError, "sequence index must be integer, not '%s'", Py_TYPE( subscript )->tp_name );
-            throw PythonException();
+            return NULL;
         }
         else
         {
@@ -153,7 +158,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT( PyObject *source, PyObje
 #endif
                 Py_TYPE( source )->tp_name
             );
-            throw PythonException();
+            return NULL;
         }
     }
     else
@@ -168,9 +173,28 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT( PyObject *source, PyObje
             Py_TYPE( source )->tp_name
         );
 
+        return NULL;
+    }
+
+    return result;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT_CONST( PyObject *source, PyObject *const_subscript, Py_ssize_t int_subscript )
+{
+    PyObject *result = LOOKUP_SUBSCRIPT_CONST_NO_THROW( source, const_subscript, int_subscript );
+
+    if (unlikely( result == NULL ))
+    {
         throw PythonException();
     }
 
+    return result;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_SUBSCRIPT( PyObject *source, PyObject *subscript )
+{
+    PyObject *result = LOOKUP_SUBSCRIPT_NO_THROW( source, subscript );
+
     if (unlikely( result == NULL ))
     {
         throw PythonException();
@@ -124,6 +124,7 @@ static char *_PyUnicode_AS_STRING( PyObject *unicode )
 
 #include "nuitka/helper/richcomparisons.hpp"
 #include "nuitka/helper/sequences.hpp"
+#include "nuitka/helper/ranges.hpp"
 
 static inline bool Nuitka_Function_Check( PyObject *object );
 static inline PyObject *Nuitka_Function_GetName( PyObject *object );
@@ -458,6 +459,14 @@ NUITKA_MAY_BE_UNUSED static PyObject *ITERATOR_NEXT( PyObject *iterator )
     assertObject( iterator );
     assert( Py_TYPE( iterator )->tp_iternext );
 
+#if PYTHON_VERSION < 300
+    // Loops over "range" values count in C, no need to check for errors.
+    if ( Nuitka_RangeIterator_Check( iterator ) )
+    {
+        return Nuitka_RangeIterator_Next( (Nuitka_RangeIteratorObject *)iterator );
+    }
+#endif
+
     PyObject *result = (*Py_TYPE( iterator )->tp_iternext)( iterator );
 
     if (unlikely( result == NULL ))
@@ -472,6 +481,31 @@ NUITKA_MAY_BE_UNUSED static PyObject *ITERATOR_NEXT( PyObject *iterator )
     return result;
 }
 
+// Returns NULL with the error set, for code that checks it, and jumps to a
+// handler of the same function, instead of throwing.
+NUITKA_MAY_BE_UNUSED static PyObject *BUILTIN_NEXT1_NO_THROW( PyObject *iterator )
+{
+    assertObject( iterator );
+    assert( Py_TYPE( iterator )->tp_iternext );
+
+    PyObject *result = (*Py_TYPE( iterator )->tp_iternext)( iterator );
+
+    if (unlikely( result == NULL ))
+    {
+        // The iteration can return NULL with no error, which means StopIteration.
+        if ( !ERROR_OCCURED() )
+        {
+            PyErr_SetNone( PyExc_StopIteration );
+        }
+    }
+    else
+    {
+        assertObject( result );
+    }
+
+    return result;
+}
+
 NUITKA_MAY_BE_UNUSED static PyObject *BUILTIN_NEXT1( PyObject *iterator )
 {
     assertObject( iterator );
@@ -872,6 +906,8 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_ATTRIBUTE( PyObject *source, PyObje
     }
 }
 
+#include "nuitka/helper/attributes.hpp"
+
 NUITKA_MAY_BE_UNUSED static bool HAS_ATTRIBUTE( PyObject *source, PyObject *attr_name )
 {
     assertObject( source );
@@ -1281,8 +1317,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *EVAL_CODE( PyObject *code, PyObject *globa
 #include "nuitka/importing.hpp"
 
 // For the constant loading:
-extern void UNSTREAM_INIT( void );
-extern PyObject *UNSTREAM_CONSTANT( char const *buffer, Py_ssize_t size );
+extern void UNSTREAM_CONSTANTS( unsigned char const *buffer, Py_ssize_t size, PyObject **const *slots );
 extern PyObject *UNSTREAM_STRING( char const *buffer, Py_ssize_t size, bool intern );
 extern PyObject *UNSTREAM_FLOAT( char const *buffer );
 
@@ -1297,6 +1332,9 @@ extern void patchInspectModule( void );
 // Replace builtin functions with ones that accept compiled types too.
 extern void patchBuiltinModule( void );
 
+// Make the "__nuitka__" module with the run time counters importable.
+extern void registerStatisticsModule( void );
+
 #if PYTHON_VERSION >= 300
 NUITKA_MAY_BE_UNUSED static PyObject *SELECT_METACLASS( PyObject *metaclass, PyObject *bases )
 {
@@ -22,4 +22,32 @@ extern PyObject *IMPORT_MODULE( PyObject *module_name, PyObject *globals, PyObje
 
 extern void IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *module );
 
+// Cache of an import statement, remembering the module it gave, and the
+// modules it imported, by the names they have in "sys.modules".
+typedef struct {
+    // The result of the import, the imported module, or for "import a.b"
+    // without import list, the top level package.
+    PyObject *module;
+
+    // Tuple of names and modules, for all the packages and the module
+    // imported, these must be unchanged in "sys.modules".
+    PyObject *checks;
+
+    // Import list items must be checked to be in the package still.
+    PyObject *check_items;
+} Nuitka_ImportCache;
+
+// Check if the cached import result is what an import would give, i.e. the
+// builtin "__import__" is not overloaded, and "sys.modules" still has the
+// same modules.
+extern bool IMPORT_CACHE_VALID( Nuitka_ImportCache *cache );
+
+NUITKA_MAY_BE_UNUSED static PyObject *IMPORT_CACHED( Nuitka_ImportCache *cache )
+{
+    return INCREASE_REFCOUNT( cache->module );
+}
+
+// Import the module, and remember the result in the cache, if possible.
+extern PyObject *IMPORT_MODULE_CACHE_FILL( Nuitka_ImportCache *cache, PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level );
+
 #endif
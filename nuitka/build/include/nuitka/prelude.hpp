@@ -38,6 +38,7 @@
 #include "Python.h"
 #include "methodobject.h"
 #include "frameobject.h"
+#include "structmember.h"
 #include "pydebug.h"
 
 #if PYTHON_VERSION < 300
@@ -48,6 +49,9 @@
 // Include the C header files most often used.
 #include <stdio.h>
 
+// For placement new, used to construct contexts inline with their objects.
+#include <new>
+
 // An idea I first saw used with Cython, hint the compiler about branches that
 // are more or less likely to be taken. And hint the compiler about things that
 // we assume to be normally true. If other compilers can do similar, I would be
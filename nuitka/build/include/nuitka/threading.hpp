@@ -26,6 +26,13 @@ extern volatile int _Py_Ticker;
 #define _Py_CheckInterval 20
 #endif
 
+// Decide if the GIL should be released for other threads, see the definition
+// for how that works.
+extern bool SHALL_RELEASE_GIL( PyThreadState *tstate );
+
+// Take note that the GIL was just acquired by the current thread.
+extern void NOTE_GIL_ACQUIRED( void );
+
 NUITKA_MAY_BE_UNUSED static void CONSIDER_THREADING( void )
 {
     // Decrease ticker
@@ -44,13 +51,12 @@ NUITKA_MAY_BE_UNUSED static void CONSIDER_THREADING( void )
         PyThreadState *tstate = PyThreadState_GET();
         assert( tstate );
 
-        if ( PyEval_ThreadsInitialized() )
+        if ( PyEval_ThreadsInitialized() && SHALL_RELEASE_GIL( tstate ) )
         {
-            // Release and acquire the GIL, it's very inefficient, because we
-            // don't even know if it makes sense to do it. A controlling thread
-            // should be used to determine if it's needed at all.
             PyEval_SaveThread();
             PyEval_AcquireThread( tstate );
+
+            NOTE_GIL_ACQUIRED();
         }
 
         if (unlikely( tstate->async_exc != NULL ))
@@ -105,6 +105,34 @@ public:
         }
     }
 
+    // Assign the sum of the value and another one, for "var += value" with an
+    // inplace operation, and "var = var + value" otherwise. Strings only held
+    // by the variable are extended in place.
+    void assignSum( PyObject *value, bool inplace )
+    {
+        PyObject *object = this->asObject();
+
+        if ( this->free_value && Py_REFCNT( object ) == 1 )
+        {
+            // Not owned while being resized, on failure the variable is then
+            // unassigned, just like with CPython.
+            this->free_value = false;
+            bool done = STRING_CONCAT_INPLACE( &this->object, value );
+            this->free_value = true;
+
+            if ( done )
+            {
+                return;
+            }
+        }
+
+        this->assign1(
+            inplace ?
+                BINARY_OPERATION( PyNumber_InPlaceAdd, object, value ) :
+                BINARY_OPERATION_ADD( object, value )
+        );
+    }
+
     PyObject *asObject() const
     {
         if ( this->object == NULL && this->var_name != NULL )
@@ -80,6 +80,26 @@ public:
         Py_XDECREF( old_object );
     }
 
+    // Assign the sum of the value and another one, for "var += value" with an
+    // inplace operation, and "var = var + value" otherwise. Strings only held
+    // by the variable are extended in place, on failure the variable is then
+    // unassigned, just like with CPython.
+    void assignSum( PyObject *value, bool inplace )
+    {
+        PyObject *object = this->asObject();
+
+        if ( Py_REFCNT( object ) == 1 && STRING_CONCAT_INPLACE( &this->object, value ) )
+        {
+            return;
+        }
+
+        this->assign1(
+            inplace ?
+                BINARY_OPERATION( PyNumber_InPlaceAdd, object, value ) :
+                BINARY_OPERATION_ADD( object, value )
+        );
+    }
+
     PyObject *asObject() const
     {
         if ( this->object == NULL )
@@ -71,6 +71,63 @@ private:
     PyObject *object;
 };
 
+// Temporary variable that is stored in the context of a stackless generator,
+// so it survives the generator being suspended and resumed. Unlike the
+// PyObjectTemporary, it is created empty, and may be released early, at the
+// end of its temporary block.
+
+class PyObjectContextTemporary
+{
+public:
+    explicit PyObjectContextTemporary()
+    {
+        this->object = NULL;
+    }
+
+    ~PyObjectContextTemporary()
+    {
+        Py_XDECREF( this->object );
+    }
+
+    PyObject *asObject() const
+    {
+        assertObject( this->object );
+
+        return this->object;
+    }
+
+    void assign0( PyObject *object )
+    {
+        assertObject( object );
+
+        this->assign1( INCREASE_REFCOUNT( object ) );
+    }
+
+    void assign1( PyObject *object )
+    {
+        assertObject( object );
+
+        PyObject *old_object = this->object;
+        this->object = object;
+
+        Py_XDECREF( old_object );
+    }
+
+    void release()
+    {
+        PyObject *old_object = this->object;
+        this->object = NULL;
+
+        Py_XDECREF( old_object );
+    }
+
+private:
+
+    PyObjectContextTemporary( const PyObjectContextTemporary &object ) { assert( false ); }
+
+    PyObject *object;
+};
+
 
 class PyObjectTempKeeper1
 {
@@ -624,6 +624,231 @@ PyObject *BUILTIN_RANGE3( PyObject *low, PyObject *high, PyObject *step )
 #endif
 }
 
+#if PYTHON_VERSION < 300
+static void Nuitka_RangeIterator_tp_dealloc( Nuitka_RangeIteratorObject *iterator )
+{
+    PyObject_Del( iterator );
+}
+
+static PyObject *Nuitka_RangeIterator_tp_iternext( Nuitka_RangeIteratorObject *iterator )
+{
+    return Nuitka_RangeIterator_Next( iterator );
+}
+
+static PyObject *Nuitka_RangeIterator_length_hint( Nuitka_RangeIteratorObject *iterator )
+{
+    return PyInt_FromSsize_t( (Py_ssize_t)iterator->remaining );
+}
+
+static PyMethodDef Nuitka_RangeIterator_methods[] =
+{
+    { "__length_hint__", (PyCFunction)Nuitka_RangeIterator_length_hint, METH_NOARGS, NULL },
+    { NULL }
+};
+
+PyTypeObject Nuitka_RangeIterator_Type =
+{
+    PyVarObject_HEAD_INIT(&PyType_Type, 0)
+    "rangeiterator",
+    sizeof(Nuitka_RangeIteratorObject),
+    0,
+    (destructor)Nuitka_RangeIterator_tp_dealloc,     // tp_dealloc
+    0,                                               // tp_print
+    0,                                               // tp_getattr
+    0,                                               // tp_setattr
+    0,                                               // tp_compare
+    0,                                               // tp_repr
+    0,                                               // tp_as_number
+    0,                                               // tp_as_sequence
+    0,                                               // tp_as_mapping
+    0,                                               // tp_hash
+    0,                                               // tp_call
+    0,                                               // tp_str
+    PyObject_GenericGetAttr,                         // tp_getattro
+    0,                                               // tp_setattro
+    0,                                               // tp_as_buffer
+    Py_TPFLAGS_DEFAULT,                              // tp_flags
+    0,                                               // tp_doc
+    0,                                               // tp_traverse
+    0,                                               // tp_clear
+    0,                                               // tp_richcompare
+    0,                                               // tp_weaklistoffset
+    PyObject_SelfIter,                               // tp_iter
+    (iternextfunc)Nuitka_RangeIterator_tp_iternext,  // tp_iternext
+    Nuitka_RangeIterator_methods,                    // tp_methods
+    0,                                               // tp_members
+};
+
+// Number of values in the range, computed like CPython does, in unsigned
+// arithmetic, so it cannot overflow.
+static unsigned long GET_RANGE_LENGTH( long low, long high, long step )
+{
+    assert( step != 0 );
+
+    if ( step > 0 && low < high )
+    {
+        return 1UL + ( (unsigned long)high - 1UL - (unsigned long)low ) / (unsigned long)step;
+    }
+    else if ( step < 0 && low > high )
+    {
+        return 1UL + ( (unsigned long)low - 1UL - (unsigned long)high ) / ( 0UL - (unsigned long)step );
+    }
+    else
+    {
+        return 0;
+    }
+}
+
+// Returns NULL if the range is too large for a list, in which case range()
+// itself has to raise the error.
+static PyObject *_BUILTIN_ITER_RANGE_INT3( long low, long high, long step )
+{
+    unsigned long length = GET_RANGE_LENGTH( low, high, step );
+
+    if (unlikely( length > (unsigned long)PY_SSIZE_T_MAX ))
+    {
+        return NULL;
+    }
+
+    Nuitka_RangeIteratorObject *result = PyObject_New( Nuitka_RangeIteratorObject, &Nuitka_RangeIterator_Type );
+
+    if (unlikely( result == NULL ))
+    {
+        throw PythonException();
+    }
+
+    result->current = low;
+    result->step = step;
+    result->remaining = length;
+
+    return (PyObject *)result;
+}
+#endif
+
+PyObject *BUILTIN_ITER_RANGE( PyObject *boundary )
+{
+#if PYTHON_VERSION < 300
+    PyObjectTemporary boundary_temp( TO_RANGE_ARG( boundary, "end" ) );
+
+    long end = PyInt_AsLong( boundary_temp.asObject() );
+
+    if (likely( !( end == -1 && ERROR_OCCURED() ) ))
+    {
+        PyObject *result = _BUILTIN_ITER_RANGE_INT3( 0, end, 1 );
+
+        if (likely( result != NULL ))
+        {
+            return result;
+        }
+    }
+
+    PyErr_Clear();
+
+    PyObjectTemporary range_temp( _python_builtin_range.call1( boundary_temp.asObject() ) );
+#else
+    PyObjectTemporary range_temp( _python_builtin_range.call1( boundary ) );
+#endif
+
+    return MAKE_ITERATOR( range_temp.asObject() );
+}
+
+PyObject *BUILTIN_ITER_RANGE2( PyObject *low, PyObject *high )
+{
+#if PYTHON_VERSION < 300
+    PyObjectTemporary low_temp( TO_RANGE_ARG( low, "start" ) );
+    PyObjectTemporary high_temp( TO_RANGE_ARG( high, "end" ) );
+
+    long start = PyInt_AsLong( low_temp.asObject() );
+    bool fallback = start == -1 && ERROR_OCCURED();
+
+    long end = PyInt_AsLong( high_temp.asObject() );
+    fallback = fallback || ( end == -1 && ERROR_OCCURED() );
+
+    if (likely( !fallback ))
+    {
+        PyObject *result = _BUILTIN_ITER_RANGE_INT3( start, end, 1 );
+
+        if (likely( result != NULL ))
+        {
+            return result;
+        }
+    }
+
+    PyErr_Clear();
+
+    PyObjectTemporary range_temp(
+        _python_builtin_range.call_args(
+            MAKE_TUPLE2(
+                low_temp.asObject(),
+                high_temp.asObject()
+            )
+        )
+    );
+#else
+    PyObjectTemporary range_temp(
+        _python_builtin_range.call_args(
+            MAKE_TUPLE2( low, high )
+        )
+    );
+#endif
+
+    return MAKE_ITERATOR( range_temp.asObject() );
+}
+
+PyObject *BUILTIN_ITER_RANGE3( PyObject *low, PyObject *high, PyObject *step )
+{
+#if PYTHON_VERSION < 300
+    PyObjectTemporary low_temp( TO_RANGE_ARG( low, "start" ) );
+    PyObjectTemporary high_temp( TO_RANGE_ARG( high, "end" ) );
+    PyObjectTemporary step_temp( TO_RANGE_ARG( step, "step" ) );
+
+    long start = PyInt_AsLong( low_temp.asObject() );
+    bool fallback = start == -1 && ERROR_OCCURED();
+
+    long end = PyInt_AsLong( high_temp.asObject() );
+    fallback = fallback || ( end == -1 && ERROR_OCCURED() );
+
+    long step_long = PyInt_AsLong( step_temp.asObject() );
+    fallback = fallback || ( step_long == -1 && ERROR_OCCURED() );
+
+    if (likely( !fallback ))
+    {
+        if (unlikely( step_long == 0 ))
+        {
+            PyErr_Format( PyExc_ValueError, "range() step argument must not be zero" );
+            throw PythonException();
+        }
+
+        PyObject *result = _BUILTIN_ITER_RANGE_INT3( start, end, step_long );
+
+        if (likely( result != NULL ))
+        {
+            return result;
+        }
+    }
+
+    PyErr_Clear();
+
+    PyObjectTemporary range_temp(
+        _python_builtin_range.call_args(
+            MAKE_TUPLE3(
+                low_temp.asObject(),
+                high_temp.asObject(),
+                step_temp.asObject()
+            )
+        )
+    );
+#else
+    PyObjectTemporary range_temp(
+        _python_builtin_range.call_args(
+            MAKE_TUPLE3( low, high, step )
+        )
+    );
+#endif
+
+    return MAKE_ITERATOR( range_temp.asObject() );
+}
+
 PyObject *BUILTIN_LEN( PyObject *value )
 {
     assertObject( value );
@@ -678,6 +903,246 @@ PyObject *IMPORT_MODULE( PyObject *module_name, PyObject *globals, PyObject *loc
     return import_result;
 }
 
+extern PyObject *_python_str_plain___name__;
+extern PyObject *_python_str_plain___path__;
+
+// Only the builtin "__import__" is known to give the same result again, while
+// "sys.modules" is unchanged.
+static bool IS_BUILTIN_IMPORT( PyObject *import )
+{
+    return
+        PyCFunction_Check( import ) &&
+        strcmp( ((PyCFunctionObject *)import)->m_ml->ml_name, "__import__" ) == 0;
+}
+
+bool IMPORT_CACHE_VALID( Nuitka_ImportCache *cache )
+{
+    if ( cache->module == NULL )
+    {
+        return false;
+    }
+
+    if (unlikely( !IS_BUILTIN_IMPORT( _python_builtin_import.asObject() ) ))
+    {
+        return false;
+    }
+
+    PyObject *modules = PyImport_GetModuleDict();
+
+    for ( Py_ssize_t i = 0; i < PyTuple_GET_SIZE( cache->checks ); i += 2 )
+    {
+        PyObject *name = PyTuple_GET_ITEM( cache->checks, i );
+
+        if ( PyDict_GetItem( modules, name ) != PyTuple_GET_ITEM( cache->checks, i + 1 ) )
+        {
+            return false;
+        }
+    }
+
+    // Import list items not in a package, would be imported as modules.
+    if ( cache->check_items != NULL )
+    {
+        PyObject *dict = PyModule_GetDict( cache->module );
+
+        for ( Py_ssize_t i = 0; i < PyTuple_GET_SIZE( cache->check_items ); i++ )
+        {
+            if ( PyDict_GetItem( dict, PyTuple_GET_ITEM( cache->check_items, i ) ) == NULL )
+            {
+                return false;
+            }
+        }
+    }
+
+    return true;
+}
+
+// Make the checks for an import of the given name, giving the result module,
+// or NULL if it cannot be checked.
+static PyObject *MAKE_IMPORT_CHECKS( char const *name, PyObject *result )
+{
+    PyObject *modules = PyImport_GetModuleDict();
+
+    PyObject *checks = PyList_New( 0 );
+    bool found_result = false;
+
+    for ( char const *end = name; ; end++ )
+    {
+        if ( *end != '.' && *end != 0 )
+        {
+            continue;
+        }
+
+#if PYTHON_VERSION < 300
+        PyObject *prefix = PyString_FromStringAndSize( name, end - name );
+#else
+        PyObject *prefix = PyUnicode_FromStringAndSize( name, end - name );
+#endif
+
+        PyObject *module = prefix != NULL ? PyDict_GetItem( modules, prefix ) : NULL;
+
+        if ( module == NULL || !PyModule_Check( module ) )
+        {
+            PyErr_Clear();
+
+            Py_XDECREF( prefix );
+            Py_DECREF( checks );
+
+            return NULL;
+        }
+
+        found_result = found_result || module == result;
+
+        PyList_Append( checks, prefix );
+        PyList_Append( checks, module );
+
+        Py_DECREF( prefix );
+
+        if ( *end == 0 )
+        {
+            break;
+        }
+    }
+
+    PyObject *result_checks = found_result ? PyList_AsTuple( checks ) : NULL;
+    Py_DECREF( checks );
+
+    return result_checks;
+}
+
+PyObject *IMPORT_MODULE_CACHE_FILL( Nuitka_ImportCache *cache, PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items, PyObject *level )
+{
+    PyObject *result = IMPORT_MODULE( module_name, globals, locals, import_items, level );
+
+    if ( !IS_BUILTIN_IMPORT( _python_builtin_import.asObject() ) || !PyModule_Check( result ) )
+    {
+        return result;
+    }
+
+    bool has_items = PyTuple_Check( import_items ) && PyTuple_GET_SIZE( import_items ) > 0;
+
+    if ( has_items )
+    {
+        for ( Py_ssize_t i = 0; i < PyTuple_GET_SIZE( import_items ); i++ )
+        {
+            PyObject *item = PyTuple_GET_ITEM( import_items, i );
+
+            // Star imports are not done often, no need to cache them.
+            if ( !Nuitka_String_Check( item ) || strcmp( Nuitka_String_AsString_Unchecked( item ), "*" ) == 0 )
+            {
+                return result;
+            }
+        }
+    }
+
+    PyObject *result_name = PyDict_GetItem( PyModule_GetDict( result ), _python_str_plain___name__ );
+
+    if ( result_name == NULL || !Nuitka_String_Check( result_name ) )
+    {
+        return result;
+    }
+
+    // Without import list, the top level package is the result, but the
+    // module named is what gets imported.
+    PyObject *leaf_name;
+    char const *dot = has_items ? NULL : strchr( Nuitka_String_AsString_Unchecked( module_name ), '.' );
+
+    if ( dot == NULL )
+    {
+        leaf_name = INCREASE_REFCOUNT( result_name );
+    }
+    else
+    {
+#if PYTHON_VERSION < 300
+        leaf_name = PyString_FromFormat( "%s%s", Nuitka_String_AsString_Unchecked( result_name ), dot );
+#else
+        leaf_name = PyUnicode_FromFormat( "%s%s", Nuitka_String_AsString_Unchecked( result_name ), dot );
+#endif
+
+        if (unlikely( leaf_name == NULL ))
+        {
+            PyErr_Clear();
+            return result;
+        }
+    }
+
+    PyObject *checks = MAKE_IMPORT_CHECKS( Nuitka_String_AsString_Unchecked( leaf_name ), result );
+    Py_DECREF( leaf_name );
+
+    if ( checks == NULL )
+    {
+        return result;
+    }
+
+    PyObject *check_items = NULL;
+
+    if ( has_items && PyDict_GetItem( PyModule_GetDict( result ), _python_str_plain___path__ ) != NULL )
+    {
+        check_items = INCREASE_REFCOUNT( import_items );
+    }
+
+    PyObject *old_module = cache->module;
+    PyObject *old_checks = cache->checks;
+    PyObject *old_check_items = cache->check_items;
+
+    cache->module = INCREASE_REFCOUNT( result );
+    cache->checks = checks;
+    cache->check_items = check_items;
+
+    Py_XDECREF( old_module );
+    Py_XDECREF( old_checks );
+    Py_XDECREF( old_check_items );
+
+    return result;
+}
+
+PyObject *LOOKUP_INSTANCE_DICT_CACHE_FILL( PyDictObject *dict, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+#if PYTHON_VERSION < 330
+    // An empty dictionary, to know the lookup function used for dictionaries
+    // with only string keys, which can neither fail nor execute code.
+    static PyDictObject *string_keys_dict = NULL;
+
+    if ( string_keys_dict == NULL )
+    {
+        string_keys_dict = (PyDictObject *)PyDict_New();
+    }
+
+    if ( dict->ma_lookup == string_keys_dict->ma_lookup )
+    {
+        PyDictEntry *entry = GET_STRING_DICT_ENTRY( dict, (Nuitka_StringObject *)attr_name );
+
+        if ( entry->me_value != NULL )
+        {
+            cache->dict_index = entry - dict->ma_table;
+        }
+
+        return entry->me_value;
+    }
+#endif
+
+    return PyDict_GetItem( (PyObject *)dict, attr_name );
+}
+
+bool FILL_ATTRIBUTE_CACHE( PyTypeObject *type, PyObject *attr_name, Nuitka_AttributeCache *cache )
+{
+    if ( type->tp_getattro == PyObject_GenericGetAttr && type->tp_dict != NULL )
+    {
+        // This also gives the type a version tag, if it can have one.
+        PyObject *descr = _PyType_Lookup( type, attr_name );
+
+        if ( PyType_HasFeature( type, Py_TPFLAGS_VALID_VERSION_TAG ) )
+        {
+            cache->type = type;
+            cache->version_tag = type->tp_version_tag;
+            cache->descr = descr;
+
+            return true;
+        }
+    }
+
+    return false;
+}
+
 extern PyObject *_python_str_plain___all__;
 
 void IMPORT_MODULE_STAR( PyObject *target, bool is_module, PyObject *module )
@@ -929,49 +1394,6 @@ void PRINT_NEW_LINE( void )
 
 #endif
 
-// We unstream some constant objects using the "cPickle" module function "loads"
-static PyObject *_module_cPickle = NULL;
-static PyObject *_module_cPickle_function_loads = NULL;
-
-void UNSTREAM_INIT()
-{
-#if PYTHON_VERSION < 300
-    _module_cPickle = PyImport_ImportModule( "cPickle" );
-#else
-    _module_cPickle = PyImport_ImportModule( "pickle" );
-#endif
-    assert( _module_cPickle );
-
-    _module_cPickle_function_loads = PyObject_GetAttrString( _module_cPickle, "loads" );
-    assert( _module_cPickle_function_loads );
-}
-
-PyObject *UNSTREAM_CONSTANT( char const *buffer, Py_ssize_t size )
-{
-    assert( buffer );
-    assert( _module_cPickle_function_loads );
-
-    PyObject *result = PyObject_CallFunction(
-        _module_cPickle_function_loads,
-#if PYTHON_VERSION < 300
-        (char *)"(s#)", // TODO: Why the ()
-#else
-        (char *)"y#",
-#endif
-        buffer,
-        size
-    );
-
-    if ( !result )
-    {
-        PyErr_Print();
-    }
-
-    assertObject( result );
-
-    return result;
-}
-
 PyObject *UNSTREAM_STRING( char const *buffer, Py_ssize_t size, bool intern )
 {
 #if PYTHON_VERSION < 300
@@ -1016,6 +1438,298 @@ PyObject *UNSTREAM_FLOAT( char const *buffer )
     return result;
 }
 
+// The built-in types that can be constants, in the order of
+// "constant_builtin_types" of Nuitka.
+static PyTypeObject *constant_builtin_types[] =
+{
+#if PYTHON_VERSION < 300
+    &PyInt_Type,
+    &PySet_Type,
+    &PyString_Type,
+    &PyFloat_Type,
+    &PyList_Type,
+    &PyTuple_Type,
+    &PyDict_Type,
+    &PyComplex_Type,
+    &PyUnicode_Type,
+    &PyLong_Type,
+    &PyInstance_Type
+#else
+    &PyLong_Type,
+    &PySet_Type,
+    &PyUnicode_Type,
+    &PyFloat_Type,
+    &PyList_Type,
+    &PyTuple_Type,
+    &PyDict_Type,
+    &PyComplex_Type,
+    &PyRange_Type,
+    &PyBytes_Type
+#endif
+};
+
+static Py_ssize_t unstreamSize( unsigned char const *&buffer )
+{
+    Py_ssize_t result = 0;
+    int shift = 0;
+
+    while ( true )
+    {
+        unsigned char value = *buffer++;
+
+        result |= (Py_ssize_t)( value & 0x7f ) << shift;
+
+        if ( ( value & 0x80 ) == 0 )
+        {
+            return result;
+        }
+
+        shift += 7;
+    }
+}
+
+static long unstreamSmallInt( unsigned char const *&buffer )
+{
+    Py_ssize_t value = unstreamSize( buffer );
+
+    if ( value & 1 )
+    {
+        return -(long)( value >> 1 ) - 1;
+    }
+    else
+    {
+        return (long)( value >> 1 );
+    }
+}
+
+static PyObject *unstreamLong( unsigned char const *&buffer )
+{
+    Py_ssize_t size = unstreamSize( buffer );
+
+    PyObject *result = _PyLong_FromByteArray( buffer, size, 1, 1 );
+    assertObject( result );
+
+    buffer += size;
+
+    return result;
+}
+
+// Decode one value of the constants blob, the counter part of the
+// "ConstantBlobWriter" of Nuitka, and return a new reference to it.
+static PyObject *unstreamObject( unsigned char const *&buffer, PyObject **const *slots )
+{
+    PyObject *result;
+
+    switch ( *buffer++ )
+    {
+        case 'r':
+        {
+            // A constant that was decoded before.
+            result = *slots[ unstreamSize( buffer ) ];
+            assertObject( result );
+
+            Py_INCREF( result );
+            return result;
+        }
+        case 'Z':
+            return INCREASE_REFCOUNT( Py_None );
+        case '1':
+            return INCREASE_REFCOUNT( Py_True );
+        case '0':
+            return INCREASE_REFCOUNT( Py_False );
+        case '.':
+            return INCREASE_REFCOUNT( Py_Ellipsis );
+        case 'Y':
+        {
+            Py_ssize_t index = unstreamSize( buffer );
+            assert( index < (Py_ssize_t)( sizeof( constant_builtin_types ) / sizeof( PyTypeObject * ) ) );
+
+            return INCREASE_REFCOUNT( (PyObject *)constant_builtin_types[ index ] );
+        }
+        case 'i':
+#if PYTHON_VERSION < 300
+            result = PyInt_FromLong( unstreamSmallInt( buffer ) );
+#else
+            result = PyLong_FromLong( unstreamSmallInt( buffer ) );
+#endif
+            break;
+        case 'l':
+            result = PyLong_FromLong( unstreamSmallInt( buffer ) );
+            break;
+        case 'I':
+        {
+            result = unstreamLong( buffer );
+
+#if PYTHON_VERSION < 300
+            // Becomes an "int" again, where it fits.
+            PyObject *value = result;
+            result = PyNumber_Int( value );
+            Py_DECREF( value );
+#endif
+            break;
+        }
+        case 'L':
+            result = unstreamLong( buffer );
+            break;
+        case 'd':
+            result = UNSTREAM_FLOAT( (char const *)buffer );
+            buffer += 8;
+            break;
+        case 'j':
+        {
+            double real = _PyFloat_Unpack8( (unsigned char *)buffer, 1 );
+            double imag = _PyFloat_Unpack8( (unsigned char *)buffer + 8, 1 );
+
+            result = PyComplex_FromDoubles( real, imag );
+            buffer += 16;
+            break;
+        }
+        case 's':
+        case 'a':
+        {
+            bool intern = buffer[ -1 ] == 'a';
+            Py_ssize_t size = unstreamSize( buffer );
+
+            result = UNSTREAM_STRING( (char const *)buffer, size, intern );
+            buffer += size;
+            break;
+        }
+        case 'u':
+        {
+            Py_ssize_t size = unstreamSize( buffer );
+
+#if PYTHON_VERSION < 300
+            result = PyUnicode_DecodeUTF8( (char const *)buffer, size, NULL );
+#else
+            result = PyUnicode_DecodeUTF8( (char const *)buffer, size, "surrogatepass" );
+#endif
+            buffer += size;
+            break;
+        }
+#if PYTHON_VERSION >= 300
+        case 'b':
+        {
+            Py_ssize_t size = unstreamSize( buffer );
+
+            result = PyBytes_FromStringAndSize( (char const *)buffer, size );
+            buffer += size;
+            break;
+        }
+        case 'R':
+        {
+            PyObject *start = unstreamObject( buffer, slots );
+            PyObject *stop = unstreamObject( buffer, slots );
+            PyObject *step = unstreamObject( buffer, slots );
+
+            result = PyObject_CallFunctionObjArgs( (PyObject *)&PyRange_Type, start, stop, step, NULL );
+
+            Py_DECREF( start );
+            Py_DECREF( stop );
+            Py_DECREF( step );
+            break;
+        }
+#endif
+        case '(':
+        {
+            Py_ssize_t size = unstreamSize( buffer );
+            result = PyTuple_New( size );
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyTuple_SET_ITEM( result, i, unstreamObject( buffer, slots ) );
+            }
+
+            break;
+        }
+        case '[':
+        {
+            Py_ssize_t size = unstreamSize( buffer );
+            result = PyList_New( size );
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyList_SET_ITEM( result, i, unstreamObject( buffer, slots ) );
+            }
+
+            break;
+        }
+        case '{':
+        {
+            Py_ssize_t size = unstreamSize( buffer );
+            result = PyDict_New();
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyObject *key = unstreamObject( buffer, slots );
+                PyObject *value = unstreamObject( buffer, slots );
+
+                int res = PyDict_SetItem( result, key, value );
+                assert( res == 0 );
+
+                Py_DECREF( key );
+                Py_DECREF( value );
+            }
+
+            break;
+        }
+        case 'S':
+        case 'P':
+        {
+            bool frozen = buffer[ -1 ] == 'P';
+            Py_ssize_t size = unstreamSize( buffer );
+            result = PySet_New( NULL );
+
+            for ( Py_ssize_t i = 0; i < size; i++ )
+            {
+                PyObject *element = unstreamObject( buffer, slots );
+
+                int res = PySet_Add( result, element );
+                assert( res == 0 );
+
+                Py_DECREF( element );
+            }
+
+            if ( frozen )
+            {
+                PyObject *value = result;
+                result = PyFrozenSet_New( value );
+                Py_DECREF( value );
+            }
+
+            break;
+        }
+        default:
+            assert( false );
+            abort();
+    }
+
+    if (unlikely( result == NULL ))
+    {
+        PyErr_Print();
+    }
+
+    assertObject( result );
+
+    return result;
+}
+
+// Create all constants from the blob in one pass, the n-th value is assigned
+// to the n-th slot.
+void UNSTREAM_CONSTANTS( unsigned char const *buffer, Py_ssize_t size, PyObject **const *slots )
+{
+    unsigned char const *end = buffer + size;
+
+    PyObject **const *slot = slots;
+
+    while ( buffer < end )
+    {
+        **slot++ = unstreamObject( buffer, slots );
+    }
+
+    assert( buffer == end );
+    assert( !ERROR_OCCURED() );
+}
+
 #if PYTHON_VERSION < 300
 
 static void set_slot( PyObject **slot, PyObject *value )
@@ -1225,6 +1939,11 @@ static PyObject *nuitka_class_getattr( PyClassObject *klass, PyObject *attr_name
 
 #endif
 
+#if PYTHON_VERSION < 330
+dict_lookup_func python_lookdict_string = NULL;
+dict_lookup_func python_lookdict = NULL;
+#endif
+
 void enhancePythonTypes( void )
 {
 #if PYTHON_VERSION < 300
@@ -1233,6 +1952,21 @@ void enhancePythonTypes( void )
     PyClass_Type.tp_setattro = (setattrofunc)nuitka_class_setattr;
     PyClass_Type.tp_getattro = (getattrofunc)nuitka_class_getattr;
 #endif
+
+#if PYTHON_VERSION < 330
+    // Find the lookup functions of CPython, to use them directly, and to
+    // track module dictionaries with them.
+    PyDictObject *sample = (PyDictObject *)PyDict_New();
+    python_lookdict_string = sample->ma_lookup;
+
+    // Using a non-string key, makes it use the general lookup function.
+    PyDict_SetItem( (PyObject *)sample, Py_None, Py_None );
+    python_lookdict = sample->ma_lookup;
+
+    Py_DECREF( sample );
+
+    assert( python_lookdict != python_lookdict_string );
+#endif
 }
 
 #ifdef __APPLE__
@@ -1925,3 +2659,52 @@ void _initBuiltinOriginalValues()
 #if PYTHON_VERSION >= 300
 volatile int _Py_Ticker = _Py_CheckInterval;
 #endif
+
+#if defined( _WIN32 )
+#include <windows.h>
+#else
+#include <sys/time.h>
+#endif
+
+// The time in micro seconds, that a thread may keep the GIL, while other
+// threads exist, before releasing it for them. Can be given at compile time,
+// the default is the one of CPython3.
+#ifndef _NUITKA_SWITCH_INTERVAL
+#define _NUITKA_SWITCH_INTERVAL 5000
+#endif
+
+static unsigned long long getClockMicroSeconds( void )
+{
+#if defined( _WIN32 )
+    return (unsigned long long)GetTickCount() * 1000;
+#else
+    struct timeval now;
+    gettimeofday( &now, NULL );
+
+    return (unsigned long long)now.tv_sec * 1000000 + now.tv_usec;
+#endif
+}
+
+static unsigned long long gil_acquired_time = 0;
+
+void NOTE_GIL_ACQUIRED( void )
+{
+    gil_acquired_time = getClockMicroSeconds();
+}
+
+// The GIL gives no indication, if another thread is waiting for it. So like
+// the "gil_drop_request" of CPython3, which waiting threads set after one
+// switch interval, a request is assumed, when other threads exist, and one
+// switch interval has passed, since the GIL was acquired.
+bool SHALL_RELEASE_GIL( PyThreadState *tstate )
+{
+    // Without other threads, nobody can be waiting.
+    if ( tstate->interp->tstate_head == tstate && tstate->next == NULL )
+    {
+        return false;
+    }
+
+    // Note: Should the clock have been set back, this is large, and the GIL
+    // gets released too.
+    return getClockMicroSeconds() - gil_acquired_time >= _NUITKA_SWITCH_INTERVAL;
+}
@@ -26,6 +26,12 @@ struct Nuitka_FrameObject
     PyFrameObject m_frame;
 };
 
+FrameStatistics frame_statistics = { 0, 0, 0, 0 };
+
+// Released frames, linked through their "f_back" member. The frames of all
+// compiled code objects can be used, as they are resized if necessary.
+static PyFrameObject *free_list = NULL;
+
 static PyMemberDef Nuitka_Frame_memberlist[] = {
     { (char *)"f_back", T_OBJECT, OFF( f_back ), READONLY | RESTRICTED },
     { (char *)"f_code", T_OBJECT, OFF( f_code ), READONLY | RESTRICTED },
@@ -205,7 +211,27 @@ static void Nuitka_Frame_tp_dealloc( Nuitka_FrameObject *nuitka_frame )
     Py_CLEAR( frame->f_exc_value );
     Py_CLEAR( frame->f_exc_traceback );
 
-    PyObject_GC_Del( nuitka_frame );
+    if ( frame_statistics.pooled < NUITKA_FRAME_FREE_LIST_SIZE )
+    {
+        frame->f_back = free_list;
+        free_list = frame;
+
+        frame_statistics.pooled += 1;
+    }
+    else
+    {
+        PyObject_GC_Del( nuitka_frame );
+    }
+
+#if _DEBUG_REFRAME
+    printf(
+        "Frames: %ld allocated, %ld reused, %ld missed, %ld pooled\n",
+        frame_statistics.allocated,
+        frame_statistics.reused,
+        frame_statistics.missed,
+        frame_statistics.pooled
+    );
+#endif
 
     Py_TRASHCAN_SAFE_END( nuitka_frame )
 }
@@ -351,11 +377,38 @@ PyFrameObject *MAKE_FRAME( PyCodeObject *code, PyObject *module )
     Py_ssize_t nfrees = PyTuple_GET_SIZE( code->co_freevars );
     Py_ssize_t extras = code->co_stacksize + code->co_nlocals + ncells + nfrees;
 
-    Nuitka_FrameObject *result = PyObject_GC_NewVar( Nuitka_FrameObject, &Nuitka_Frame_Type, extras );
+    Nuitka_FrameObject *result;
 
-    if (unlikely( result == NULL ))
+    if ( free_list != NULL )
     {
-        throw PythonException();
+        result = (Nuitka_FrameObject *)free_list;
+        free_list = free_list->f_back;
+
+        frame_statistics.pooled -= 1;
+        frame_statistics.reused += 1;
+
+        if (unlikely( Py_SIZE( result ) < extras ))
+        {
+            result = PyObject_GC_Resize( Nuitka_FrameObject, result, extras );
+
+            if (unlikely( result == NULL ))
+            {
+                throw PythonException();
+            }
+        }
+
+        _Py_NewReference( (PyObject *)result );
+    }
+    else
+    {
+        result = PyObject_GC_NewVar( Nuitka_FrameObject, &Nuitka_Frame_Type, extras );
+
+        if (unlikely( result == NULL ))
+        {
+            throw PythonException();
+        }
+
+        frame_statistics.allocated += 1;
     }
 
     PyFrameObject *frame = &result->m_frame;
@@ -424,6 +424,26 @@ static PyMethodDef Nuitka_Generator_methods[] =
 };
 
 
+// The inline context storage follows the function object, aligned for any
+// type the context may contain.
+static const size_t function_context_offset = ( sizeof( Nuitka_FunctionObject ) + 15 ) & ~15;
+
+// Cache for function objects, try to avoid malloc overhead. There is a list
+// for each size class of the inline context storage, which is rounded up to
+// these steps, so objects are only re-used for contexts of the same class.
+// Functions with larger contexts are not cached.
+static const size_t function_context_step = 16;
+static const size_t function_context_classes = 17;
+
+static Nuitka_FunctionObject *function_cache_heads[ function_context_classes ];
+static int function_cache_size = 0;
+static const int max_function_cache_size = 4096;
+
+static inline size_t getFunctionContextClass( size_t context_size )
+{
+    return ( context_size + function_context_step - 1 ) / function_context_step;
+}
+
 static void Nuitka_Function_tp_dealloc( Nuitka_FunctionObject *function )
 {
     Nuitka_GC_UnTrack( function );
@@ -452,7 +472,18 @@ static void Nuitka_Function_tp_dealloc( Nuitka_FunctionObject *function )
         function->m_cleanup( function->m_context );
     }
 
-    PyObject_GC_Del( function );
+    size_t context_class = getFunctionContextClass( function->m_context_capacity );
+
+    if (likely( context_class < function_context_classes && function_cache_size < max_function_cache_size ))
+    {
+        function->m_context = function_cache_heads[ context_class ];
+        function_cache_heads[ context_class ] = function;
+        function_cache_size += 1;
+    }
+    else
+    {
+        PyObject_GC_Del( function );
+    }
 }
 
 static const long tp_flags =
@@ -516,15 +547,57 @@ PyTypeObject Nuitka_Function_Type =
     0,                                              // tp_del
 };
 
+// Get a function object with room for an inline context of the given size,
+// from the cache if possible.
+static Nuitka_FunctionObject *allocateFunction( size_t context_size )
+{
+    size_t context_class = getFunctionContextClass( context_size );
+
+    Nuitka_FunctionObject *result = NULL;
+
+    if ( context_class < function_context_classes )
+    {
+        result = function_cache_heads[ context_class ];
+
+        // Allocate for the whole class, so it can be cached for it.
+        context_size = context_class * function_context_step;
+    }
+
+    if ( result != NULL )
+    {
+        assert( result->m_context_capacity == context_size );
+
+        function_cache_heads[ context_class ] = (Nuitka_FunctionObject *)result->m_context;
+        function_cache_size -= 1;
+
+        PyObject_INIT( result, &Nuitka_Function_Type );
+    }
+    else
+    {
+        result = (Nuitka_FunctionObject *)_PyObject_GC_Malloc(
+            context_size == 0 ? sizeof( Nuitka_FunctionObject ) : function_context_offset + context_size
+        );
+
+        if ( result != NULL )
+        {
+            PyObject_INIT( result, &Nuitka_Function_Type );
+
+            result->m_context_capacity = context_size;
+        }
+    }
+
+    return result;
+}
+
 #if PYTHON_VERSION < 300
-static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *module, PyObject *doc, void *context, releaser cleanup )
+static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *module, PyObject *doc, void *context, size_t context_size, releaser cleanup )
 #elif PYTHON_VERSION < 330
-static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, releaser cleanup )
+static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, size_t context_size, releaser cleanup )
 #else
-static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, releaser cleanup )
+static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, size_t context_size, releaser cleanup )
 #endif
 {
-    Nuitka_FunctionObject *result = PyObject_GC_New( Nuitka_FunctionObject, &Nuitka_Function_Type );
+    Nuitka_FunctionObject *result = allocateFunction( context_size );
 
     if (unlikely( result == NULL ))
     {
@@ -532,6 +605,12 @@ static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_par
         throw PythonException();
     }
 
+    if ( context_size != 0 )
+    {
+        assert( context == NULL );
+        context = (char *)result + function_context_offset;
+    }
+
     result->m_code = code;
     result->m_direct_arg_parser = dparse;
 
@@ -576,17 +655,17 @@ static inline PyObject *make_kfunction( function_arg_parser code, direct_arg_par
 #if PYTHON_VERSION < 300
 PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *module, PyObject *doc )
 {
-    return make_kfunction( fparse, dparse, name, code_object, defaults, module, doc, NULL, NULL );
+    return make_kfunction( fparse, dparse, name, code_object, defaults, module, doc, NULL, 0, NULL );
 }
 #elif PYTHON_VERSION < 330
 PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc )
 {
-    return make_kfunction( fparse, dparse, name, code_object, defaults, kwdefaults, annotations, module, doc, NULL, NULL );
+    return make_kfunction( fparse, dparse, name, code_object, defaults, kwdefaults, annotations, module, doc, NULL, 0, NULL );
 }
 #else
 PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc )
 {
-    return make_kfunction( fparse, dparse, name, qualname, code_object, defaults, kwdefaults, annotations, module, doc, NULL, NULL );
+    return make_kfunction( fparse, dparse, name, qualname, code_object, defaults, kwdefaults, annotations, module, doc, NULL, 0, NULL );
 }
 #endif
 
@@ -594,16 +673,34 @@ PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dpa
 #if PYTHON_VERSION < 300
 PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *module, PyObject *doc, void *context, releaser cleanup )
 {
-    return make_kfunction( fparse, dparse, name, code_object, defaults, module, doc, context, cleanup );
+    return make_kfunction( fparse, dparse, name, code_object, defaults, module, doc, context, 0, cleanup );
 }
 #elif PYTHON_VERSION < 330
 PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, releaser cleanup )
 {
-    return make_kfunction( fparse, dparse, name, code_object, defaults, kwdefaults, annotations, module, doc, context, cleanup );
+    return make_kfunction( fparse, dparse, name, code_object, defaults, kwdefaults, annotations, module, doc, context, 0, cleanup );
 }
 #else
 PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, void *context, releaser cleanup )
 {
-    return make_kfunction( fparse, dparse, name, qualname, code_object, defaults, kwdefaults, annotations, module, doc, context, cleanup );
+    return make_kfunction( fparse, dparse, name, qualname, code_object, defaults, kwdefaults, annotations, module, doc, context, 0, cleanup );
+}
+#endif
+
+// Make a function with context stored inline.
+#if PYTHON_VERSION < 300
+PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *module, PyObject *doc, size_t context_size, releaser cleanup )
+{
+    return make_kfunction( fparse, dparse, name, code_object, defaults, module, doc, NULL, context_size, cleanup );
+}
+#elif PYTHON_VERSION < 330
+PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, size_t context_size, releaser cleanup )
+{
+    return make_kfunction( fparse, dparse, name, code_object, defaults, kwdefaults, annotations, module, doc, NULL, context_size, cleanup );
+}
+#else
+PyObject *Nuitka_Function_New( function_arg_parser fparse, direct_arg_parser dparse, PyObject *name, PyObject *qualname, PyCodeObject *code_object, PyObject *defaults, PyObject *kwdefaults, PyObject *annotations, PyObject *module, PyObject *doc, size_t context_size, releaser cleanup )
+{
+    return make_kfunction( fparse, dparse, name, qualname, code_object, defaults, kwdefaults, annotations, module, doc, NULL, context_size, cleanup );
 }
 #endif
@@ -67,10 +67,20 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
 
         if ( generator->m_status == status_Unused )
         {
-            generator->m_status = status_Running;
+            // Prepare the generator context to run, stackless generators run
+            // on the stack of their caller instead.
+            if (unlikely( !generator->m_stackless && !prepareFiber( &generator->m_yielder_context, generator->m_code, (unsigned long)generator ) ))
+            {
+#if PYTHON_VERSION < 300
+                Py_XDECREF( saved_exception_type );
+                Py_XDECREF( saved_exception_value );
+                Py_XDECREF( saved_exception_traceback );
+#endif
+                PyErr_NoMemory();
+                return NULL;
+            }
 
-            // Prepare the generator context to run. TODO: Make stack size rational.
-            prepareFiber( &generator->m_yielder_context, generator->m_code, (unsigned long)generator );
+            generator->m_status = status_Running;
         }
 
         generator->m_yielded = value;
@@ -101,7 +111,14 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         // Continue the yielder function while preventing recursion.
         generator->m_running = true;
 
-        swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+        if ( generator->m_stackless )
+        {
+            generator->m_yielded = ((resumable_func)generator->m_code)( generator );
+        }
+        else
+        {
+            swapFiber( &generator->m_caller_context, &generator->m_yielder_context );
+        }
 
         generator->m_running = false;
 
@@ -118,6 +135,10 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         {
             generator->m_status = status_Finished;
 
+            // The generator will never be resumed again, so its stack can be
+            // given back already, instead of waiting for the object to die.
+            releaseFiber( &generator->m_yielder_context );
+
             Py_XDECREF( generator->m_frame );
             generator->m_frame = NULL;
 
@@ -139,7 +160,14 @@ static PyObject *Nuitka_Generator_send( Nuitka_GeneratorObject *generator, PyObj
         else
         {
 #if PYTHON_VERSION < 300
-            _SET_CURRENT_EXCEPTION( saved_exception_type, saved_exception_value, saved_exception_traceback );
+            // Restoring is expensive, as it updates "sys" too, so only do it
+            // if the generator changed the exception at all.
+            if ( saved_exception_type != thread_state->exc_type ||
+                 saved_exception_value != thread_state->exc_value ||
+                 (PyObject *)saved_exception_traceback != thread_state->exc_traceback )
+            {
+                _SET_CURRENT_EXCEPTION( saved_exception_type, saved_exception_value, saved_exception_traceback );
+            }
 
             Py_XDECREF( saved_exception_type );
             Py_XDECREF( saved_exception_value );
@@ -195,6 +223,11 @@ static PyObject *Nuitka_Generator_close( Nuitka_GeneratorObject *generator, PyOb
     return INCREASE_REFCOUNT( Py_None );
 }
 
+// Cache for generator objects, try to avoid malloc overhead.
+static Nuitka_GeneratorObject *generator_cache_head = NULL;
+static int generator_cache_size = 0;
+static const int max_generator_cache_size = 4096;
+
 static void Nuitka_Generator_tp_dealloc( Nuitka_GeneratorObject *generator )
 {
     assert( Py_REFCNT( generator ) == 0 );
@@ -233,7 +266,16 @@ static void Nuitka_Generator_tp_dealloc( Nuitka_GeneratorObject *generator )
 
     Py_XDECREF( generator->m_frame );
 
-    PyObject_GC_Del( generator );
+    if (likely( generator_cache_size < max_generator_cache_size ))
+    {
+        generator->m_context = generator_cache_head;
+        generator_cache_head = generator;
+        generator_cache_size += 1;
+    }
+    else
+    {
+        PyObject_GC_Del( generator );
+    }
 }
 
 static PyObject *Nuitka_Generator_throw( Nuitka_GeneratorObject *generator, PyObject *args )
@@ -426,9 +468,21 @@ PyTypeObject Nuitka_Generator_Type =
     0                                                // tp_del
 };
 
-PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup )
+static PyObject *_Nuitka_Generator_New( void *code, bool stackless, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup )
 {
-    Nuitka_GeneratorObject *result = PyObject_GC_New( Nuitka_GeneratorObject, &Nuitka_Generator_Type );
+    Nuitka_GeneratorObject *result = generator_cache_head;
+
+    if ( result != NULL )
+    {
+        generator_cache_head = (Nuitka_GeneratorObject *)generator_cache_head->m_context;
+        generator_cache_size -= 1;
+
+        PyObject_INIT( result, &Nuitka_Generator_Type );
+    }
+    else
+    {
+        result = PyObject_GC_New( Nuitka_GeneratorObject, &Nuitka_Generator_Type );
+    }
 
     if (unlikely( result == NULL ))
     {
@@ -441,7 +495,10 @@ PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject
         throw PythonException();
     }
 
-    result->m_code = (void *)code;
+    result->m_code = code;
+
+    result->m_stackless = stackless;
+    result->m_resume_point = 0;
 
     result->m_name = INCREASE_REFCOUNT( name );
 
@@ -465,7 +522,22 @@ PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject
     return (PyObject *)result;
 }
 
+PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup )
+{
+    return _Nuitka_Generator_New( (void *)code, false, name, code_object, context, cleanup );
+}
+
 PyObject *Nuitka_Generator_New( yielder_func code, PyObject *name, PyCodeObject *code_object )
 {
     return Nuitka_Generator_New( code, name, code_object, NULL, NULL );
 }
+
+PyObject *Nuitka_Generator_New( resumable_func code, PyObject *name, PyCodeObject *code_object, void *context, releaser cleanup )
+{
+    return _Nuitka_Generator_New( (void *)code, true, name, code_object, context, cleanup );
+}
+
+PyObject *Nuitka_Generator_New( resumable_func code, PyObject *name, PyCodeObject *code_object )
+{
+    return Nuitka_Generator_New( code, name, code_object, NULL, NULL );
+}
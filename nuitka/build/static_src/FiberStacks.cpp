@@ -0,0 +1,143 @@
+//     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// Pool of stacks for the ucontext based fiber implementations, shared by the
+// x64, ARM and generic variants.
+//
+// The stacks are mapped from the operating system rather than taken from the
+// heap, so that only pages actually touched by a generator count towards the
+// resident memory, and each one gets a guard page below it, so a stack overflow
+// crashes instead of silently corrupting a neighbour. Released stacks are kept
+// in a bounded free list, to avoid the mmap/munmap churn of generators being
+// created and finished in a loop.
+
+#include "nuitka/prelude.hpp"
+
+#include <sys/mman.h>
+#include <unistd.h>
+
+#if !defined( MAP_ANONYMOUS ) && defined( MAP_ANON )
+#define MAP_ANONYMOUS MAP_ANON
+#endif
+
+#ifndef MAP_STACK
+#define MAP_STACK 0
+#endif
+
+#ifndef MAP_NORESERVE
+#define MAP_NORESERVE 0
+#endif
+
+FiberStackStatistics fiber_stack_statistics = { 0, 0, 0, 0 };
+
+static void *stack_pool[ NUITKA_FIBER_STACK_POOL_SIZE ];
+
+static size_t getGuardSize()
+{
+    static size_t guard_size = 0;
+
+    if ( guard_size == 0 )
+    {
+        long page_size = sysconf( _SC_PAGESIZE );
+
+        guard_size = page_size > 0 ? (size_t)page_size : 4096;
+    }
+
+    return guard_size;
+}
+
+void *allocateFiberStack()
+{
+    void *result;
+
+    if ( fiber_stack_statistics.pooled > 0 )
+    {
+        fiber_stack_statistics.pooled -= 1;
+        result = stack_pool[ fiber_stack_statistics.pooled ];
+    }
+    else
+    {
+        size_t guard_size = getGuardSize();
+
+        void *mapping = mmap(
+            NULL,
+            NUITKA_FIBER_STACK_SIZE + guard_size,
+            PROT_READ | PROT_WRITE,
+            MAP_PRIVATE | MAP_ANONYMOUS | MAP_NORESERVE | MAP_STACK,
+            -1,
+            0
+        );
+
+        if (unlikely( mapping == MAP_FAILED ))
+        {
+            return NULL;
+        }
+
+        // The stacks grow downwards on all supported targets, so the guard page
+        // is put at the start of the mapping. Without it, a stack overflow
+        // would corrupt memory silently, so better fail.
+        if (unlikely( mprotect( mapping, guard_size, PROT_NONE ) != 0 ))
+        {
+            munmap( mapping, NUITKA_FIBER_STACK_SIZE + guard_size );
+
+            return NULL;
+        }
+
+        fiber_stack_statistics.allocated += 1;
+
+        result = (char *)mapping + guard_size;
+    }
+
+    fiber_stack_statistics.live += 1;
+
+    if ( fiber_stack_statistics.live > fiber_stack_statistics.peak_live )
+    {
+        fiber_stack_statistics.peak_live = fiber_stack_statistics.live;
+    }
+
+    return result;
+}
+
+void releaseFiberStack( void *stack )
+{
+    assert( stack != NULL );
+    assert( fiber_stack_statistics.live > 0 );
+
+    fiber_stack_statistics.live -= 1;
+
+    if ( fiber_stack_statistics.pooled < NUITKA_FIBER_STACK_POOL_SIZE )
+    {
+        stack_pool[ fiber_stack_statistics.pooled ] = stack;
+        fiber_stack_statistics.pooled += 1;
+    }
+    else
+    {
+        size_t guard_size = getGuardSize();
+
+        munmap( (char *)stack - guard_size, NUITKA_FIBER_STACK_SIZE + guard_size );
+    }
+
+#if _DEBUG_FIBERS
+    printf(
+        "Fiber stacks: %ld live, %ld pooled, %ld peak live, %ld mapped in total\n",
+        fiber_stack_statistics.live,
+        fiber_stack_statistics.pooled,
+        fiber_stack_statistics.peak_live,
+        fiber_stack_statistics.allocated
+    );
+#endif
+}
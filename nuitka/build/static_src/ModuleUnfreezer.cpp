@@ -30,6 +30,83 @@ PyObject *loader_frozen_modules = NULL;
 
 static struct _inittab *frozen_modules = NULL;
 
+// Hash index of the frozen modules by their names, with open addressing, made
+// when first looking for a module. Most lookups are for modules that are not
+// embedded, which then do not compare with all names.
+static struct _inittab **frozen_modules_index = NULL;
+static size_t frozen_modules_index_mask = 0;
+
+static size_t _hashModuleName( char const *name )
+{
+    // FNV-1a hash, of the bytes of the name.
+    size_t result = 2166136261U;
+
+    for ( ; *name != 0; name++ )
+    {
+        result ^= (unsigned char)*name;
+        result *= 16777619U;
+    }
+
+    return result;
+}
+
+static void _makeFrozenModulesIndex( void )
+{
+    size_t count = 0;
+
+    for ( struct _inittab *current = frozen_modules; current->name != NULL; current++ )
+    {
+        count += 1;
+    }
+
+    // Keep it at most half full, so the probing stays short.
+    size_t size = 8;
+
+    while ( size < 2 * count )
+    {
+        size *= 2;
+    }
+
+    frozen_modules_index = (struct _inittab **)calloc( size, sizeof( struct _inittab * ) );
+    assert( frozen_modules_index );
+
+    frozen_modules_index_mask = size - 1;
+
+    for ( struct _inittab *current = frozen_modules; current->name != NULL; current++ )
+    {
+        size_t slot = _hashModuleName( current->name ) & frozen_modules_index_mask;
+
+        while ( frozen_modules_index[ slot ] != NULL )
+        {
+            slot = ( slot + 1 ) & frozen_modules_index_mask;
+        }
+
+        frozen_modules_index[ slot ] = current;
+    }
+}
+
+static struct _inittab *findFrozenModule( char const *name )
+{
+    if (unlikely( frozen_modules_index == NULL ))
+    {
+        _makeFrozenModulesIndex();
+    }
+
+    size_t slot = _hashModuleName( name ) & frozen_modules_index_mask;
+
+    while ( frozen_modules_index[ slot ] != NULL )
+    {
+        if ( strcmp( name, frozen_modules_index[ slot ]->name ) == 0 )
+        {
+            return frozen_modules_index[ slot ];
+        }
+
+        slot = ( slot + 1 ) & frozen_modules_index_mask;
+    }
+
+    return NULL;
+}
+
 static char *_kwlist[] = {
     (char *)"fullname",
     (char *)"unused", NULL
@@ -60,16 +137,9 @@ static PyObject *_path_unfreezer_find_module( PyObject *self, PyObject *args, Py
     printf( "Looking for module '%s'...\n", name );
 #endif
 
-    struct _inittab *current = frozen_modules;
-
-    while ( current->name != NULL )
+    if ( findFrozenModule( name ) != NULL )
     {
-       if ( strcmp( name, current->name ) == 0 )
-       {
-           return INCREASE_REFCOUNT( loader_frozen_modules );
-       }
-
-       current++;
+        return INCREASE_REFCOUNT( loader_frozen_modules );
     }
 
 #if _DEBUG_UNFREEZER
@@ -103,38 +173,33 @@ static PyObject *_path_unfreezer_load_module( PyObject *self, PyObject *args, Py
 
     char *name = Nuitka_String_AsString( module_name );
 
-    struct _inittab *current = frozen_modules;
+    struct _inittab *current = findFrozenModule( name );
 
-    while ( current->name != NULL )
+    if ( current != NULL )
     {
-       if ( strcmp( name, current->name ) == 0 )
-       {
 #if _DEBUG_UNFREEZER
-           printf( "Loading %s\n", name );
+        printf( "Loading %s\n", name );
 #endif
 
-           // Check prelude on why this is necessary.
+        // Check prelude on why this is necessary.
 #if PYTHON_VERSION < 300
-           current->python_initfunc();
+        current->python_initfunc();
 #else
-           current->initfunc();
+        current->initfunc();
 #endif
 
-           if (unlikely( ERROR_OCCURED() ))
-           {
-               return NULL;
-           }
+        if (unlikely( ERROR_OCCURED() ))
+        {
+            return NULL;
+        }
 
-           PyObject *sys_modules = PySys_GetObject( (char *)"modules" );
+        PyObject *sys_modules = PySys_GetObject( (char *)"modules" );
 
 #if _DEBUG_UNFREEZER
-           printf( "Loaded %s\n", name );
+        printf( "Loaded %s\n", name );
 #endif
 
-           return LOOKUP_SUBSCRIPT( sys_modules, module_name );
-       }
-
-       current++;
+        return LOOKUP_SUBSCRIPT( sys_modules, module_name );
     }
 
     assert( false );
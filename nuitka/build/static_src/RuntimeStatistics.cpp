@@ -0,0 +1,111 @@
+//     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+// The "__nuitka__" module, to give programs the counters of the run time, e.g.
+// how often frames were re-used, so they can be looked at in normal builds.
+//
+// With several extension modules in one process, each has a run time of its
+// own, and the module shows the counters of the first one loaded.
+
+#include "nuitka/prelude.hpp"
+
+static PyObject *_nuitka_getFrameStatistics( PyObject *self, PyObject *args )
+{
+    return Py_BuildValue(
+        "{s:l,s:l,s:l,s:l}",
+        "allocated", frame_statistics.allocated,
+        "reused", frame_statistics.reused,
+        "missed", frame_statistics.missed,
+        "pooled", frame_statistics.pooled
+    );
+}
+
+#if !defined( _WIN32 )
+static PyObject *_nuitka_getFiberStackStatistics( PyObject *self, PyObject *args )
+{
+    return Py_BuildValue(
+        "{s:l,s:l,s:l,s:l}",
+        "live", fiber_stack_statistics.live,
+        "pooled", fiber_stack_statistics.pooled,
+        "peak_live", fiber_stack_statistics.peak_live,
+        "allocated", fiber_stack_statistics.allocated
+    );
+}
+#endif
+
+static PyMethodDef _nuitka_module_methods[] =
+{
+    {
+        "getFrameStatistics",
+        (PyCFunction)_nuitka_getFrameStatistics,
+        METH_NOARGS,
+        "Counters of frames allocated, re-used from the free list, kept in it, and missed cached frames."
+    },
+#if !defined( _WIN32 )
+    {
+        "getFiberStackStatistics",
+        (PyCFunction)_nuitka_getFiberStackStatistics,
+        METH_NOARGS,
+        "Counters of generator stacks in use, kept in the pool, the most in use at once, and mapped in total."
+    },
+#endif
+    { NULL, NULL, 0, NULL }
+};
+
+#if PYTHON_VERSION >= 300
+static struct PyModuleDef _nuitka_module_def =
+{
+    PyModuleDef_HEAD_INIT,
+    "__nuitka__",
+    NULL,
+    -1,
+    _nuitka_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+#endif
+
+void registerStatisticsModule()
+{
+    PyObject *sys_modules = PyImport_GetModuleDict();
+
+    if ( PyDict_GetItemString( sys_modules, "__nuitka__" ) != NULL )
+    {
+        return;
+    }
+
+#if PYTHON_VERSION < 300
+    // Adds it to "sys.modules" too, the result is a borrowed reference.
+    PyObject *module = Py_InitModule4(
+        (char *)"__nuitka__",
+        _nuitka_module_methods,
+        NULL,
+        NULL,
+        PYTHON_API_VERSION
+    );
+
+    assertObject( module );
+#else
+    PyObject *module = PyModule_Create( &_nuitka_module_def );
+    assertObject( module );
+
+    PyDict_SetItemString( sys_modules, "__nuitka__", module );
+    Py_DECREF( module );
+#endif
+}
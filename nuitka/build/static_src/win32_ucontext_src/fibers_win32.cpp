@@ -36,12 +36,14 @@ void initFiber( Fiber *to )
     to->fiber = NULL;
 }
 
-void prepareFiber( Fiber *to, void *code, unsigned long arg )
+bool prepareFiber( Fiber *to, void *code, unsigned long arg )
 {
     assert( to );
     assert( code );
 
     to->fiber = CreateFiber( STACK_SIZE, (LPFIBER_START_ROUTINE)code, (LPVOID)arg );
+
+    return to->fiber != NULL;
 }
 
 void releaseFiber( Fiber *to )
@@ -19,12 +19,6 @@
 
 #include "nuitka/prelude.hpp"
 
-#define STACK_SIZE (1024*1024)
-
-// Keep one stack around to avoid the overhead of repeated malloc/free in
-// case of frequent instantiations in a loop.
-static void *last_stack = NULL;
-
 void initFiber( Fiber *to )
 {
     to->f_context.uc_stack.ss_sp = NULL;
@@ -32,28 +26,33 @@ void initFiber( Fiber *to )
     to->start_stack = NULL;
 }
 
-void prepareFiber( Fiber *to, void *code, unsigned long arg )
+bool prepareFiber( Fiber *to, void *code, unsigned long arg )
 {
     int res = getcontext( &to->f_context );
     assert( res == 0 );
 
-    to->f_context.uc_stack.ss_size = STACK_SIZE;
-    to->f_context.uc_stack.ss_sp = last_stack ? last_stack : malloc( STACK_SIZE );
-    to->start_stack = to->f_context.uc_stack.ss_sp;
+    // The stacks are pooled, see "FiberStacks.cpp" for details.
+    to->start_stack = allocateFiberStack();
+
+    if (unlikely( to->start_stack == NULL ))
+    {
+        return false;
+    }
+
+    to->f_context.uc_stack.ss_size = NUITKA_FIBER_STACK_SIZE;
+    to->f_context.uc_stack.ss_sp = (char *)to->start_stack;
     to->f_context.uc_link = NULL;
-    last_stack = NULL;
 
     makecontext( &to->f_context, (void (*)())code, 1, (unsigned long)arg );
+
+    return true;
 }
 
 void releaseFiber( Fiber *to )
 {
-    if ( last_stack == NULL )
-    {
-        last_stack = to->start_stack;
-    }
-    else
+    if ( to->start_stack != NULL )
     {
-        free( to->start_stack );
+        releaseFiberStack( to->start_stack );
+        to->start_stack = NULL;
     }
 }
@@ -20,6 +20,11 @@ from . import CodeTemplates
 
 from .Identifiers import Identifier
 
+from .ParameterParsing import (
+    getDirectFunctionEntryPointIdentifier,
+    getParameterEntryPointIdentifier
+)
+
 def getCallCodeNoArgs( called_identifier ):
     return Identifier(
         "CALL_FUNCTION_NO_ARGS( %(function)s )" % {
@@ -47,6 +52,118 @@ def getCallCodePosArgsQuick( context, order_relevance, called_identifier,
     )
 
 
+def getCallCodeModuleFunction( context, order_relevance, called_identifier,
+                               function_identifier, arguments ):
+    """ Call a function of the module, with the implementation known.
+
+        The helper checks that the called value still is that function, and
+        then passes the arguments to the implementation, without any parameter
+        parsing, or else makes a normal call.
+    """
+
+    helper = "CALL_MODULE_FUNCTION_" + function_identifier
+
+    if not context.hasHelperCode( helper ):
+        args_decl = "".join(
+            ", PyObject *arg%d" % d
+            for d in range( len( arguments ) )
+        )
+
+        if arguments:
+            quick_calls_used.add( len( arguments ) )
+
+            fallback_call = "CALL_FUNCTION_WITH_ARGS( called%s )" % "".join(
+                ", arg%d" % d
+                for d in range( len( arguments ) )
+            )
+        else:
+            fallback_call = "CALL_FUNCTION_NO_ARGS( called )"
+
+        context.addDeclaration(
+            helper,
+            CodeTemplates.template_call_module_function_decl % {
+                "function_identifier" : function_identifier,
+                "args_decl"           : args_decl
+            }
+        )
+
+        context.addHelperCode(
+            helper,
+            CodeTemplates.template_call_module_function_impl % {
+                "function_identifier"       : function_identifier,
+                "args_decl"                 : args_decl,
+                "parse_function_identifier" : getParameterEntryPointIdentifier(
+                    function_identifier = function_identifier
+                ),
+                "impl_function_identifier"  : getDirectFunctionEntryPointIdentifier(
+                    function_identifier = function_identifier
+                ),
+                "args_forward"              : "".join(
+                    ", INCREASE_REFCOUNT( arg%d )" % d
+                    for d in range( len( arguments ) )
+                ),
+                "fallback_call"             : fallback_call
+            }
+        )
+
+    from .OrderedEvaluation import getOrderRelevanceEnforcedArgsCode
+
+    return getOrderRelevanceEnforcedArgsCode(
+        helper          = helper,
+        export_ref      = 0,
+        ref_count       = 1,
+        tmp_scope       = "call",
+        order_relevance = order_relevance,
+        args            = [ called_identifier ] + arguments,
+        context         = context
+    )
+
+method_calls_used = set()
+
+def getCallCodeMethod( context, order_relevance, source_identifier,
+                       attribute, arguments ):
+    """ Call an attribute of an object with positional arguments only.
+
+        The attribute is looked up into a keeper first, which for functions
+        of the type keeps the object instead of a bound method, to pass it as
+        the first argument. The arguments are only evaluated after the lookup.
+    """
+
+    method_calls_used.add( len( arguments ) )
+
+    if arguments:
+        quick_calls_used.add( len( arguments ) )
+
+    keeper_name = "method%d" % context.allocateCallTempNumber()
+    context.addMethodKeeperUsage( keeper_name )
+
+    lookup_code = "%s.lookup( %s, %s, &%s )" % (
+        keeper_name,
+        source_identifier.getCodeTemporaryRef(),
+        attribute.getCodeTemporaryRef(),
+        context.allocateAttributeCache()
+    )
+
+    from .OrderedEvaluation import getOrderRelevanceEnforcedArgsCode
+
+    call_code = getOrderRelevanceEnforcedArgsCode(
+        helper          = "CALL_METHOD_WITH_ARGS"
+                            if arguments else
+                          "CALL_METHOD_NO_ARGS",
+        export_ref      = 0,
+        ref_count       = None,
+        tmp_scope       = "call",
+        order_relevance = order_relevance,
+        args            = arguments,
+        context         = context,
+        prefix_args     = [ keeper_name ]
+    )
+
+    return Identifier(
+        "( %s, %s )" % ( lookup_code, call_code ),
+        1
+    )
+
 def getCallCodePosArgs( context, order_relevance, called_identifier,
                         argument_tuple ):
     from .OrderedEvaluation import getOrderRelevanceEnforcedArgsCode
@@ -119,4 +236,32 @@ def getCallsCode():
             }
         )
 
+    for method_call_used in sorted( method_calls_used ):
+        args_list = [
+            "arg%d" % d
+            for d in range( method_call_used )
+        ]
+
+        if method_call_used:
+            helper = "CALL_METHOD_WITH_ARGS"
+            fallback_call = "CALL_FUNCTION_WITH_ARGS( called, %s )" % (
+                ", ".join( args_list )
+            )
+        else:
+            helper = "CALL_METHOD_NO_ARGS"
+            fallback_call = "CALL_FUNCTION_NO_ARGS( called )"
+
+        result.append(
+            CodeTemplates.template_call_method_impl % {
+                "helper"        : helper,
+                "args_decl"     : "".join(
+                    ", PyObject *%s" % arg for arg in args_list
+                ),
+                "args_list"     : "".join(
+                    ", %s" % arg for arg in args_list
+                ),
+                "fallback_call" : fallback_call
+            }
+        )
+
     return "\n".join( result )
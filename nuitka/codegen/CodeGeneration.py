@@ -29,6 +29,10 @@ language syntax.
 from . import (
     Generator,
     Contexts,
+    CallCodes,
+    TupleCodes,
+    ListCodes,
+    DictCodes
 )
 
 from nuitka import (
@@ -438,6 +442,11 @@ def generateOperationCode( operator, operands, context ):
             expressions  = operands,
             context      = context
         ),
+        type_shapes     = [
+            operand.getTypeShape()
+            for operand in
+            operands
+        ],
         context         = context
     )
 
@@ -574,7 +583,7 @@ def decideSlicing( lower, upper ):
            ( lower is None or lower.isIndexable() ) and \
            ( upper is None or upper.isIndexable() )
 
-def generateSubscriptLookupCode( expression, context ):
+def generateSubscriptLookupCode( expression, context, no_throw = False ):
     return Generator.getSubscriptLookupCode(
         order_relevance = getOrderRelevance(
             ( expression.getLookupSource(), expression.getSubscript() )
@@ -587,6 +596,7 @@ def generateSubscriptLookupCode( expression, context ):
             expression = expression.getLookupSource(),
             context    = context
         ),
+        no_throw        = no_throw,
         context         = context
     )
 
@@ -667,6 +677,63 @@ def generateSliceLookupCode( expression, context ):
                 context         = context
             )
 
+def _getModuleFunctionCalled( call_node, arg_count ):
+    """ The function body called, if it is a module function only assigned by
+        its "def" and accepting exactly the given number of arguments.
+
+    """
+    called = call_node.getCalled()
+
+    if not called.isExpressionVariableRef():
+        return None
+
+    variable = called.getVariable()
+
+    while variable.isModuleVariableReference():
+        variable = variable.getReferenced()
+
+    if not variable.isModuleVariable():
+        return None
+
+    function_body = variable.getDefinedFunction()
+
+    if function_body is None or \
+       function_body.getParentModule() is not call_node.getParentModule():
+        return None
+
+    parameters = function_body.getParameters()
+
+    if parameters.hasNestedParameterVariables() or \
+       parameters.getListStarArgVariable() is not None or \
+       parameters.getDictStarArgVariable() is not None or \
+       parameters.getKwOnlyParameterCount() > 0:
+        return None
+
+    if len( parameters.getVariables() ) != arg_count:
+        return None
+
+    return function_body
+
+def _generateCallCodePosArgsQuick( call_node, order_relevance,
+                                   called_identifier, arguments, context ):
+    function_body = _getModuleFunctionCalled( call_node, len( arguments ) )
+
+    if function_body is not None:
+        return Generator.getCallCodeModuleFunction(
+            order_relevance     = order_relevance,
+            called_identifier   = called_identifier,
+            function_identifier = function_body.getCodeName(),
+            arguments           = arguments,
+            context             = context
+        )
+    else:
+        return Generator.getCallCodePosArgsQuick(
+            order_relevance   = order_relevance,
+            called_identifier = called_identifier,
+            arguments         = arguments,
+            context           = context
+        )
+
 def generateCallCode( call_node, context ):
     called_identifier = generateExpressionCode(
         expression = call_node.getCalled(),
@@ -689,15 +756,17 @@ def generateCallCode( call_node, context ):
 
     if argument_dictionary is None:
         if call_args.isExpressionConstantRef() and \
-           call_args.getConstant() == ():
+           call_args.getConstant() == () and \
+           _getModuleFunctionCalled( call_node, 0 ) is None:
             return Generator.getCallCodeNoArgs(
                 called_identifier = called_identifier
             )
         elif call_args.isExpressionMakeTuple() and \
              call_args.getIterationLength() <= 5:
-            return Generator.getCallCodePosArgsQuick(
-               order_relevance   = getOrderRelevance(
-                   ( call_node.getCalled(), ) + call_args.getElements(),
+            return _generateCallCodePosArgsQuick(
+                call_node         = call_node,
+                order_relevance   = getOrderRelevance(
+                    ( call_node.getCalled(), ) + call_args.getElements(),
                 ),
                 called_identifier = called_identifier,
                 arguments         = generateExpressionsCode(
@@ -709,7 +778,8 @@ def generateCallCode( call_node, context ):
         elif call_args.isExpressionConstantRef() and \
              len( call_args.getConstant() ) <= 5:
 
-            return Generator.getCallCodePosArgsQuick(
+            return _generateCallCodePosArgsQuick(
+                call_node         = call_node,
                 order_relevance   =
                    ( call_node.isOrderRelevant(), ) + ( None, ) * len( call_args.getConstant() ),
 
@@ -764,6 +834,63 @@ def generateCallCode( call_node, context ):
                 context             = context
             )
 
+def generateMethodCallCode( call_node, context ):
+    source_identifier = generateExpressionCode(
+        expression = call_node.getLookupSource(),
+        context    = context
+    )
+
+    attribute = Generator.getConstantHandle(
+        context  = context,
+        constant = call_node.getAttributeName()
+    )
+
+    call_args = call_node.getCallArgs()
+
+    if call_args.isExpressionMakeTuple() and \
+       call_args.getIterationLength() <= 5:
+        order_relevance = getOrderRelevance( call_args.getElements() )
+        arguments = generateExpressionsCode(
+            expressions = call_args.getElements(),
+            context     = context
+        )
+    elif call_args.isExpressionConstantRef() and \
+         len( call_args.getConstant() ) <= 5:
+        order_relevance = ( None, ) * len( call_args.getConstant() )
+        arguments = [
+            Generator.getConstantHandle(
+                constant = element,
+                context  = context
+            )
+            for element in
+            call_args.getConstant()
+        ]
+    else:
+        return Generator.getCallCodePosArgs(
+            order_relevance   = (
+                True,
+                call_args.isOrderRelevant()
+            ),
+            called_identifier = Generator.getAttributeLookupCode(
+                attribute = attribute,
+                source    = source_identifier,
+                context   = context
+            ),
+            argument_tuple    = generateExpressionCode(
+                expression = call_args,
+                context    = context
+            ),
+            context           = context
+        )
+
+    return Generator.getCallCodeMethod(
+        order_relevance   = order_relevance,
+        source_identifier = source_identifier,
+        attribute         = attribute,
+        arguments         = arguments,
+        context           = context
+    )
+
 
 def _decideLocalsMode( provider ):
     # TODO: This information should be in the node instead, and not decided
@@ -910,6 +1037,11 @@ def generateExpressionCode( expression, context, allow_none = False ):
             call_node = expression,
             context   = context
         )
+    elif expression.isExpressionCallMethod():
+        identifier = generateMethodCallCode(
+            call_node = expression,
+            context   = context
+        )
     elif expression.isExpressionFunctionCall():
         identifier = generateFunctionCallCode(
             call_node = expression,
@@ -917,6 +1049,7 @@ def generateExpressionCode( expression, context, allow_none = False ):
         )
     elif expression.isExpressionAttributeLookup():
         identifier = Generator.getAttributeLookupCode(
+            context   = context,
             attribute = Generator.getConstantHandle(
                 context  = context,
                 constant = expression.getAttributeName()
@@ -1058,6 +1191,29 @@ def generateExpressionCode( expression, context, allow_none = False ):
             step            = makeExpressionCode( expression.getStep() ),
             context         = context
         )
+    elif expression.isExpressionBuiltinIterRange1():
+        identifier = Generator.getBuiltinIterRange1Code(
+            value = makeExpressionCode( expression.getLow() )
+        )
+    elif expression.isExpressionBuiltinIterRange2():
+        identifier = Generator.getBuiltinIterRange2Code(
+            order_relevance = getOrderRelevance(
+                expression.getVisitableNodes()
+            ),
+            low             = makeExpressionCode( expression.getLow() ),
+            high            = makeExpressionCode( expression.getHigh() ),
+            context         = context
+        )
+    elif expression.isExpressionBuiltinIterRange3():
+        identifier = Generator.getBuiltinIterRange3Code(
+            order_relevance = getOrderRelevance(
+                expression.getVisitableNodes()
+            ),
+            low             = makeExpressionCode( expression.getLow() ),
+            high            = makeExpressionCode( expression.getHigh() ),
+            step            = makeExpressionCode( expression.getStep() ),
+            context         = context
+        )
     elif expression.isExpressionBuiltinGlobals():
         identifier = Generator.getLoadGlobalsCode(
             context = context
@@ -1494,6 +1650,43 @@ def generateAssignmentVariableCode( variable_ref, value, context ):
         context    = context
     )
 
+def _isLocalVariableSumAssignment( statement ):
+    """ Is this "var += value" or "var = var + value" for a local variable.
+
+        These are done with the variable storage, so that strings only it
+        references can be extended in place, like CPython does.
+    """
+    source = statement.getAssignSource()
+
+    if not source.isOperation() or source.getOperator() not in ( "Add", "IAdd" ):
+        return False
+
+    left, right = source.getOperands()
+
+    if not left.isExpressionVariableRef():
+        return False
+
+    variable = statement.getTargetVariableRef().getVariable()
+
+    if left.getVariable() is not variable:
+        return False
+
+    if not variable.isLocalVariable() or variable.isClassVariable() or \
+       variable.isShared( True ):
+        return False
+
+    # Parameter variables that are never deleted cannot become unassigned,
+    # which is what happens when extending the value fails.
+    if variable.isParameterVariable() and not variable.getHasDelIndicator():
+        return False
+
+    # Python2 "int" operands have specialized code already.
+    if Utils.python_version < 300 and int in ( left.getTypeShape(),
+                                                right.getTypeShape() ):
+        return False
+
+    return True
+
 def generateAssignmentAttributeCode( lookup_source, attribute_name, value,
                                      context ):
     order_relevance = getOrderRelevance( ( value, lookup_source ) )
@@ -1856,13 +2049,72 @@ def generateTryExceptCode( statement, context ):
             needs_frame_detach    = exception_branch is not None # TODO: Check if the code may access traceback or not.
         )
 
+    # Raises in the tried block may jump to the handler directly.
+    if statement.needsLocalRaiseCatching():
+        local_try_count = context.allocateTryNumber()
+
+        context.setTryExceptCount( local_try_count )
+    else:
+        local_try_count = None
+
+    code_tried = generateStatementSequenceCode(
+        statement_sequence = tried_block,
+        context            = context,
+    )
+
+    if local_try_count is not None:
+        context.removeTryExceptCount()
+
     return Generator.getTryExceptCode(
-        context       = context,
-        code_tried    = generateStatementSequenceCode(
-            statement_sequence = tried_block,
-            context            = context,
-        ),
-        handler_codes = handler_codes
+        context         = context,
+        code_tried      = code_tried,
+        handler_codes   = handler_codes,
+        local_try_count = local_try_count
+    )
+
+def _isLocalErrorChecked( expression ):
+    return ( expression.isExpressionSubscriptLookup() or \
+             expression.isExpressionBuiltinNext1() ) and \
+           expression.isCaughtLocally()
+
+def generateLocalErrorCheckedCode( expression, variable_ref, context ):
+    # Errors of the helper are checked for, and jump to the handler, the value
+    # is assigned or released.
+    if expression.isExpressionSubscriptLookup():
+        value_identifier = generateSubscriptLookupCode(
+            expression = expression,
+            no_throw   = True,
+            context    = context
+        )
+    else:
+        value_identifier = Generator.getBuiltinNext1Code(
+            value    = generateExpressionCode(
+                expression = expression.getValue(),
+                context    = context
+            ),
+            no_throw = True
+        )
+
+    temp_identifier = Generator.getLocalErrorCheckedIdentifier(
+        context = context
+    )
+
+    if variable_ref is not None:
+        assign_code = generateAssignmentVariableCode(
+            variable_ref = variable_ref,
+            value        = temp_identifier,
+            context      = context
+        )
+    else:
+        assign_code = Generator.getStatementCode(
+            identifier = temp_identifier
+        )
+
+    return Generator.getLocalErrorCheckedCode(
+        value_identifier = value_identifier,
+        temp_identifier  = temp_identifier,
+        assign_code      = assign_code,
+        local_try_count  = context.getTryExceptCount()
     )
 
 def generateRaiseCode( statement, context ):
@@ -1871,6 +2123,11 @@ def generateRaiseCode( statement, context ):
     exception_tb    = statement.getExceptionTrace()
     exception_cause = statement.getExceptionCause()
 
+    if exception_type is not None and statement.isCaughtLocally():
+        local_try_count = context.getTryExceptCount()
+    else:
+        local_try_count = None
+
     # Exception cause is only possible with simple raise form.
     if exception_cause is not None:
         assert exception_type is not None
@@ -1889,6 +2146,7 @@ def generateRaiseCode( statement, context ):
                 expression  = statement.getExceptionCause(),
                 context     = context
             ),
+            local_try_count = local_try_count,
             context         = context
         )
     elif exception_type is None:
@@ -1909,7 +2167,8 @@ def generateRaiseCode( statement, context ):
                 expression  = exception_type,
                 context     = context
             ),
-            context        = context
+            local_try_count = local_try_count,
+            context         = context
         )
     elif exception_tb is None:
         return Generator.getRaiseExceptionWithValueCode(
@@ -1925,6 +2184,7 @@ def generateRaiseCode( statement, context ):
                 context    = context
             ),
             implicit        = statement.isImplicit(),
+            local_try_count = local_try_count,
             context         = context
         )
     else:
@@ -1943,7 +2203,8 @@ def generateRaiseCode( statement, context ):
             exception_tb    = generateExpressionCode(
                 expression = exception_tb,
                 context    = context
-            )
+            ),
+            local_try_count = local_try_count
         )
 
 def generateImportModuleCode( expression, context ):
@@ -1961,10 +2222,7 @@ def generateImportModuleCode( expression, context ):
             context     = context
         )
 
-    order_relevance = [ False ] * 5
-
-    return Generator.getBuiltinImportCode(
-        order_relevance    = order_relevance,
+    return Generator.getImportModuleCode(
         module_identifier  = Generator.getConstantHandle(
             constant = expression.getModuleName(),
             context  = context
@@ -2082,6 +2340,26 @@ def generateBranchCode( statement, context ):
 
     assert yes_codes is not None, statement
 
+    # For stackless generators, branches may be entered by jumps to a resume
+    # point. Temporary keepers of the condition must not be in scope then.
+    if not context.isPythonModule() and \
+       context.getFunction().isStackless() and \
+       context.getFunction().isResumePath( statement ):
+        condition_context = Contexts.PythonStatementContext( context )
+
+        condition_code = generateConditionCode(
+            condition = condition,
+            context   = condition_context
+        )
+
+        return Generator.getBranchResumableCode(
+            condition_code = condition_code,
+            local_inits    = Generator.getTempKeeperDecl( condition_context ),
+            yes_codes      = yes_codes,
+            no_codes       = no_codes,
+            context        = context
+        )
+
     return Generator.getBranchCode(
         condition_code = generateConditionCode(
             condition = condition,
@@ -2110,10 +2388,30 @@ def generateTempBlock( statement, context ):
         context            = context
     )
 
+    # Temporary variables stored in a generator context are not released by
+    # leaving the block, so do it explicitly.
+    for variable in statement.getTempVariables():
+        if variable.isInContext() and variable.getNeedsFree():
+            body_codes.append(
+                Generator.getContextTempReleaseCode( variable )
+            )
+
     return Generator.getBlockCode(
         body_codes
     )
 
+def generateYieldResumableCode( statement, context ):
+    identifier = generateExpressionCode(
+        expression = statement.getExpression().getExpression(),
+        context    = context
+    )
+
+    return Generator.getYieldResumableCode(
+        identifier   = identifier,
+        local_inits  = Generator.getTempKeeperDecl( context ),
+        resume_point = context.allocateResumePoint()
+    )
+
 def generateReturnCode( statement, context ):
     return Generator.getReturnCode(
         identifier    = generateExpressionCode(
@@ -2189,8 +2487,15 @@ PyObject *_tmp_%s;
 
                         )
 
-
-
+        # Stackless generators return at yield statements, and jump back to
+        # after them.
+        if statement.isStatementExpressionOnly() and \
+           statement.getExpression().isExpressionYield() and \
+           context.getFunction().isStackless():
+            return generateYieldResumableCode(
+                statement = statement,
+                context   = statement_context
+            )
 
         result = _generateStatementCode( statement, statement_context )
         local_inits = Generator.getTempKeeperDecl( statement_context )
@@ -2223,7 +2528,24 @@ def _generateStatementCode( statement, context ):
             context    = context
         )
 
-    if statement.isStatementAssignmentVariable():
+    if statement.isStatementAssignmentVariable() and \
+       _isLocalVariableSumAssignment( statement ):
+        code = Generator.getVariableSumAssignmentCode(
+            variable   = statement.getTargetVariableRef().getVariable(),
+            identifier = makeExpressionCode(
+                statement.getAssignSource().getRight()
+            ),
+            inplace    = statement.getAssignSource().getOperator() == "IAdd",
+            context    = context
+        )
+    elif statement.isStatementAssignmentVariable() and \
+         _isLocalErrorChecked( statement.getAssignSource() ):
+        code = generateLocalErrorCheckedCode(
+            expression   = statement.getAssignSource(),
+            variable_ref = statement.getTargetVariableRef(),
+            context      = context
+        )
+    elif statement.isStatementAssignmentVariable():
         code = generateAssignmentVariableCode(
             variable_ref  = statement.getTargetVariableRef(),
             value         = makeExpressionCode( statement.getAssignSource() ),
@@ -2282,6 +2604,13 @@ def _generateStatementCode( statement, context ):
             statement = statement,
             context   = context
         )
+    elif statement.isStatementExpressionOnly() and \
+         _isLocalErrorChecked( statement.getExpression() ):
+        code = generateLocalErrorCheckedCode(
+            expression   = statement.getExpression(),
+            variable_ref = None,
+            context      = context
+        )
     elif statement.isStatementExpressionOnly():
         code = Generator.getStatementCode(
             identifier = makeExpressionCode(
@@ -2390,6 +2719,38 @@ def _generateStatementCode( statement, context ):
 
     return code
 
+def _getFrameLineNumber( statement_sequence ):
+    """ Source reference of the only line number used in a frame, or None.
+
+    Contractions use the frame of their caller. All their statements are on
+    the line of the contraction, so unless they call other function bodies,
+    which use the same frame, the line number needs to be set only once, and
+    not for every statement in every iteration.
+    """
+
+    source_refs = {}
+
+    def visit( node ):
+        if node.isExpressionFunctionCall():
+            return False
+
+        if node.isStatement() and node.needsLineNumber():
+            source_ref = node.getSourceReference()
+
+            if source_ref.shallSetCurrentLine():
+                source_refs[ source_ref.getLineNumber() ] = source_ref
+
+        for child in node.getVisitableNodes():
+            if not visit( child ):
+                return False
+
+        return True
+
+    if visit( statement_sequence ) and len( source_refs ) == 1:
+        return list( source_refs.values() )[0]
+    else:
+        return None
+
 def generateStatementSequenceCode( statement_sequence, context,
                                    allow_none = False ):
     # The complexity is related to frame guard types, which are also handled in
@@ -2404,12 +2765,27 @@ def generateStatementSequenceCode( statement_sequence, context,
         guard_mode = statement_sequence.getGuardMode()
         context.setFrameGuardMode( guard_mode )
 
+        if guard_mode == "pass_through":
+            context.setFrameLineNumber(
+                _getFrameLineNumber( statement_sequence )
+            )
+
     statements = statement_sequence.getStatements()
 
     codes = []
 
     last_ref = None
 
+    # For stackless generators, statements next to resume points must be
+    # blocks, or else jumps to these could skip their declarations.
+    if context.isPythonModule():
+        function = None
+        isolate_statements = False
+    else:
+        function = context.getFunction()
+        isolate_statements = function.isStackless() and \
+                             function.isResumePath( statement_sequence )
+
     for statement in statements:
         source_ref = statement.getSourceReference()
 
@@ -2443,7 +2819,17 @@ def generateStatementSequenceCode( statement_sequence, context,
         # Cannot happen
         assert code != "", statement
 
-        if source_ref != last_ref and statement.needsLineNumber():
+        if isolate_statements and not function.isResumePath( statement ):
+            # Outside of the frame, it is only the start of the function, to
+            # be skipped when resuming.
+            if statement_sequence.getParent() is function and \
+               not statement_sequence.isStatementsFrame():
+                code = Generator.getResumableStartCode( code )
+            else:
+                code = Generator.getBlockCode( code )
+
+        if source_ref != last_ref and statement.needsLineNumber() and \
+           context.getFrameLineNumber() is None:
             code = Generator.getLineNumberCode(
                 source_ref = source_ref
             ) + code
@@ -2462,7 +2848,14 @@ def generateStatementSequenceCode( statement_sequence, context,
 
         source_ref = statement_sequence.getSourceReference()
 
-        if guard_mode == "generator":
+        if guard_mode == "generator" and provider.isStackless():
+            code = Generator.getFrameGuardResumableCode(
+                frame_identifier = provider.getCodeName(),
+                code_identifier  = statement_sequence.getCodeObjectHandle( context ),
+                codes            = codes,
+                context          = context
+            )
+        elif guard_mode == "generator":
             assert provider.isExpressionFunctionBody() and provider.isGenerator()
 
             code = Generator.getFrameGuardLightCode(
@@ -2474,6 +2867,11 @@ def generateStatementSequenceCode( statement_sequence, context,
         elif guard_mode == "pass_through":
             assert provider.isExpressionFunctionBody()
 
+            if context.getFrameLineNumber() is not None:
+                codes = Generator.getLineNumberCode(
+                    source_ref = context.getFrameLineNumber()
+                ).split( "\n" )[:-1] + codes
+
             code = Generator.getFrameGuardVeryLightCode(
                 codes = codes,
             )
@@ -2516,7 +2914,8 @@ def generateStatementSequenceCode( statement_sequence, context,
 
     return codes
 
-def generateModuleCode( global_context, module, module_name, other_modules ):
+def generateModuleCode( global_context, module, module_name, other_modules,
+                        constants_header ):
     assert module.isPythonModule(), module
 
     context = Contexts.PythonModuleContext(
@@ -2588,6 +2987,7 @@ def generateModuleCode( global_context, module, module_name, other_modules ):
         ],
         function_decl_codes = function_decl_codes,
         function_body_codes = function_body_codes,
+        constants_header    = constants_header,
         context             = context,
     )
 
@@ -2621,8 +3021,8 @@ def generateMainCode( module, codes, context ):
         codes           = codes
     )
 
-def generateConstantsDeclarationCode( context ):
-    return Generator.getConstantsDeclarationCode(
+def generateModuleConstantsDeclarationCode( context ):
+    return Generator.getModuleConstantsDeclarationCode(
         context = context
     )
 
@@ -2641,5 +3041,54 @@ def generateHelpersCode():
 
     return header_code, body_code
 
+def _getHelpersUsed():
+    return (
+        CallCodes.quick_calls_used,
+        CallCodes.method_calls_used,
+        TupleCodes.make_tuples_used,
+        ListCodes.make_lists_used,
+        DictCodes.make_dicts_used
+    )
+
+def getGlobalRequests( global_context ):
+    """ Constants, code objects, and helpers requested by generated code so far.
+
+        These are the only things that module code generation shares, use this
+        to tell what one module added, see "getNewGlobalRequests".
+    """
+
+    return (
+        set( global_context.getConstants() ),
+        set( key for key, _code_identifier in global_context.getCodeObjects() ),
+        tuple( set( used ) for used in _getHelpersUsed() )
+    )
+
+def getNewGlobalRequests( global_context, previous ):
+    constants, code_objects, helpers = getGlobalRequests( global_context )
+
+    return (
+        [ key[1].getConstant() for key in constants - previous[0] ],
+        sorted( code_objects - previous[1] ),
+        tuple(
+            used - previous_used
+            for used, previous_used in
+            zip( helpers, previous[2] )
+        )
+    )
+
+def mergeGlobalRequests( global_context, requests ):
+    """ Make requests from "getNewGlobalRequests" of another process too. """
+
+    constants, code_objects, helpers = requests
+
+    for constant in constants:
+        global_context.getConstantHandle( constant )
+
+    for key in code_objects:
+        global_context.getCodeObjectHandle( *key )
+
+    for used, new_used in zip( _getHelpersUsed(), helpers ):
+        used.update( new_used )
+
 def makeGlobalContext():
     return Contexts.PythonGlobalContext()
@@ -19,14 +19,8 @@
 
 """
 
-from .Pickling import getStreamedConstant
-from .CppStrings import encodeString
 from .Indentation import indented
 
-from .TupleCodes import addMakeTupleUse
-from .ListCodes import addMakeListUse
-from .DictCodes import addMakeDictUse
-
 # pylint: disable=W0622
 from ..__past__ import unicode, long, iterItems
 # pylint: enable=W0622
@@ -56,271 +50,281 @@ def getConstantCodeName( context, constant ):
 def _isAttributeName( value ):
     return _match_attribute_names.match( value )
 
-_needs_pickle = False
+# Codes of the constants blob, see "UNSTREAM_CONSTANTS" for their decoding.
+_blob_type_codes = {
+    tuple     : b"(",
+    list      : b"[",
+    dict      : b"{",
+    set       : b"S",
+    frozenset : b"P",
+}
 
-def needsPickleInit():
-    return _needs_pickle
+def _encodeSize( value ):
+    """ Encode a non-negative integer in 7 bit groups, least significant first.
 
-def _getUnstreamCode( constant_value, constant_identifier ):
-    saved = getStreamedConstant(
-        constant_value = constant_value
-    )
+    """
+    assert value >= 0
 
-    assert type( saved ) is bytes
+    result = bytearray()
 
-    # We need to remember having to use pickle, pylint: disable=W0603
-    global _needs_pickle
-    _needs_pickle = True
+    while value >= 0x80:
+        result.append( ( value & 0x7f ) | 0x80 )
+        value >>= 7
 
-    return "%s = UNSTREAM_CONSTANT( %s, %d );" % (
-        constant_identifier,
-        encodeString( saved ),
-        len( saved )
-    )
+    result.append( value )
 
+    return bytes( result )
 
-def _packFloat( value ):
-    return struct.pack( "<d", value )
+def _encodeSmallInt( value ):
+    # Small negative values interleave with positive ones, so their encoding
+    # is small too.
+    if value >= 0:
+        return _encodeSize( value * 2 )
+    else:
+        return _encodeSize( -value * 2 - 1 )
 
-def _addConstantInitCode( context, emit, constant_type, constant_value,
-                          constant_identifier ):
-    # This has many cases, that all return, and do a lot.
-    #  pylint: disable=R0911,R0912,R0915
-
-    # Use shortest code for ints and longs, except when they are big, then fall
-    # fallback to pickling. TODO: Avoid the use of pickle even for larger
-    # values.
-    if constant_type is int and abs( constant_value ) < 2**31:
-        emit(
-            "%s = PyInt_FromLong( %s );" % (
-                constant_identifier,
-                constant_value
-            )
-        )
+def _encodeLongBytes( value ):
+    """ Encode an integer as little endian two's complement bytes.
 
-        return
+    """
+    result = bytearray()
 
-    # See above, same for long values. Note: These are of course not existant
-    # with Python3 which would have covered it before.
-    if constant_type is long and abs( constant_value ) < 2**31:
-        emit (
-            "%s = PyLong_FromLong( %s );" % (
-                constant_identifier,
-                constant_value
-            )
-        )
+    while True:
+        result.append( value & 0xff )
+        value >>= 8
 
-        return
-
-    # Strings that can be encoded as UTF-8 are done more or less directly. When
-    # they cannot be expressed as UTF-8, that is rare not we can indeed use
-    # pickling.
-    if constant_type is str:
-        if str is not unicode:
-            emit(
-                "%s = UNSTREAM_STRING( %s, %d, %d );assert( %s );" % (
-                    constant_identifier,
-                    encodeString( constant_value ),
-                    len( constant_value ),
-                    1 if _isAttributeName( constant_value ) else 0,
-                    constant_identifier
-                )
-            )
+        if value == 0 and not result[-1] & 0x80:
+            break
+        if value == -1 and result[-1] & 0x80:
+            break
 
-            return
-        else:
-            try:
-                encoded = constant_value.encode( "utf-8" )
+    return _encodeSize( len( result ) ) + bytes( result )
 
-                emit(
-                    "%s = UNSTREAM_STRING( %s, %d, %d );assert( %s );" % (
-                        constant_identifier,
-                        encodeString( encoded ),
-                        len( encoded ),
-                        1 if _isAttributeName( constant_value ) else 0,
-                        constant_identifier
-                    )
-                )
+def _packFloat( value ):
+    return struct.pack( "<d", value )
 
-                return
-            except UnicodeEncodeError:
-                # So fall back to below code, which will unstream it then.
-                pass
+def _getRangeArguments( value ):
+    # Python3.2 range objects have no attributes for these, but they are in the
+    # representation, e.g. "range(0, 10, 2)".
+    arguments = [
+        int( part )
+        for part in
+        repr( value )[ len( "range(" ) : -1 ].split( "," )
+    ]
 
-    if constant_type is float:
-        emit(
-            "%s = UNSTREAM_FLOAT( %s );" % (
-                constant_identifier,
-                encodeString( _packFloat( constant_value ) )
-            )
-        )
+    if len( arguments ) == 2:
+        arguments.append( 1 )
 
-        return
+    return arguments
 
-    if constant_value is None:
-        return
+class ConstantBlobWriter:
+    """ Stream constants into one blob, to be decoded in a single pass.
 
-    if constant_value is False:
-        return
+    Every constant with an identifier is a record of the blob, and decoding
+    it assigns that identifier. Elements of containers, that have identifiers
+    too, come as records before the container, and the container refers to
+    them, so they are shared. Other values are encoded inline.
+    """
 
-    if constant_value is True:
-        return
+    def __init__( self, constants ):
+        # Constant keys to identifier.
+        self.constants = constants
 
-    if constant_type is dict:
-        if constant_value == {}:
-            emit( "%s = PyDict_New();" % constant_identifier )
-        else:
-            length = len( constant_value )
-            addMakeDictUse( length )
+        self.slots = []
+        self.slot_indexes = {}
 
-            for key, value in iterItems( constant_value ):
-                _addConstantInitCode(
-                    emit                = emit,
-                    constant_type       = type( key ),
-                    constant_value      = key,
-                    constant_identifier = getConstantCodeName( context, key ),
-                    context             = context
-                )
-                _addConstantInitCode(
-                    emit                = emit,
-                    constant_type       = type( value ),
-                    constant_value      = value,
-                    constant_identifier = getConstantCodeName( context, value ),
-                    context             = context
-                )
+        self.chunks = []
 
-            emit(
-                "%s = MAKE_DICT%d( %s );" % (
-                    constant_identifier,
-                    length,
-                    ", ".join(
-                        "%s, %s" % (
-                            getConstantCodeName( context, value ),
-                            getConstantCodeName( context, key )
-                        )
-                        for key, value
-                        in
-                        iterItems( constant_value )
-                    )
-                )
-            )
+    def getSlots( self ):
+        return self.slots
 
-        return
+    def getBlob( self ):
+        return b"".join( self.chunks )
 
-    if constant_type is tuple:
-        if constant_value == ():
-            emit( "%s = PyTuple_New( 0 );" % constant_identifier )
-        else:
-            length = len( constant_value )
-            addMakeTupleUse( length )
+    def addConstant( self, constant_value, constant_identifier ):
+        # Built-in singletons and types are not created, but used directly.
+        if _isSpecialConstant( constant_value ):
+            return
 
-            # Make elements earlier than tuple itself.
+        if constant_identifier in self.slot_indexes:
+            return
+
+        constant_type = type( constant_value )
+
+        # Make elements earlier than the container itself.
+        if constant_type in ( tuple, list ):
             for element in constant_value:
-                _addConstantInitCode(
-                    emit                = emit,
-                    constant_type       = type( element ),
-                    constant_value      = element,
-                    constant_identifier = getConstantCodeName( context, element ),
-                    context             = context
-                )
+                self._addElement( element )
+        elif constant_type is dict:
+            for key, value in iterItems( constant_value ):
+                self._addElement( key )
+                self._addElement( value )
 
-            emit(
-                "%s = MAKE_TUPLE%d( %s );" % (
-                    constant_identifier,
-                    length,
-                    ", ".join(
-                        getConstantCodeName( context, element )
-                        for element
-                        in
-                        constant_value
-                    )
-                )
-            )
+        self.chunks.append( self._encodeValue( constant_value ) )
 
-        return
+        self.slot_indexes[ constant_identifier ] = len( self.slots )
+        self.slots.append( constant_identifier )
 
-    if constant_type is list:
-        if constant_value == []:
-            emit( "%s = PyList_New( 0 );" % constant_identifier )
-        else:
-            length = len( constant_value )
-            addMakeListUse( length )
+    def _addElement( self, constant_value ):
+        key = type( constant_value ), HashableConstant( constant_value )
 
-            # Make elements earlier than list itself.
-            for element in constant_value:
-                _addConstantInitCode(
-                    emit                = emit,
-                    constant_type       = type( element ),
-                    constant_value      = element,
-                    constant_identifier = getConstantCodeName( context, element ),
-                    context             = context
-                )
+        if key in self.constants:
+            self.addConstant( constant_value, self.constants[ key ] )
 
-            emit(
-                "%s = MAKE_LIST%d( %s );" % (
-                    constant_identifier,
-                    length,
-                    ", ".join(
-                        getConstantCodeName( context, element )
-                        for element
-                        in
-                        constant_value
-                    )
-                )
-            )
+    def _encodeElement( self, constant_value ):
+        if not _isSpecialConstant( constant_value ):
+            key = type( constant_value ), HashableConstant( constant_value )
 
-        return
+            if key in self.constants and \
+               self.constants[ key ] in self.slot_indexes:
+                return b"r" + _encodeSize(
+                    self.slot_indexes[ self.constants[ key ] ]
+                )
 
-    if constant_type is list and constant_value == []:
-        emit( "%s = PyList_New( 0 );" % constant_identifier )
+        return self._encodeValue( constant_value )
 
-        return
+    def _encodeValue( self, constant_value ):
+        # This has many cases, that all return, pylint: disable=R0911,R0912
 
-    if constant_type is set and constant_value == set():
-        emit( "%s = PySet_New( NULL );" % constant_identifier )
+        constant_type = type( constant_value )
 
-        return
+        if constant_value is None:
+            return b"Z"
+        elif constant_value is True:
+            return b"1"
+        elif constant_value is False:
+            return b"0"
+        elif constant_value is Ellipsis:
+            return b"."
+        elif constant_type is type:
+            return b"Y" + _encodeSize(
+                constant_builtin_types.index( constant_value )
+            )
+        elif constant_type is int:
+            if abs( constant_value ) < 2**31:
+                return b"i" + _encodeSmallInt( constant_value )
+            else:
+                return b"I" + _encodeLongBytes( constant_value )
+        elif constant_type is long:
+            # Note: These are not existant with Python3, where int is long, and
+            # covered above.
+            if abs( constant_value ) < 2**31:
+                return b"l" + _encodeSmallInt( constant_value )
+            else:
+                return b"L" + _encodeLongBytes( constant_value )
+        elif constant_type is float:
+            return b"d" + _packFloat( constant_value )
+        elif constant_type is complex:
+            return b"j" + _packFloat( constant_value.real ) + \
+                          _packFloat( constant_value.imag )
+        elif constant_type is str and str is not unicode:
+            return self._encodeString( constant_value, constant_value )
+        elif constant_type is unicode:
+            if str is unicode:
+                # Strings that can be encoded as UTF-8 are done directly, others
+                # must pass surrogates.
+                try:
+                    return self._encodeString(
+                        constant_value.encode( "utf-8" ),
+                        constant_value
+                    )
+                except UnicodeEncodeError:
+                    encoded = constant_value.encode( "utf-8", "surrogatepass" )
+            else:
+                encoded = constant_value.encode( "utf-8" )
 
-    if constant_type in ( set, frozenset, complex, unicode, int, long, bytes, range ):
-        emit(  _getUnstreamCode( constant_value, constant_identifier ) )
+            return b"u" + _encodeSize( len( encoded ) ) + encoded
+        elif constant_type is bytes:
+            return b"b" + _encodeSize( len( constant_value ) ) + constant_value
+        elif constant_type in ( tuple, list, set, frozenset ):
+            return _blob_type_codes[ constant_type ] + \
+                   _encodeSize( len( constant_value ) ) + \
+                   b"".join(
+                       self._encodeElement( element )
+                       for element in
+                       constant_value
+                    )
+        elif constant_type is dict:
+            return b"{" + _encodeSize( len( constant_value ) ) + \
+                   b"".join(
+                       self._encodeElement( key ) + self._encodeElement( value )
+                       for key, value in
+                       iterItems( constant_value )
+                   )
+        elif constant_type is range:
+            return b"R" + b"".join(
+                self._encodeValue( argument )
+                for argument in
+                _getRangeArguments( constant_value )
+            )
+        else:
+            assert False, ( constant_type, constant_value )
 
-        return
+    @staticmethod
+    def _encodeString( encoded, constant_value ):
+        return ( b"a" if _isAttributeName( constant_value ) else b"s" ) + \
+               _encodeSize( len( encoded ) ) + encoded
 
-    if constant_value in constant_builtin_types:
-        return
+def _isSpecialConstant( constant_value ):
+    if constant_value is None or constant_value is True or \
+       constant_value is False or constant_value is Ellipsis:
+        return True
 
-    assert False, (type(constant_value), constant_value, constant_identifier)
+    return type( constant_value ) is type and \
+           constant_value in constant_builtin_types
 
 def _lengthKey( value ):
     return len( value[1] ), value[1]
 
 the_contained_constants = {}
 
-def getConstantsInitCode( context ):
-    # There are many cases for constants to be created in the most efficient way,
-    # pylint: disable=R0912
+def _getBlobInitCode( blob ):
+    blob = bytearray( blob )
 
+    return "\n".join(
+        "".join( "%d," % value for value in blob[ count : count + 20 ] )
+        for count in
+        range( 0, len( blob ), 20 )
+    )
+
+def getConstantsInitCode( context ):
     statements = []
 
     all_constants = the_contained_constants
     all_constants.update( context.getConstants() )
 
-    def receiveStatement( statement ):
-        assert statement is not None
+    writer = ConstantBlobWriter( all_constants )
 
-        if statement not in statements:
-            statements.append( statement )
-
-    for ( constant_type, constant_value ), constant_identifier in \
+    for ( _constant_type, constant_value ), constant_identifier in \
           sorted( all_constants.items(), key = _lengthKey ):
-        _addConstantInitCode(
-            emit                = receiveStatement,
-            constant_type       = constant_type,
+        writer.addConstant(
             constant_value      = constant_value.getConstant(),
-            constant_identifier = constant_identifier,
-            context             = context
+            constant_identifier = constant_identifier
         )
 
+    # The default constants are always there.
+    assert writer.getSlots()
+
+    statements.append(
+        "static unsigned char const constant_blob[] =\n{\n%s\n};" % (
+            indented( _getBlobInitCode( writer.getBlob() ) )
+        )
+    )
+    statements.append(
+        "static PyObject **const constant_slots[] =\n{\n%s\n};" % (
+            indented(
+                ",\n".join(
+                    "&" + constant_identifier
+                    for constant_identifier in
+                    writer.getSlots()
+                )
+            )
+        )
+    )
+    statements.append(
+        "UNSTREAM_CONSTANTS( constant_blob, sizeof( constant_blob ), constant_slots );"
+    )
+
     for code_object_key, code_identifier in context.getCodeObjects():
         co_flags = []
 
@@ -378,18 +382,13 @@ def getConstantsInitCode( context ):
 
     return indented( statements )
 
-def getConstantsDeclCode( context, for_header ):
+def getConstantsDeclCode( context ):
     # There are many cases for constants of different types.
     # pylint: disable=R0912
     statements = []
 
     for _code_object_key, code_identifier in context.getCodeObjects():
-        declaration = "PyCodeObject *%s;" % code_identifier.getCode()
-
-        if for_header:
-            declaration = "extern " + declaration
-
-        statements.append( declaration )
+        statements.append( "PyCodeObject *%s;" % code_identifier.getCode() )
 
     constants = context.getConstants()
 
@@ -432,15 +431,10 @@ def getConstantsDeclCode( context, for_header ):
         if constant_type is type:
             continue
 
-        declaration = "PyObject *%s;" % constant_identifier
+        if constant_type in ( tuple, dict, list ):
+            considerForDeferral( constant_value.getConstant() )
 
-        if for_header:
-            declaration = "extern " + declaration
-        else:
-            if constant_type in ( tuple, dict, list ):
-                considerForDeferral( constant_value.getConstant() )
-
-        statements.append( declaration )
+        statements.append( "PyObject *%s;" % constant_identifier )
 
     for key, value in sorted( contained_constants.items(), key = _lengthKey ):
         if key not in constants:
@@ -448,8 +442,25 @@ def getConstantsDeclCode( context, for_header ):
 
             statements.append( declaration )
 
-    if not for_header:
-        global the_contained_constants
-        the_contained_constants = contained_constants
+    global the_contained_constants
+    the_contained_constants = contained_constants
+
+    return "\n".join( statements )
+
+def getModuleConstantsDeclCode( context ):
+    """ Declarations of the constants and code objects a module uses.
+
+        These are all defined in the constants of the program, but giving each
+        module only what it uses, keeps its code the same when other modules
+        change. Otherwise all modules would have to be compiled again.
+    """
+
+    statements = []
+
+    for code_identifier in context.getCodeObjectNames():
+        statements.append( "extern PyCodeObject *%s;" % code_identifier )
+
+    for constant_identifier in context.getConstantNames():
+        statements.append( "extern PyObject *%s;" % constant_identifier )
 
     return "\n".join( statements )
@@ -62,6 +62,7 @@ class PythonContextBase:
         self.try_count = 0
 
         self.try_finally_counts = []
+        self.try_except_counts = []
 
         self.call_temp_count = 0
 
@@ -88,6 +89,15 @@ class PythonContextBase:
         else:
             return None
 
+    def setTryExceptCount( self, value ):
+        self.try_except_counts.append( value )
+
+    def removeTryExceptCount( self ):
+        del self.try_except_counts[-1]
+
+    def getTryExceptCount( self ):
+        return self.try_except_counts[-1]
+
     def allocateCallTempNumber( self ):
         self.call_temp_count += 1
 
@@ -127,9 +137,18 @@ class PythonChildContextBase( PythonContextBase ):
     def addHelperCode( self, key, code ):
         self.parent.addHelperCode( key, code )
 
+    def hasHelperCode( self, key ):
+        return self.parent.hasHelperCode( key )
+
     def addDeclaration( self, key, code ):
         self.parent.addDeclaration( key, code )
 
+    def allocateImportCache( self ):
+        return self.parent.allocateImportCache()
+
+    def allocateAttributeCache( self ):
+        return self.parent.allocateAttributeCache()
+
 
 def _getConstantDefaultPopulation():
     result = (
@@ -157,6 +176,7 @@ def _getConstantDefaultPopulation():
         "__exit__",
         "__builtins__",
         "__all__",
+        "__path__",
 
         # Patched module name.
         "inspect",
@@ -323,6 +343,18 @@ class PythonModuleContext( PythonContextBase ):
 
         self.global_var_names = set()
 
+        self.import_cache_count = 0
+        self.attribute_cache_count = 0
+
+        # Constants and code objects used by the module, it gets a header of
+        # its own declaring only these, so it need not be compiled again when
+        # other modules use new ones.
+        self.constants = set()
+        self.code_objects = set()
+
+        for value in _getConstantDefaultPopulation():
+            self.getConstantHandle( value )
+
     def __repr__( self ):
         return "<PythonModuleContext instance for module %s>" % self.filename
 
@@ -336,11 +368,20 @@ class PythonModuleContext( PythonContextBase ):
         return "FrameGuard"
 
     def getConstantHandle( self, constant ):
-        return self.global_context.getConstantHandle( constant )
+        result = self.global_context.getConstantHandle( constant )
+
+        # Special constants and built-in types need no declaration.
+        if result.__class__ is ConstantIdentifier:
+            self.constants.add( result.getCode() )
+
+        return result
+
+    def getConstantNames( self ):
+        return sorted( self.constants )
 
     def getCodeObjectHandle( self, filename, code_name, line_number, arg_names,
                              kw_only_count, is_generator, is_optimized ):
-        return self.global_context.getCodeObjectHandle(
+        result = self.global_context.getCodeObjectHandle(
             filename      = filename,
             code_name     = code_name,
             line_number   = line_number,
@@ -350,6 +391,13 @@ class PythonModuleContext( PythonContextBase ):
             is_optimized  = is_optimized
         )
 
+        self.code_objects.add( result.getCode() )
+
+        return result
+
+    def getCodeObjectNames( self ):
+        return sorted( self.code_objects )
+
     def getName( self ):
         return self.name
 
@@ -376,6 +424,9 @@ class PythonModuleContext( PythonContextBase ):
     def setFrameGuardMode( self, guard_mode ):
         assert guard_mode == "once"
 
+    def getFrameLineNumber( self ):
+        return None
+
     def getReturnErrorCode( self ):
         return "return MOD_RETURN_VALUE( NULL );"
 
@@ -384,6 +435,9 @@ class PythonModuleContext( PythonContextBase ):
 
         self.helper_codes[ key ] = code
 
+    def hasHelperCode( self, key ):
+        return key in self.helper_codes
+
     def getHelperCodes( self ):
         return self.helper_codes
 
@@ -395,6 +449,36 @@ class PythonModuleContext( PythonContextBase ):
     def getDeclarations( self ):
         return self.declaration_codes
 
+    def allocateImportCache( self ):
+        self.import_cache_count += 1
+
+        cache_name = "_import_cache_%s_%d" % (
+            self.code_name,
+            self.import_cache_count
+        )
+
+        self.addDeclaration(
+            cache_name,
+            "static Nuitka_ImportCache %s;" % cache_name
+        )
+
+        return cache_name
+
+    def allocateAttributeCache( self ):
+        self.attribute_cache_count += 1
+
+        cache_name = "_attribute_cache_%s_%d" % (
+            self.code_name,
+            self.attribute_cache_count
+        )
+
+        self.addDeclaration(
+            cache_name,
+            "static Nuitka_AttributeCache %s;" % cache_name
+        )
+
+        return cache_name
+
 
 class PythonFunctionContext( PythonChildContextBase ):
     def __init__( self, parent, function ):
@@ -408,6 +492,12 @@ class PythonFunctionContext( PythonChildContextBase ):
 
         self.guard_mode = None
 
+        # Source reference for the line number of the frame, if it is set once
+        # for all of it.
+        self.frame_line_number = None
+
+        self.resume_count = 0
+
     def __repr__( self ):
         return "<PythonFunctionContext for %s '%s'>" % (
             "function" if not self.function.isClassDictCreation() else "class",
@@ -438,6 +528,20 @@ class PythonFunctionContext( PythonChildContextBase ):
     def setFrameGuardMode( self, guard_mode ):
         self.guard_mode = guard_mode
 
+    def getFrameLineNumber( self ):
+        return self.frame_line_number
+
+    def setFrameLineNumber( self, source_ref ):
+        self.frame_line_number = source_ref
+
+    def allocateResumePoint( self ):
+        self.resume_count += 1
+
+        return self.resume_count
+
+    def getResumePointCount( self ):
+        return self.resume_count
+
     def getFrameGuardClass( self ):
         if self.guard_mode == "generator":
             return "FrameGuardLight"
@@ -473,6 +577,7 @@ class PythonStatementContext( PythonChildContextBase ):
         PythonChildContextBase.__init__( self, parent = parent )
 
         self.temp_keepers = {}
+        self.method_keepers = []
 
     def getFrameHandle( self ):
         return self.parent.getFrameHandle()
@@ -480,6 +585,9 @@ class PythonStatementContext( PythonChildContextBase ):
     def getFrameGuardClass( self ):
         return self.parent.getFrameGuardClass()
 
+    def getFrameLineNumber( self ):
+        return self.parent.getFrameLineNumber()
+
     def hasLocalsDict( self ):
         return self.parent.hasLocalsDict()
 
@@ -492,6 +600,9 @@ class PythonStatementContext( PythonChildContextBase ):
     def allocateCallTempNumber( self ):
         return self.parent.allocateCallTempNumber()
 
+    def allocateResumePoint( self ):
+        return self.parent.allocateResumePoint()
+
     def addTempKeeperUsage( self, variable_name, ref_count ):
         self.temp_keepers[ variable_name ] = ref_count
 
@@ -501,6 +612,12 @@ class PythonStatementContext( PythonChildContextBase ):
     def getTempKeeperUsages( self ):
         return self.temp_keepers
 
+    def addMethodKeeperUsage( self, variable_name ):
+        self.method_keepers.append( variable_name )
+
+    def getMethodKeeperUsages( self ):
+        return self.method_keepers
+
     def allocateTryNumber( self ):
         return self.parent.allocateTryNumber()
 
@@ -512,3 +629,12 @@ class PythonStatementContext( PythonChildContextBase ):
 
     def getTryFinallyCount( self ):
         return self.parent.getTryFinallyCount()
+
+    def setTryExceptCount( self, value ):
+        self.parent.setTryExceptCount( value )
+
+    def removeTryExceptCount( self ):
+        self.parent.removeTryExceptCount()
+
+    def getTryExceptCount( self ):
+        return self.parent.getTryExceptCount()
@@ -64,6 +64,8 @@ from .SetCodes import getSetCreationCode
 
 from .CallCodes import (
     getCallCodePosKeywordArgs,
+    getCallCodeModuleFunction,
+    getCallCodeMethod,
     getCallCodePosArgsQuick,
     getCallCodeKeywordArgs,
     getCallCodePosArgs,
@@ -75,9 +77,9 @@ from .CallCodes import (
 from .ConstantCodes import (
     getConstantsInitCode,
     getConstantsDeclCode,
+    getModuleConstantsDeclCode,
     getConstantHandle,
-    getConstantCode,
-    needsPickleInit
+    getConstantCode
 )
 
 # These are here to be imported from here
@@ -243,6 +245,26 @@ def getBuiltinImportCode( context, order_relevance, module_identifier,
         context         = context
     )
 
+def getImportModuleCode( context, module_identifier, globals_dict,
+                         locals_dict, import_list, level ):
+    # Import statements remember the module they gave, and only import if
+    # that is not still valid, then the locals are needed only.
+    cache_name = context.allocateImportCache()
+
+    return Identifier(
+        "( IMPORT_CACHE_VALID( &%s ) ? IMPORT_CACHED( &%s ) : IMPORT_MODULE_CACHE_FILL( &%s, %s, %s, %s, %s, %s ) )" % (
+            cache_name,
+            cache_name,
+            cache_name,
+            module_identifier.getCodeTemporaryRef(),
+            globals_dict.getCodeTemporaryRef(),
+            locals_dict.getCodeTemporaryRef(),
+            import_list.getCodeTemporaryRef(),
+            level.getCodeTemporaryRef()
+        ),
+        1
+    )
+
 def getImportFromStarCode( context, module_identifier ):
     if not context.hasLocalsDict():
         return "IMPORT_MODULE_STAR( %s, true, %s );" % (
@@ -323,11 +345,16 @@ def getSpecialAttributeLookupCode( attribute, source ):
         1
     )
 
-def getAttributeLookupCode( attribute, source ):
+def getAttributeLookupCode( context, attribute, source ):
+    # Each lookup remembers what the type of the last looked up object gave
+    # for the name, and where it was in the instance dictionary.
+    cache_name = context.allocateAttributeCache()
+
     return Identifier(
-        "LOOKUP_ATTRIBUTE( %s, %s )" % (
+        "LOOKUP_ATTRIBUTE_CACHED( %s, %s, &%s )" % (
             source.getCodeTemporaryRef(),
-            attribute.getCodeTemporaryRef()
+            attribute.getCodeTemporaryRef(),
+            cache_name
         ),
         1
     )
@@ -398,7 +425,8 @@ def getImportNameCode( import_name, module ):
         1
     )
 
-def getSubscriptLookupCode( context, order_relevance, subscript, source ):
+def getSubscriptLookupCode( context, order_relevance, subscript, source,
+                            no_throw = False ):
     helper = "LOOKUP_SUBSCRIPT"
     suffix_args = []
 
@@ -412,6 +440,9 @@ def getSubscriptLookupCode( context, order_relevance, subscript, source ):
                 helper = "LOOKUP_SUBSCRIPT_CONST"
                 suffix_args = [ "%d" % constant ]
 
+    if no_throw:
+        helper += "_NO_THROW"
+
     return getOrderRelevanceEnforcedArgsCode(
         helper          = helper,
         export_ref      = 0,
@@ -473,14 +504,25 @@ def getSliceObjectCode( order_relevance, lower, upper, step, context ):
 def getStatementCode( identifier ):
     return identifier.getCodeDropRef() + ";"
 
-def getOperationCode( context, order_relevance, operator, identifiers ):
+def getOperationCode( context, order_relevance, operator, identifiers,
+                      type_shapes ):
     # This needs to have one return per operation of Python, and there are many
-    # of these, pylint: disable=R0911
+    # of these, pylint: disable=R0911,R0912
 
     prefix_args = []
     ref_count = 1
 
-    if operator == "Pow":
+    if operator in OperatorCodes.int_specialized_binary_operator_codes and \
+       Utils.python_version < 300 and int in type_shapes:
+        helper = "%s_%s" % (
+            OperatorCodes.int_specialized_binary_operator_codes[ operator ],
+            "_".join(
+                "INT" if type_shape is int else "OBJECT"
+                for type_shape in
+                type_shapes
+            )
+        )
+    elif operator == "Pow":
         helper = "POWER_OPERATION"
     elif operator == "IPow":
         helper = "POWER_OPERATION_INPLACE"
@@ -620,6 +662,29 @@ def getBranchCode( condition_code, yes_codes, no_codes ):
             "branch_no_code"  : indented( no_codes )
         }
 
+def getBranchResumableCode( condition_code, local_inits, yes_codes, no_codes,
+                            context ):
+    if not local_inits:
+        return getBranchCode(
+            condition_code = condition_code,
+            yes_codes      = yes_codes,
+            no_codes       = no_codes
+        )
+
+    condition_var = "_condition_%d" % context.allocateCallTempNumber()
+
+    return "bool %s;\n%s\n%s" % (
+        condition_var,
+        getBlockCode(
+            local_inits + [ "%s = %s;" % ( condition_var, condition_code ) ]
+        ),
+        getBranchCode(
+            condition_code = condition_var,
+            yes_codes      = yes_codes,
+            no_codes       = no_codes
+        )
+    )
+
 def getLoopContinueCode( needs_exceptions ):
     if needs_exceptions:
         return "throw ContinueException();"
@@ -884,6 +949,21 @@ def getVariableAssignmentCode( context, variable, identifier ):
         identifier_code
     )
 
+def getVariableSumAssignmentCode( context, variable, identifier, inplace ):
+    variable_code = getVariableCode(
+        variable = variable,
+        context  = context
+    )
+
+    # The variable is checked for being assigned first, as it is the left
+    # operand, and therefore to be evaluated before the right one.
+    return "%s.asObject();\n%s.assignSum( %s, %s );" % (
+        variable_code,
+        variable_code,
+        identifier.getCodeTemporaryRef(),
+        "true" if inplace else "false"
+    )
+
 def getAssignmentTempKeeperCode( source_identifier, variable, context ):
     ref_count = source_identifier.getCheapRefCount()
     variable_name = variable.getName()
@@ -1044,17 +1124,23 @@ def getTryExceptHandlerCode( exception_identifiers, handler_code,
 
     return exception_code
 
-def getTryExceptCode( context, code_tried, handler_codes ):
+def getTryExceptCode( context, code_tried, handler_codes, local_try_count ):
     exception_code = handler_codes
     exception_code += CodeTemplates.try_except_reraise_unmatched_template.split( "\n" )
 
     tb_making = getTracebackMakingIdentifier( context )
 
-    return CodeTemplates.try_except_template % {
+    if local_try_count is not None:
+        template = CodeTemplates.try_except_local_raise_template
+    else:
+        template = CodeTemplates.try_except_template
+
+    return template % {
         "tried_code"     : indented( code_tried or "" ),
         "exception_code" : indented( exception_code ),
         "guard_class"    : context.getFrameGuardClass(),
         "tb_making"      : tb_making.getCodeExportRef(),
+        "try_count"      : local_try_count
     }
 
 def getTryNextExceptStopIterationIdentifier( context ):
@@ -1070,17 +1156,53 @@ def getTryNextExceptStopIterationCode( source_identifier, handler_code, assign_c
         "source_identifier" : source_identifier.getCodeTemporaryRef()
     }
 
+def getLocalErrorCheckedIdentifier( context ):
+    try_count = context.allocateTryNumber()
+
+    return Identifier( "_tmp_checked_%d" % try_count, 1 )
+
+def getLocalErrorCheckedCode( value_identifier, temp_identifier, assign_code,
+                              local_try_count ):
+    return CodeTemplates.template_local_error_checked % {
+        "temp_var"         : temp_identifier.getCode(),
+        "value_identifier" : value_identifier.getCodeExportRef(),
+        "assignment_code"  : indented( assign_code ),
+        "try_count"        : local_try_count
+    }
+
+def _getRaiseExceptionCode( helper, local_try_count, order_relevance, names,
+                            values ):
+    # Raises caught by the same function only set the exception, and jump to
+    # the handler.
+    if local_try_count is not None:
+        return CodeTemplates.template_raise_local % {
+            "raise_code" : getOrderRelevanceEnforcedCallCode(
+                order_relevance = order_relevance,
+                helper          = helper.replace( "RAISE_", "SET_", 1 ),
+                names           = names,
+                values          = values
+            ),
+            "try_count"  : local_try_count
+        }
+    else:
+        return getOrderRelevanceEnforcedCallCode(
+            order_relevance = order_relevance,
+            helper          = helper,
+            names           = names,
+            values          = values
+        )
 
 def getRaiseExceptionWithCauseCode( context, order_relevance, exception_type,
-                                    exception_cause ):
+                                    exception_cause, local_try_count ):
     # Must enforce tb_maker to be last.
     exception_tb_maker = getTracebackMakingIdentifier(
         context = context
     )
 
-    return getOrderRelevanceEnforcedCallCode(
+    return _getRaiseExceptionCode(
         order_relevance = order_relevance + [ True ],
         helper          = "RAISE_EXCEPTION_WITH_CAUSE",
+        local_try_count = local_try_count,
         names           = (
             "exception_type", "exception_cause", "exception_tb"
         ),
@@ -1089,15 +1211,17 @@ def getRaiseExceptionWithCauseCode( context, order_relevance, exception_type,
         )
     )
 
-def getRaiseExceptionWithTypeCode( context, order_relevance, exception_type ):
+def getRaiseExceptionWithTypeCode( context, order_relevance, exception_type,
+                                   local_try_count ):
     # Must enforce tb_maker to be last.
     exception_tb_maker = getTracebackMakingIdentifier(
         context = context
     )
 
-    return getOrderRelevanceEnforcedCallCode(
+    return _getRaiseExceptionCode(
         order_relevance = order_relevance + [ True ],
         helper          = "RAISE_EXCEPTION_WITH_TYPE",
+        local_try_count = local_try_count,
         names           = (
             "exception_type", "exception_tb"
         ),
@@ -1107,7 +1231,8 @@ def getRaiseExceptionWithTypeCode( context, order_relevance, exception_type ):
     )
 
 def getRaiseExceptionWithValueCode( context, order_relevance, exception_type,
-                                    exception_value, implicit ):
+                                    exception_value, implicit,
+                                    local_try_count ):
     # Must enforce tb_maker to be last.
     exception_tb_maker = getTracebackMakingIdentifier(
         context = context
@@ -1118,9 +1243,10 @@ def getRaiseExceptionWithValueCode( context, order_relevance, exception_type,
     else:
         helper = "RAISE_EXCEPTION_WITH_VALUE"
 
-    return getOrderRelevanceEnforcedCallCode(
+    return _getRaiseExceptionCode(
         order_relevance = order_relevance + [ True ],
         helper          = helper,
+        local_try_count = local_try_count,
         names           = (
             "exception_type", "exception_value", "exception_tb"
         ),
@@ -1130,10 +1256,12 @@ def getRaiseExceptionWithValueCode( context, order_relevance, exception_type,
     )
 
 def getRaiseExceptionWithTracebackCode( order_relevance, exception_type,
-                                        exception_value, exception_tb ):
-    return getOrderRelevanceEnforcedCallCode(
+                                        exception_value, exception_tb,
+                                        local_try_count ):
+    return _getRaiseExceptionCode(
         order_relevance = order_relevance,
         helper          = "RAISE_EXCEPTION_WITH_TRACEBACK",
+        local_try_count = local_try_count,
         names           = (
             "exception_type", "exception_value", "exception_tb"
         ),
@@ -1627,6 +1755,40 @@ def getBuiltinRange3Code( order_relevance, low, high, step, context ):
         context         = context
     )
 
+def getBuiltinIterRange1Code( value ):
+    return HelperCallIdentifier(
+        "BUILTIN_ITER_RANGE", value
+    )
+
+def getBuiltinIterRange2Code( order_relevance, low, high, context ):
+    return getOrderRelevanceEnforcedArgsCode(
+        helper          = "BUILTIN_ITER_RANGE2",
+        export_ref      = 0,
+        ref_count       = 1,
+        tmp_scope       = "range",
+        order_relevance = order_relevance,
+        args            = (
+            low,
+            high
+        ),
+        context         = context
+    )
+
+def getBuiltinIterRange3Code( order_relevance, low, high, step, context ):
+    return getOrderRelevanceEnforcedArgsCode(
+        helper          = "BUILTIN_ITER_RANGE3",
+        export_ref      = 0,
+        ref_count       = 1,
+        tmp_scope       = "range",
+        order_relevance = order_relevance,
+        args            = (
+            low,
+            high,
+            step
+        ),
+        context         = context
+    )
+
 def getBuiltinChrCode( value ):
     return HelperCallIdentifier( "BUILTIN_CHR", value )
 
@@ -1663,8 +1825,11 @@ def getBuiltinIter2Code( context, order_relevance, callable_identifier,
         context         = context
     )
 
-def getBuiltinNext1Code( value ):
-    return HelperCallIdentifier( "BUILTIN_NEXT1", value )
+def getBuiltinNext1Code( value, no_throw = False ):
+    return HelperCallIdentifier(
+        "BUILTIN_NEXT1_NO_THROW" if no_throw else "BUILTIN_NEXT1",
+        value
+    )
 
 def getBuiltinNext2Code( context, order_relevance, iterator_identifier,
                          default_identifier ):
@@ -1832,7 +1997,7 @@ def getPackageIdentifier( module_name ):
     return module_name.replace( ".", "__" )
 
 def getModuleCode( context, module_name, codes, other_module_names,
-                   function_decl_codes, function_body_codes ):
+                   function_decl_codes, function_body_codes, constants_header ):
     # For the module code, lots of attributes come together.
     # pylint: disable=R0914
     module_identifier = getModuleIdentifier( module_name )
@@ -1874,6 +2039,7 @@ def getModuleCode( context, module_name, codes, other_module_names,
             constant = module_name
         ),
         "module_identifier"     : module_identifier,
+        "constants_header"      : constants_header,
         "module_functions_decl" : function_decl_codes,
         "module_functions_code" : function_body_codes,
         "module_globals"        : module_globals,
@@ -2103,6 +2269,23 @@ def getGeneratorFunctionCode( context, function_name,
             )
         )
 
+    function = context.getFunction()
+
+    # Stackless generators also keep temporary variables that live across a
+    # "yield" in the context.
+    for temp_variable in function.getContextTempVariables():
+        # Unused ones, may have been optimized away.
+        if temp_variable.getNeedsFree() is None:
+            continue
+
+        local_var_decl.append(
+            getLocalVariableInitCode(
+                context    = context,
+                variable   = temp_variable,
+                in_context = True
+            )
+        )
+
     for closure_variable in closure_variables:
         assert closure_variable.isShared()
 
@@ -2165,12 +2348,20 @@ def getGeneratorFunctionCode( context, function_name,
 
     function_locals += function_var_inits
 
-    result += CodeTemplates.genfunc_yielder_template % {
-        "function_identifier" : function_identifier,
-        "function_body"       : indented( function_codes, 2 ),
-        "function_var_inits"  : indented( function_locals, 2 ),
-        "context_access"      : indented( context_access_instance, 2 ),
-    }
+    if function.isStackless():
+        result += CodeTemplates.genfunc_resumable_template % {
+            "function_identifier" : function_identifier,
+            "function_body"       : indented( function_codes ),
+            "function_var_inits"  : indented( function_locals, 2 ),
+            "context_access"      : indented( context_access_instance ),
+        }
+    else:
+        result += CodeTemplates.genfunc_yielder_template % {
+            "function_identifier" : function_identifier,
+            "function_body"       : indented( function_codes, 2 ),
+            "function_var_inits"  : indented( function_locals, 2 ),
+            "context_access"      : indented( context_access_instance, 2 ),
+        }
 
     code_identifier = context.getCodeObjectHandle(
         filename      = source_ref.getFilename(),
@@ -2231,11 +2422,39 @@ def getGeneratorFunctionCode( context, function_name,
 
     return result
 
+def getYieldResumableCode( identifier, local_inits, resume_point ):
+    yield_code = CodeTemplates.genfunc_yield_resumable_template % {
+        "resume_point" : resume_point,
+        "yielded"      : identifier.getCodeExportRef()
+    }
+
+    # The resume point must be outside of the block with the temporary keepers,
+    # as jumps into it would skip their initialization.
+    return "%s\n%s" % (
+        getBlockCode(
+            local_inits + yield_code.split( "\n" )
+        ),
+        CodeTemplates.genfunc_resume_point_template % {
+            "resume_point" : resume_point
+        }
+    )
+
+def getResumableStartCode( codes ):
+    return CodeTemplates.genfunc_resumable_start_template % {
+        "codes" : indented( codes )
+    }
+
+def getContextTempReleaseCode( variable ):
+    return "_python_context->%s.release();" % variable.getCodeName()
+
 def getTempKeeperDecl( context ):
     tmp_keepers = context.getTempKeeperUsages()
     return [
         "PyObjectTempKeeper%s %s;" % ( ref_count, tmp_variable )
         for tmp_variable, ref_count in sorted( iterItems( tmp_keepers ) )
+    ] + [
+        "PyObjectMethodKeeper %s;" % method_variable
+        for method_variable in context.getMethodKeeperUsages()
     ]
 
 def getFunctionMakerCode( context, function_name, function_qualname,
@@ -2498,29 +2717,28 @@ def getStatementTrace( source_desc, statement_repr ):
     )
 
 
-def getConstantsDeclarationCode( context ):
+def getModuleConstantsDeclarationCode( context ):
     constants_declarations = CodeTemplates.template_constants_declaration % {
-        "constant_declarations" : getConstantsDeclCode(
-            context    = context,
-            for_header = True
+        "constant_declarations" : getModuleConstantsDeclCode(
+            context = context
         )
     }
 
     return CodeTemplates.template_header_guard % {
-        "header_guard_name" : "__NUITKA_DECLARATIONS_H__",
+        "header_guard_name" : "__%s_CONSTANTS_H__" % (
+            getModuleIdentifier( context.getModuleName() )
+        ),
         "header_body"       : constants_declarations
     }
 
 def getConstantsDefinitionCode( context ):
     return CodeTemplates.template_constants_reading % {
         "constant_declarations" : getConstantsDeclCode(
-            context    = context,
-            for_header = False
+            context = context
         ),
         "constant_inits"        : getConstantsInitCode(
             context    = context
-        ),
-        "needs_pickle"          : "true" if needsPickleInit() else "false"
+        )
     }
 
 def getCurrentExceptionTypeCode():
@@ -2638,6 +2856,27 @@ def getFrameGuardLightCode( frame_identifier, code_identifier, codes, context ):
         "tb_making"         : tb_making.getCodeExportRef(),
     }
 
+def getFrameGuardResumableCode( frame_identifier, code_identifier, codes,
+                                context ):
+    tb_making = getTracebackMakingIdentifier( context )
+
+    resume_cases = [
+        CodeTemplates.genfunc_resume_case_template % {
+            "resume_point" : resume_point
+        }
+        for resume_point in
+        range( 1, context.getResumePointCount() + 1 )
+    ]
+
+    return CodeTemplates.frame_guard_genfunc_resumable_template % {
+        "frame_identifier"  : frame_identifier,
+        "code_identifier"   : code_identifier.getCodeTemporaryRef(),
+        "codes"             : indented( codes ),
+        "resume_cases"      : indented( resume_cases, 2 ),
+        "module_identifier" : getModuleAccessCode( context = context ),
+        "tb_making"         : tb_making.getCodeExportRef(),
+    }
+
 def getFrameGuardVeryLightCode( codes ):
     return CodeTemplates.frame_guard_listcontr_template % {
         "codes"             : indented( codes, 0 ),
@@ -206,10 +206,13 @@ class LocalVariableIdentifier:
 
 
 class TempVariableIdentifier( Identifier ):
-    def __init__( self, var_name ):
+    def __init__( self, var_name, from_context = False ):
         self.tempvar_name = var_name
 
-        Identifier.__init__( self, "_python_tmp_" + var_name, 0 )
+        if from_context:
+            Identifier.__init__( self, "_python_context->python_tmp_" + var_name, 0 )
+        else:
+            Identifier.__init__( self, "_python_tmp_" + var_name, 0 )
 
     def __repr__( self ):
         return "<TempVariableIdentifier %s >" % self.tempvar_name
@@ -225,10 +228,13 @@ class TempVariableIdentifier( Identifier ):
 
 
 class TempObjectIdentifier( Identifier ):
-    def __init__( self, var_name ):
+    def __init__( self, var_name, from_context = False ):
         self.tempvar_name = var_name
 
-        Identifier.__init__( self, "_python_tmp_" + var_name, 0 )
+        if from_context:
+            Identifier.__init__( self, "_python_context->python_tmp_" + var_name, 0 )
+        else:
+            Identifier.__init__( self, "_python_tmp_" + var_name, 0 )
 
     def getCodeTemporaryRef( self ):
         return self.code
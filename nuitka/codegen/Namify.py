@@ -23,7 +23,7 @@ it is really necessary.
 """
 
 # pylint: disable=W0622
-from nuitka.__past__ import long, unicode
+from nuitka.__past__ import long, unicode, iterItems
 # pylint: enable=W0622
 
 
@@ -104,17 +104,17 @@ def namifyConstant( constant ):
         if constant == {}:
             return "dict_empty"
         else:
-            return "dict_" + _digest( repr( constant ) )
+            return "dict_" + _digest( _sortedRepr( constant ) )
     elif type( constant ) is set:
         if constant == set():
             return "set_empty"
         else:
-            return "set_" + _digest( repr( constant ) )
+            return "set_" + _digest( _sortedRepr( constant ) )
     elif type( constant ) is frozenset:
         if constant == frozenset():
             return "frozenset_empty"
         else:
-            return "frozenset_" + _digest( repr( constant ) )
+            return "frozenset_" + _digest( _sortedRepr( constant ) )
     elif type( constant ) is tuple:
         if constant == ():
             return "tuple_empty"
@@ -127,13 +127,13 @@ def namifyConstant( constant ):
                 )
 
                 if len( result ) > 60:
-                    result = _digest( repr( constant ) )
+                    result = _digest( _sortedRepr( constant ) )
 
                 return "tuple_" + result + "_tuple"
             except ExceptionCannotNamify:
                 warning( "Couldn't namify '%r'" % value )
 
-                return "tuple_" + _digest( repr( constant ) )
+                return "tuple_" + _digest( _sortedRepr( constant ) )
     elif type( constant ) is list:
         if constant == []:
             return "list_empty"
@@ -146,13 +146,13 @@ def namifyConstant( constant ):
                 )
 
                 if len( result ) > 60:
-                    result = _digest( repr( constant ) )
+                    result = _digest( _sortedRepr( constant ) )
 
                 return "list_" + result + "_list"
             except ExceptionCannotNamify:
                 warning( "Couldn't namify '%r'" % value )
 
-                return "list_" + _digest( repr( constant ) )
+                return "list_" + _digest( _sortedRepr( constant ) )
     elif type( constant ) is range:
         # Python3 type only.
         return "range_%s" % (
@@ -161,6 +161,35 @@ def namifyConstant( constant ):
 
     raise ExceptionCannotNamify( "%r" % constant )
 
+def _sortedRepr( constant ):
+    """ Like "repr", but not depending on the order of dict and set items.
+
+        Equal constants must get the same name, no matter how they were
+        created, e.g. when they come from code generated in another process.
+    """
+
+    constant_type = type( constant )
+
+    if constant_type is dict:
+        return "{%s}" % ", ".join(
+            sorted(
+                "%s: %s" % ( _sortedRepr( key ), _sortedRepr( value ) )
+                for key, value in
+                iterItems( constant )
+            )
+        )
+    elif constant_type in ( set, frozenset ):
+        return "%s([%s])" % (
+            constant_type.__name__,
+            ", ".join( sorted( _sortedRepr( value ) for value in constant ) )
+        )
+    elif constant_type is tuple:
+        return "(%s,)" % ", ".join( _sortedRepr( value ) for value in constant )
+    elif constant_type is list:
+        return "[%s]" % ", ".join( _sortedRepr( value ) for value in constant )
+    else:
+        return repr( constant )
+
 _re_str_needs_no_digest = re.compile( r"^([a-z]|[A-Z]|[0-9]|_){1,40}$", re.S )
 
 def _namifyString( string ):
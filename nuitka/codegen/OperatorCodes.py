@@ -57,6 +57,20 @@ binary_operator_codes = {
     "IBitXor"   : "PyNumber_InPlaceXor",
 }
 
+# Operations with variants specialized to operand type shapes. Python2 "int"
+# operands are computed directly. The variant names have suffixes for each
+# operand, e.g. "BINARY_OPERATION_ADD_INT_OBJECT".
+int_specialized_binary_operator_codes = {
+    "Add"   : "BINARY_OPERATION_ADD",
+    "Sub"   : "BINARY_OPERATION_SUB",
+    "Mult"  : "BINARY_OPERATION_MUL",
+    "Mod"   : "BINARY_OPERATION_REMAINDER",
+    "IAdd"  : "BINARY_OPERATION_INPLACE_ADD",
+    "ISub"  : "BINARY_OPERATION_INPLACE_SUB",
+    "IMult" : "BINARY_OPERATION_INPLACE_MUL",
+    "IMod"  : "BINARY_OPERATION_INPLACE_REMAINDER",
+}
+
 unary_operator_codes = {
     "UAdd"   : ( "PyNumber_Positive", 1 ),
     "USub"   : ( "PyNumber_Negative", 1 ),
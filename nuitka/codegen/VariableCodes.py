@@ -47,13 +47,23 @@ def getVariableHandle( context, variable ):
         if not variable.getOwner().isStatementTempBlock():
             variable = variable.getReferenced()
 
-        if not variable.getReferenced().getNeedsFree():
+        referenced = variable.getReferenced()
+
+        # Temporary variables of stackless generators may live in the context.
+        from_context = referenced.isInContext()
+
+        if from_context:
+            var_name = referenced.getContextName()
+
+        if not referenced.getNeedsFree():
             return TempObjectIdentifier(
-                var_name = var_name
+                var_name     = var_name,
+                from_context = from_context
             )
         else:
             return TempVariableIdentifier(
-                var_name = var_name
+                var_name     = var_name,
+                from_context = from_context
             )
     elif variable.isClosureReference():
         function = context.getFunction()
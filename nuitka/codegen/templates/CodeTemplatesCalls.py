@@ -224,3 +224,101 @@ PyObject *CALL_FUNCTION_WITH_ARGS( PyObject *called, %(args_decl)s )
     );
 }
 """
+
+template_call_method_impl = """\
+PyObject *%(helper)s( PyObjectMethodKeeper &method%(args_decl)s )
+{
+    PyObject *called = method.getCalled();
+    PyObject *self = method.getSelf();
+
+    // Not a function of the type, call what the lookup gave.
+    if ( self == NULL )
+    {
+        return %(fallback_call)s;
+    }
+
+    PyObject *args[] = { self%(args_list)s };
+
+    if ( Nuitka_Function_Check( called ) )
+    {
+        if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+        {
+            throw PythonException();
+        }
+
+        Nuitka_FunctionObject *function = (Nuitka_FunctionObject *)called;
+        PyObject *result;
+
+        if ( function->m_direct_arg_parser )
+        {
+            result = function->m_direct_arg_parser(
+                function,
+                args,
+                sizeof( args ) / sizeof( PyObject * )
+            );
+        }
+        else
+        {
+            result = function->m_code(
+                function,
+                args,
+                sizeof( args ) / sizeof( PyObject * ),
+                NULL
+            );
+        }
+
+        Py_LeaveRecursiveCall();
+
+        if ( result == NULL )
+        {
+            throw PythonException();
+        }
+
+        return result;
+    }
+    else
+    {
+        return _fast_function_args(
+            called,
+            args,
+            sizeof( args ) / sizeof( PyObject * )
+        );
+    }
+}
+"""
+
+template_call_module_function_decl = """\
+static PyObject *CALL_MODULE_FUNCTION_%(function_identifier)s( PyObject *called%(args_decl)s );
+"""
+
+template_call_module_function_impl = """\
+static PyObject *CALL_MODULE_FUNCTION_%(function_identifier)s( PyObject *called%(args_decl)s )
+{
+    assertObject( called );
+
+    // The module variable may have been changed through the module dictionary,
+    // so only call the implementation if it's still the function of the "def".
+    if (likely( Nuitka_Function_Check( called ) && ((Nuitka_FunctionObject *)called)->m_code == %(parse_function_identifier)s ))
+    {
+        if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+        {
+            throw PythonException();
+        }
+
+        PyObject *result = %(impl_function_identifier)s( (Nuitka_FunctionObject *)called%(args_forward)s );
+
+        Py_LeaveRecursiveCall();
+
+        if ( result == NULL )
+        {
+            throw PythonException();
+        }
+
+        return result;
+    }
+    else
+    {
+        return %(fallback_call)s;
+    }
+}
+"""
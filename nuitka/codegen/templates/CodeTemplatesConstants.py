@@ -30,11 +30,6 @@ PyObject *_sentinel_value = NULL;
 
 static void __initConstants( void )
 {
-    if ( %(needs_pickle)s )
-    {
-        UNSTREAM_INIT();
-    }
-
 %(constant_inits)s
 }
 
@@ -46,6 +46,64 @@ catch ( PythonException &_exception )
 %(exception_code)s
 }"""
 
+# For raises in the tried code, that jump to the handler, it is outside of the
+# catch, and the exception is taken from the Python error indicator.
+try_except_local_raise_template = """\
+try
+{
+%(tried_code)s
+}
+catch ( PythonException &_exception )
+{
+    _exception.toPython();
+
+    goto try_except_handler_%(try_count)d;
+}
+
+goto try_except_end_%(try_count)d;
+
+try_except_handler_%(try_count)d:
+{
+    PythonException _exception;
+
+    if ( !_exception.hasTraceback() )
+    {
+        _exception.setTraceback( %(tb_making)s );
+    }
+    else
+    {
+        _exception.addTraceback( frame_guard.getFrame0() );
+    }
+
+    frame_guard.preserveExistingException();
+
+#if PYTHON_VERSION >= 300
+    ExceptionRestorer%(guard_class)s restorer( &frame_guard );
+#endif
+    _exception.toExceptionHandler();
+
+%(exception_code)s
+}
+try_except_end_%(try_count)d:;"""
+
+template_raise_local = """\
+%(raise_code)s
+goto try_except_handler_%(try_count)d;"""
+
+# For lookups and calls, that may raise and are caught in the same function,
+# the error is checked for, and jumps to the handler.
+template_local_error_checked = """\
+{
+    PyObject *%(temp_var)s = %(value_identifier)s;
+
+    if (unlikely( %(temp_var)s == NULL ))
+    {
+        goto try_except_handler_%(try_count)d;
+    }
+
+%(assignment_code)s
+}"""
+
 template_setup_except_handler_detaching = """\
 frame_guard.detachFrame();"""
 
@@ -56,7 +114,7 @@ try_except_reraise_template = """\
     _exception.setTraceback( tb->tb_next );
     tb->tb_next = NULL;
 
-    throw;
+    throw _exception;
 }"""
 
 try_except_reraise_finally_template = """\
@@ -77,7 +135,7 @@ else
     _exception.setTraceback( tb->tb_next );
     tb->tb_next = NULL;
 
-    throw;
+    throw _exception;
 }"""
 
 try_finally_template = """\
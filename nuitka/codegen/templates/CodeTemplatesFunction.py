@@ -29,7 +29,7 @@ template_function_direct_declaration = """\
 
 function_context_body_template = """
 // This structure is for attachment as self of %(function_identifier)s.
-// It is allocated at the time the function object is created.
+// It is stored inline with the function object when that is created.
 struct _context_%(function_identifier)s_t
 {
     // The function can access a read-only closure of the creator.
@@ -42,7 +42,8 @@ static void _context_%(function_identifier)s_destructor( void *context_voidptr )
 
 %(context_free)s
 
-    delete _python_context;
+    // The storage belongs to the function object, only destroy the context.
+    _python_context->~_context_%(function_identifier)s_t();
 }
 """
 
@@ -52,11 +53,6 @@ _python_context->python_closure_%s(variable_name).shareWith( python_closure_%(va
 make_function_with_context_template = """
 static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args)s )
 {
-    struct _context_%(function_identifier)s_t *_python_context = new _context_%(function_identifier)s_t;
-
-    // Copy the parameter default values and closure values over.
-%(context_copy)s
-
     PyObject *result = Nuitka_Function_New(
         %(fparse_function_identifier)s,
         %(dparse_function_identifier)s,
@@ -72,10 +68,15 @@ static PyObject *MAKE_FUNCTION_%(function_identifier)s( %(function_creation_args
 #endif
         %(module_identifier)s,
         %(function_doc)s,
-        _python_context,
+        sizeof( struct _context_%(function_identifier)s_t ),
         _context_%(function_identifier)s_destructor
     );
 
+    struct _context_%(function_identifier)s_t *_python_context = new ( ((Nuitka_FunctionObject *)result)->m_context ) _context_%(function_identifier)s_t;
+
+    // Copy the parameter default values and closure values over.
+%(context_copy)s
+
     return result;
 }
 """
@@ -146,6 +147,7 @@ if ( isFrameUnusable( frame_%(frame_identifier)s ) )
 #if _DEBUG_REFRAME
         puts( "reframe for %(frame_identifier)s" );
 #endif
+        frame_statistics.missed += 1;
         Py_DECREF( frame_%(frame_identifier)s );
     }
 
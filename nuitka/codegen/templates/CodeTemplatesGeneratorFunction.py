@@ -213,6 +213,105 @@ catch ( PythonException &_exception )
     generator->m_yielded = NULL;
 }"""
 
+genfunc_resumable_template = """
+static PyObject *%(function_identifier)s_context( Nuitka_GeneratorObject *generator )
+{
+    // Make context accessible if one is used.
+%(context_access)s
+
+    if ( generator->m_resume_point == 0 )
+    {
+        // Local variable inits
+%(function_var_inits)s
+    }
+
+    // Actual function code.
+%(function_body)s
+
+    return NULL;
+}
+"""
+
+frame_guard_genfunc_resumable_template = """\
+static PyFrameObject *frame_%(frame_identifier)s = NULL;
+
+// When resumed, the frame was put on the frame stack already.
+if ( generator->m_resume_point == 0 )
+{
+    if ( isFrameUnusable( frame_%(frame_identifier)s ) )
+    {
+        if ( frame_%(frame_identifier)s )
+        {
+#if _DEBUG_REFRAME
+            puts( "reframe for %(frame_identifier)s" );
+#endif
+            Py_DECREF( frame_%(frame_identifier)s );
+        }
+
+        frame_%(frame_identifier)s = MAKE_FRAME( %(code_identifier)s, %(module_identifier)s );
+    }
+
+    Py_INCREF( frame_%(frame_identifier)s );
+    generator->m_frame = frame_%(frame_identifier)s;
+
+    Py_CLEAR( generator->m_frame->f_back );
+
+    generator->m_frame->f_back = PyThreadState_GET()->frame;
+    Py_INCREF( generator->m_frame->f_back );
+
+    PyThreadState_GET()->frame = generator->m_frame;
+}
+
+FrameGuardLight frame_guard( &generator->m_frame );
+
+bool traceback = false;
+
+try
+{
+    // Continue after the yield that returned last time.
+    switch( generator->m_resume_point )
+    {
+%(resume_cases)s
+    }
+
+    traceback = true;
+    CHECK_EXCEPTION( generator );
+    traceback = false;
+
+%(codes)s
+
+    PyErr_SetNone( PyExc_StopIteration );
+}
+catch ( PythonException &_exception )
+{
+    if ( !_exception.hasTraceback() )
+    {
+        _exception.setTraceback( %(tb_making)s );
+    }
+    else if ( traceback == false )
+    {
+        _exception.addTraceback( generator->m_frame );
+    }
+    _exception.toPython();
+}"""
+
+genfunc_resumable_start_template = """\
+if ( generator->m_resume_point == 0 )
+{
+%(codes)s
+}"""
+
+genfunc_resume_case_template = """\
+case %(resume_point)d: goto resume_%(resume_point)d;"""
+
+genfunc_yield_resumable_template = """\
+generator->m_resume_point = %(resume_point)d;
+return %(yielded)s;"""
+
+genfunc_resume_point_template = """\
+resume_%(resume_point)d:
+CHECK_EXCEPTION( generator );"""
+
 genfunc_common_context_use_template = """\
 struct _context_common_%(function_identifier)s_t *_python_common_context = (struct _context_common_%(function_identifier)s_t *)self->m_context;
 struct _context_generator_%(function_identifier)s_t *_python_context = new _context_generator_%(function_identifier)s_t;
@@ -118,6 +118,9 @@ int main( int argc, char *argv[] )
     PyType_Ready( &Nuitka_Function_Type );
     PyType_Ready( &Nuitka_Method_Type );
     PyType_Ready( &Nuitka_Frame_Type );
+#if PYTHON_VERSION < 300
+    PyType_Ready( &Nuitka_RangeIterator_Type );
+#endif
 
     enhancePythonTypes();
 
@@ -131,6 +134,8 @@ int main( int argc, char *argv[] )
     patchInspectModule();
     patchBuiltinModule();
 
+    registerStatisticsModule();
+
     // Execute the "__main__" module init function.
     MOD_INIT_NAME( __main__ )();
 
@@ -158,6 +163,10 @@ MOD_INIT_DECL( %(module_identifier)s );
 extern PyObject *_module_%(module_identifier)s;
 extern PyDictObject *_moduledict_%(module_identifier)s;
 
+#if PYTHON_VERSION < 330
+extern size_t _moduledict_version_%(module_identifier)s;
+#endif
+
 class PyObjectGlobalVariable_%(module_identifier)s
 {
     public:
@@ -166,10 +175,63 @@ class PyObjectGlobalVariable_%(module_identifier)s
             assert( var_name );
 
             this->var_name = (Nuitka_StringObject **)var_name;
+
+#if PYTHON_VERSION < 330
+            this->module_entry.table = NULL;
+            this->builtin_entry.table = NULL;
+            this->builtin_version = 0;
+#endif
         }
 
         PyObject *asObject0() const
         {
+#if PYTHON_VERSION < 330
+            // Try where the value was found the last time first. For the
+            // built-in value, the variable must not have been added to the
+            // module dictionary since, which changes its version.
+            PyObject *result = GET_CACHED_DICT_VALUE( _moduledict_%(module_identifier)s, *this->var_name, &this->module_entry );
+
+            if (likely( result != NULL ))
+            {
+                assertObject( result );
+
+                return result;
+            }
+
+            if ( this->builtin_version == _moduledict_version_%(module_identifier)s )
+            {
+                result = GET_CACHED_DICT_VALUE( dict_builtin, *this->var_name, &this->builtin_entry );
+
+                if (likely( result != NULL ))
+                {
+                    assertObject( result );
+
+                    return result;
+                }
+            }
+
+            result = GET_STRING_DICT_VALUE( _moduledict_%(module_identifier)s, *this->var_name, &this->module_entry );
+
+            if (likely( result != NULL ))
+            {
+                assertObject( result );
+
+                return result;
+            }
+
+            size_t version = _moduledict_version_%(module_identifier)s;
+
+            result = GET_STRING_DICT_VALUE( dict_builtin, *this->var_name, &this->builtin_entry );
+
+            if (likely( result != NULL ))
+            {
+                assertObject( result );
+
+                this->builtin_version = version;
+
+                return result;
+            }
+#else
             PyObject *result = GET_STRING_DICT_VALUE( _moduledict_%(module_identifier)s, *this->var_name );
 
             if (likely( result != NULL ))
@@ -187,6 +249,7 @@ class PyObjectGlobalVariable_%(module_identifier)s
 
                 return result;
             }
+#endif
 
             PyErr_Format( PyExc_NameError, "global name '%%s' is not defined", Nuitka_String_AsString( (PyObject *)*this->var_name ) );
             throw PythonException();
@@ -246,6 +309,12 @@ class PyObjectGlobalVariable_%(module_identifier)s
     private:
 
         Nuitka_StringObject **var_name;
+
+#if PYTHON_VERSION < 330
+        mutable Nuitka_DictEntryCache module_entry;
+        mutable Nuitka_DictEntryCache builtin_entry;
+        mutable size_t builtin_version;
+#endif
 };
 
 // Declarations from this module to other modules if any.
@@ -256,7 +325,7 @@ module_body_template = """
 #include "nuitka/prelude.hpp"
 
 #include "__modules.hpp"
-#include "__constants.hpp"
+#include "%(constants_header)s"
 #include "__helpers.hpp"
 
 // The _module_%(module_identifier)s is a Python object pointer of module type.
@@ -268,6 +337,10 @@ module_body_template = """
 PyObject *_module_%(module_identifier)s;
 PyDictObject *_moduledict_%(module_identifier)s;
 
+#if PYTHON_VERSION < 330
+size_t _moduledict_version_%(module_identifier)s = 0;
+#endif
+
 // The module level variables.
 %(module_globals)s
 
@@ -347,10 +420,17 @@ MOD_INIT_DECL( %(module_identifier)s )
     PyType_Ready( &Nuitka_Function_Type );
     PyType_Ready( &Nuitka_Method_Type );
     PyType_Ready( &Nuitka_Frame_Type );
+#if PYTHON_VERSION < 300
+    PyType_Ready( &Nuitka_RangeIterator_Type );
+#endif
+
+    enhancePythonTypes();
 
     patchInspectModule();
 
     patchBuiltinModule();
+
+    registerStatisticsModule();
 #endif
 
 #if _MODULE_UNFREEZER
@@ -381,6 +461,10 @@ MOD_INIT_DECL( %(module_identifier)s )
 
     _moduledict_%(module_identifier)s = (PyDictObject *)((PyModuleObject *)_module_%(module_identifier)s)->md_dict;
 
+#if PYTHON_VERSION < 330
+    TRACK_DICT_VERSION< &_moduledict_version_%(module_identifier)s >( _moduledict_%(module_identifier)s );
+#endif
+
     assertObject( _module_%(module_identifier)s );
 
 #ifndef _NUITKA_MODULE
@@ -24,6 +24,7 @@ many times.
 """
 from .FinalizeMarkups import FinalizeMarkups
 from .FinalizeClosureTaking import FinalizeClosureTaking
+from .FinalizeGenerators import FinalizeGenerators
 
 # Bug of pylint, it's there but it reports it wrongly, pylint: disable=E0611
 from nuitka.tree import Operations
@@ -31,3 +32,4 @@ from nuitka.tree import Operations
 def prepareCodeGeneration( tree ):
     Operations.visitScopes( tree, visitor = FinalizeMarkups() )
     Operations.visitFunctions( tree, visitor = FinalizeClosureTaking() )
+    Operations.visitFunctions( tree, visitor = FinalizeGenerators() )
@@ -0,0 +1,160 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Finalize the generators.
+
+Decide for generator functions, if they can be stackless, i.e. compiled to code
+that returns at every "yield" and continues at a resume point when entered
+again, instead of running on a fiber of their own.
+
+That is possible if all "yield" are statements, and are only nested in loops,
+conditional statements and temporary blocks, because these can be entered by
+jumps. The temporary variables of these blocks are then stored in the
+generator context, so they survive the return.
+
+"""
+
+from nuitka import Utils
+
+from nuitka.tree import Operations
+
+from .FinalizeBase import FinalizationVisitorBase
+
+class _YieldCollector( Operations.VisitorNoopMixin ):
+    def __init__( self ):
+        self.yields = []
+
+    def onEnterNode( self, node ):
+        if node.isExpressionYield():
+            self.yields.append( node )
+
+
+def _collectYields( node ):
+    collector = _YieldCollector()
+
+    Operations.visitTree( node, collector )
+
+    return collector.yields
+
+
+def _getResumePaths( function_body ):
+    """ Nodes to re-enter to reach the yields or None if not possible.
+
+    """
+    # Many cases to reject, pylint: disable=R0911,R0912
+
+    if function_body.hasLocalsDict() or function_body.isUnoptimized():
+        return None
+
+    # For Python3 the frame guard of an exception handler preserves the
+    # exception until it is left, which would be undone by the returns.
+    if Utils.python_version >= 300 and function_body.isTryExceptContaining():
+        return None
+
+    body = function_body.getBody()
+
+    if body is None:
+        return None
+
+    yields = _collectYields( body )
+
+    if not yields:
+        return None
+
+    resume_paths = []
+
+    for node in yields:
+        statement = node.getParent()
+
+        if not statement.isStatementExpressionOnly() or \
+           node.isExceptionPreserving():
+            return None
+
+        current = statement
+
+        while current is not function_body:
+            resume_paths.append( current )
+
+            parent = current.getParent()
+
+            if parent.isStatementsFrame():
+                if parent.getGuardMode() != "generator":
+                    return None
+            elif parent.isStatementsSequence():
+                # Only what precedes the frame can be done once at the start,
+                # there must be nothing after it.
+                if current.isStatementsFrame() and \
+                   parent.getStatements()[-1] is not current:
+                    return None
+            elif parent.isStatementTempBlock():
+                for variable in parent.getTempVariables():
+                    # Passed to other functions by reference, cannot change
+                    # the storage then.
+                    for reference in variable.getReferences():
+                        if reference.getReferences():
+                            return None
+            elif parent.isStatementLoop():
+                if parent.needsExceptionBreak() or \
+                   parent.needsExceptionContinue():
+                    return None
+            elif parent.isStatementConditional():
+                if current is parent.getCondition():
+                    return None
+
+                if _collectYields( parent.getCondition() ):
+                    return None
+            elif parent is function_body:
+                pass
+            else:
+                return None
+
+            current = parent
+
+    return resume_paths
+
+
+class FinalizeGenerators( FinalizationVisitorBase ):
+    def onEnterNode( self, node ):
+        assert node.isExpressionFunctionBody(), node
+
+        if not node.isGenerator():
+            return
+
+        resume_paths = _getResumePaths( node )
+
+        if resume_paths is None:
+            return
+
+        context_temp_variables = []
+
+        for resume_path in resume_paths:
+            if resume_path.isStatementTempBlock():
+                temp_variables = sorted(
+                    resume_path.getTempVariables(),
+                    key = lambda variable : variable.getName()
+                )
+
+                for variable in temp_variables:
+                    if not variable.isInContext():
+                        context_temp_variables.append( variable )
+
+                        variable.markAsInContext( len( context_temp_variables ) )
+
+        node.markAsStackless(
+            resume_paths           = resume_paths,
+            context_temp_variables = context_temp_variables
+        )
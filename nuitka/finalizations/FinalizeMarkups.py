@@ -29,6 +29,13 @@ Set a flag on return statements and functions that require the use of
 Set a flag on re-raises of exceptions if they can be simple throws or if they
 are in another context.
 
+Set a flag on raises of exceptions, and on subscript lookups and "next" calls
+as statements, that are caught by a try/except of the same function, so they
+can jump to the handler instead of throwing.
+
+Note the assignments to module variables, so calls of functions only assigned
+by their "def" can call the implementation directly.
+
 """
 
 from nuitka import Options, Utils
@@ -37,6 +44,25 @@ from .FinalizeBase import FinalizationVisitorBase
 
 from logging import warning
 
+def _findLocalTryExcept( statement ):
+    search = statement.getParent()
+
+    # Search up to the containing function, for a try/except with the
+    # statement in its tried block. A try/finally would need to see it.
+    while not search.isParentVariableProvider():
+        last_search = search
+        search = search.getParent()
+
+        if search.isStatementTryFinally() and \
+           last_search == search.getBlockTry():
+            return None
+
+        if search.isStatementTryExcept() and \
+           last_search == search.getBlockTry():
+            return search
+
+    return None
+
 class FinalizeMarkups( FinalizationVisitorBase ):
     def onEnterNode( self, node ):
         # This has many different things it deals with, so there need to be a lot of
@@ -145,9 +171,47 @@ class FinalizeMarkups( FinalizationVisitorBase ):
 
             search = node.getParent()
 
+        if node.isStatementRaiseException() and \
+           not node.isReraiseException():
+            try_except = _findLocalTryExcept( node )
+
+            if try_except is not None:
+                try_except.markAsLocalRaiseCatching()
+                node.markAsCaughtLocally()
+
+        # Errors of these, when assigned to a variable or ignored, can also be
+        # checked for and jump to the handler.
+        if ( node.isExpressionSubscriptLookup() or \
+             node.isExpressionBuiltinNext1() ) and \
+           ( node.parent.isStatementAssignmentVariable() or \
+             node.parent.isStatementExpressionOnly() ):
+            try_except = _findLocalTryExcept( node.parent )
+
+            if try_except is not None and \
+               not try_except.isStatementTryFinallyOptimized():
+                try_except.markAsLocalRaiseCatching()
+                node.markAsCaughtLocally()
+
         if node.isStatementDelVariable():
             node.getTargetVariableRef().getVariable().setHasDelIndicator()
 
+        if node.isStatementAssignmentVariable():
+            variable = node.getTargetVariableRef().getVariable()
+
+            while variable.isModuleVariableReference():
+                variable = variable.getReferenced()
+
+            if variable.isModuleVariable():
+                source = node.getAssignSource()
+
+                if source.isExpressionFunctionCreation() and \
+                   node.getParentVariableProvider().isPythonModule():
+                    variable.addAssignment(
+                        source.getFunctionRef().getFunctionBody()
+                    )
+                else:
+                    variable.addAssignment( None )
+
         if node.isStatementTryExcept():
             provider = node.getParentVariableProvider()
 
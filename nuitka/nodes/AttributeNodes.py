@@ -75,6 +75,36 @@ class ExpressionAttributeLookup( ExpressionChildrenHavingBase ):
             constraint_collection = constraint_collection
         )
 
+    def computeExpressionCall( self, call_node, constraint_collection ):
+        # Virtual method, pylint: disable=W0613
+        call_args = call_node.getCallArgs()
+        call_kw = call_node.getCallKw()
+
+        # Calls with positional arguments only can be method calls, that do
+        # not have to make a bound method of the attribute.
+        if call_kw.isExpressionConstantRef() and call_kw.getConstant() == {}:
+            if call_args.isExpressionMakeTuple() or \
+               ( call_args.isExpressionConstantRef() and \
+                 type( call_args.getConstant() ) is tuple ):
+                from .CallNodes import ExpressionCallMethod
+
+                result = ExpressionCallMethod(
+                    source         = self.getLookupSource(),
+                    attribute_name = self.getAttributeName(),
+                    args           = call_args,
+                    source_ref     = call_node.getSourceReference()
+                )
+
+                return (
+                    result,
+                    "new_expression",
+                    "Call of attribute '%s' replaced with method call." % (
+                        self.getAttributeName()
+                    )
+                )
+
+        return call_node, None, None
+
     def isKnownToBeIterable( self, count ):
         # TODO: Could be known.
         return None
@@ -83,6 +113,12 @@ class ExpressionAttributeLookup( ExpressionChildrenHavingBase ):
 class ExpressionSpecialAttributeLookup( ExpressionAttributeLookup ):
     kind = "EXPRESSION_SPECIAL_ATTRIBUTE_LOOKUP"
 
+    def computeExpressionCall( self, call_node, constraint_collection ):
+        # Virtual method, pylint: disable=R0201,W0613
+
+        # Special lookups are not done on the instance, keep them as they are.
+        return call_node, None, None
+
     # TODO: Special lookups should be treated somehow different.
     def computeExpression( self, constraint_collection ):
         lookup_source = self.getLookupSource()
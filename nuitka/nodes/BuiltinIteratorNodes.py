@@ -45,6 +45,10 @@ class ExpressionBuiltinLen( ExpressionBuiltinSingleArgBase ):
     def getIntegerValue( self ):
         return self.getValue().getIterationLength()
 
+    def getTypeShape( self ):
+        # Virtual method, pylint: disable=R0201
+        return int
+
     def computeExpression( self, constraint_collection ):
         from .NodeMakingHelpers import makeConstantReplacementNode, wrapExpressionWithNodeSideEffects
 
@@ -135,7 +139,10 @@ class ExpressionBuiltinIter1( ExpressionBuiltinSingleArgBase ):
         if value.isIteratorMaking():
             return value, "new_builtin", "Eliminated useless iterator creation"
         else:
-            return self, None, None
+            return value.computeExpressionIter1(
+                iter_node             = self,
+                constraint_collection = constraint_collection
+            )
 
     def isIteratorMaking( self ):
         return True
@@ -150,6 +157,9 @@ class ExpressionBuiltinIter1( ExpressionBuiltinSingleArgBase ):
     def getIterationLength( self ):
         return self.getValue().getIterationLength()
 
+    def getIterationTypeShape( self ):
+        return self.getValue().getIterationTypeShape()
+
     def extractSideEffects( self ):
         # Iterator making is the side effect itself.
         if self.getValue().isCompileTimeConstant():
@@ -168,11 +178,29 @@ class ExpressionBuiltinIter1( ExpressionBuiltinSingleArgBase ):
 class ExpressionBuiltinNext1( ExpressionBuiltinSingleArgBase ):
     kind = "EXPRESSION_BUILTIN_NEXT1"
 
+    def __init__( self, value, source_ref ):
+        ExpressionBuiltinSingleArgBase.__init__(
+            self,
+            value      = value,
+            source_ref = source_ref
+        )
+
+        self.caught_locally = False
+
+    def markAsCaughtLocally( self ):
+        self.caught_locally = True
+
+    def isCaughtLocally( self ):
+        return self.caught_locally
+
     def getDetails( self ):
         return {
             "iter" : self.getValue()
         }
 
+    def getTypeShape( self ):
+        return self.getValue().getIterationTypeShape()
+
     def makeCloneAt( self, source_ref ):
         return self.__class__(
             value      = self.getValue(),
@@ -66,6 +66,10 @@ class ExpressionBuiltinRangeBase( ExpressionChildrenHavingBase ):
         else:
             return length > 0
 
+    def getIterationTypeShape( self ):
+        # Virtual method, pylint: disable=R0201
+        return int
+
     def mayHaveSideEffects( self ):
         for child in self.getVisitableNodes():
             if child.mayHaveSideEffects():
@@ -77,6 +81,52 @@ class ExpressionBuiltinRangeBase( ExpressionChildrenHavingBase ):
         else:
             return False
 
+    def computeExpressionIter1( self, iter_node, constraint_collection ):
+        # Only the iteration is used, pylint: disable=W0613
+
+        # Python3 range objects are not lists, nothing to gain.
+        if python_version >= 300:
+            return iter_node, None, None
+
+        # The iterator has the same children, just takes them over.
+        new_node = self.iter_range_class(
+            source_ref = iter_node.getSourceReference(),
+            **dict( self.getVisitableNodesNamed() )
+        )
+
+        return (
+            new_node,
+            "new_builtin",
+            "Iteration over builtin range lowered to counting iterator."
+        )
+
+
+class ExpressionBuiltinIterRangeMixin:
+    """ Mixin for iterators over range values, not creating the list.
+
+        These are created when range is only iterated over, as in "for" loops
+        and contractions. At run time, C long counters are used, and no list
+        of values is created.
+    """
+
+    def isIteratorMaking( self ):
+        # Virtual method, pylint: disable=R0201
+        return True
+
+    def getTruthValue( self ):
+        # Virtual method, pylint: disable=R0201
+        return None
+
+    def getValueFriend( self, constraint_collection ):
+        # Virtual method, pylint: disable=W0613
+        from .BuiltinIteratorNodes import ValueFriendBuiltinIter1
+
+        return ValueFriendBuiltinIter1( self )
+
+    def computeExpression( self, constraint_collection ):
+        # Never to be computed into a list again, pylint: disable=W0613
+        return self, None, None
+
 
 class ExpressionBuiltinRange1( ExpressionBuiltinRangeBase ):
     kind = "EXPRESSION_BUILTIN_RANGE1"
@@ -362,3 +412,23 @@ class ExpressionBuiltinRange3( ExpressionBuiltinRangeBase ):
 
     def isKnownToBeIterable( self, count ):
         return count is None or count == self.getIterationLength()
+
+
+class ExpressionBuiltinIterRange1( ExpressionBuiltinIterRangeMixin,
+                                   ExpressionBuiltinRange1 ):
+    kind = "EXPRESSION_BUILTIN_ITER_RANGE1"
+
+
+class ExpressionBuiltinIterRange2( ExpressionBuiltinIterRangeMixin,
+                                   ExpressionBuiltinRange2 ):
+    kind = "EXPRESSION_BUILTIN_ITER_RANGE2"
+
+
+class ExpressionBuiltinIterRange3( ExpressionBuiltinIterRangeMixin,
+                                   ExpressionBuiltinRange3 ):
+    kind = "EXPRESSION_BUILTIN_ITER_RANGE3"
+
+
+ExpressionBuiltinRange1.iter_range_class = ExpressionBuiltinIterRange1
+ExpressionBuiltinRange2.iter_range_class = ExpressionBuiltinIterRange2
+ExpressionBuiltinRange3.iter_range_class = ExpressionBuiltinIterRange3
@@ -28,6 +28,8 @@ from .NodeBases import ExpressionChildrenHavingBase
 
 from .ConstantRefNodes import ExpressionConstantRef
 
+from .AttributeNodes import ExpressionAttributeLookup
+
 
 class ExpressionCall( ExpressionChildrenHavingBase ):
     kind = "EXPRESSION_CALL"
@@ -158,3 +160,78 @@ class ExpressionCallEmpty( ExpressionCall ):
             ),
             source_ref = source_ref
         )
+
+
+class ExpressionCallMethod( ExpressionChildrenHavingBase ):
+    """ Call of an attribute with positional arguments only.
+
+        This is made from a call of an attribute lookup, so the attribute can be
+        looked up for the call, and functions of the type can be called with the
+        object as first argument, without making a bound method first.
+    """
+
+    kind = "EXPRESSION_CALL_METHOD"
+
+    named_children = ( "source", "args" )
+
+    def __init__( self, source, attribute_name, args, source_ref ):
+        assert source.isExpression()
+        assert args.isExpression()
+
+        ExpressionChildrenHavingBase.__init__(
+            self,
+            values     = {
+                "source" : source,
+                "args"   : args
+            },
+            source_ref = source_ref
+        )
+
+        self.attribute_name = attribute_name
+
+    def getAttributeName( self ):
+        return self.attribute_name
+
+    def getDetails( self ):
+        return { "attribute_name" : self.getAttributeName() }
+
+    def getDetail( self ):
+        return "call of attribute %s from %s" % (
+            self.getAttributeName(),
+            self.getLookupSource()
+        )
+
+    getLookupSource = ExpressionChildrenHavingBase.childGetter( "source" )
+    getCallArgs = ExpressionChildrenHavingBase.childGetter( "args" )
+
+    def computeExpression( self, constraint_collection ):
+        source = self.getLookupSource()
+
+        if source.willRaiseException( BaseException ):
+            return source, "new_raise", "Method call source raises exception"
+
+        args = self.getCallArgs()
+
+        if args.willRaiseException( BaseException ):
+            from .NodeMakingHelpers import wrapExpressionWithSideEffects
+
+            # The attribute is looked up before the arguments are evaluated,
+            # and may raise as well.
+            result = wrapExpressionWithSideEffects(
+                side_effects = (
+                    ExpressionAttributeLookup(
+                        expression     = source,
+                        attribute_name = self.getAttributeName(),
+                        source_ref     = self.getSourceReference()
+                    ),
+                ),
+                old_node     = self,
+                new_node     = args
+            )
+
+            return result, "new_raise", "Method call arguments raise exception"
+
+        # The method may change the object it is called on.
+        source.onContentEscapes( constraint_collection )
+
+        return self, None, None
@@ -51,6 +51,7 @@ class StatementRaiseException( StatementChildrenHavingBase ):
 
         self.reraise_local = False
         self.reraise_finally = False
+        self.caught_locally = False
 
     getExceptionType = StatementChildrenHavingBase.childGetter( "exception_type" )
     getExceptionValue = StatementChildrenHavingBase.childGetter( "exception_value" )
@@ -76,6 +77,12 @@ class StatementRaiseException( StatementChildrenHavingBase ):
     def markAsReraiseFinally( self ):
         self.reraise_finally = True
 
+    def markAsCaughtLocally( self ):
+        self.caught_locally = True
+
+    def isCaughtLocally( self ):
+        return self.caught_locally
+
     def isStatementAborting( self ):
         return True
 
@@ -539,10 +539,7 @@ class ExpressionFunctionRef( NodeBase, ExpressionMixin ):
         return self.function_body
 
     def computeExpressionRaw( self, constraint_collection ):
-        from nuitka.optimizations.ConstraintCollections import ConstraintCollectionFunction
-
-        collector = ConstraintCollectionFunction( constraint_collection )
-        collector.process( self.getFunctionBody() )
+        constraint_collection.onFunctionBody( self.getFunctionBody() )
 
         # TODO: Function body may know something.
         return self, None, None
@@ -71,12 +71,33 @@ class MarkGeneratorIndicator:
     def __init__( self ):
         self.is_generator = False
 
+        # For generators that can be resumed without a fiber of their own, the
+        # statements that lead to a "yield" and will need to be re-entered, and
+        # the temporary variables that must therefore live in the context.
+        self.resume_paths = None
+        self.context_temp_variables = ()
+
     def markAsGenerator( self ):
         self.is_generator = True
 
     def isGenerator( self ):
         return self.is_generator
 
+    def markAsStackless( self, resume_paths, context_temp_variables ):
+        assert self.is_generator
+
+        self.resume_paths = set( resume_paths )
+        self.context_temp_variables = tuple( context_temp_variables )
+
+    def isStackless( self ):
+        return self.resume_paths is not None
+
+    def isResumePath( self, node ):
+        return node in self.resume_paths
+
+    def getContextTempVariables( self ):
+        return self.context_temp_variables
+
 
 class MarkUnoptimizedFunctionIndicator:
     """ Mixin for indication that a function contains an exec or star import.
@@ -775,6 +775,29 @@ class ExpressionMixin:
         else:
             return None
 
+    def getTypeShape( self ):
+        """ Return expected type of the value. The "None" value indicates unknown.
+
+            For constants, this is their type. Otherwise it is derived from the
+            operations and variables involved, and only what is expected, e.g.
+            "int" operations can overflow to "long" values. Code generation may
+            use helpers specialized to the type then, which still check it.
+        """
+
+        if self.isCompileTimeConstant():
+            return type( self.getCompileTimeConstant() )
+        else:
+            return None
+
+    def getIterationTypeShape( self ):
+        """ Return expected type of the values produced by iterating the value.
+
+            The "None" value indicates unknown.
+        """
+
+        # Virtual method, pylint: disable=R0201
+        return None
+
     def isKnownToBeIterable( self, count ):
         """ Can be iterated at all (count is None) or exactly count times.
 
@@ -891,6 +914,11 @@ class ExpressionMixin:
 
         return not_node, None, None
 
+    def computeExpressionIter1( self, iter_node, constraint_collection ):
+        # By default, there is no better way to iterate, virtual method,
+        # pylint: disable=R0201,W0613
+        return iter_node, None, None
+
     def onContentEscapes( self, constraint_collection ):
         pass
 
@@ -27,6 +27,15 @@ from nuitka import PythonOperators
 
 import math
 
+# Operations that give "int" results for "int" operands, only that with
+# Python2, the result may also overflow to "long".
+_int_result_operators = (
+    "Add", "Sub", "Mult", "FloorDiv", "Mod",
+    "BitAnd", "BitOr", "BitXor", "LShift", "RShift",
+    "IAdd", "ISub", "IMult", "IFloorDiv", "IMod",
+    "IBitAnd", "IBitOr", "IBitXor", "ILShift", "IRShift",
+)
+
 class ExpressionOperationBase( ExpressionChildrenHavingBase ):
     def __init__( self, operator, simulator, values, source_ref ):
         ExpressionChildrenHavingBase.__init__(
@@ -159,6 +168,14 @@ class ExpressionOperationBinary( ExpressionOperationBase ):
     getLeft = ExpressionChildrenHavingBase.childGetter( "left" )
     getRight = ExpressionChildrenHavingBase.childGetter( "right" )
 
+    def getTypeShape( self ):
+        if self.getOperator() in _int_result_operators and \
+           self.getLeft().getTypeShape() is int and \
+           self.getRight().getTypeShape() is int:
+            return int
+        else:
+            return ExpressionOperationBase.getTypeShape( self )
+
 
 class ExpressionOperationUnary( ExpressionOperationBase ):
     kind = "EXPRESSION_OPERATION_UNARY"
@@ -41,9 +41,17 @@ class ExpressionSubscriptLookup( ExpressionChildrenHavingBase ):
             source_ref = source_ref
         )
 
+        self.caught_locally = False
+
     getLookupSource = ExpressionChildrenHavingBase.childGetter( "expression" )
     getSubscript = ExpressionChildrenHavingBase.childGetter( "subscript" )
 
+    def markAsCaughtLocally( self ):
+        self.caught_locally = True
+
+    def isCaughtLocally( self ):
+        return self.caught_locally
+
     def computeExpression( self, constraint_collection ):
         lookup_source = self.getLookupSource()
 
@@ -178,11 +178,19 @@ class StatementTryExcept( StatementChildrenHavingBase ):
             source_ref = source_ref
         )
 
+        self.local_raise_catching = False
+
     getBlockTry = StatementChildrenHavingBase.childGetter( "tried" )
     setBlockTry = StatementChildrenHavingBase.childSetter( "tried" )
 
     getExceptionHandlers = StatementChildrenHavingBase.childGetter( "handlers" )
 
+    def markAsLocalRaiseCatching( self ):
+        self.local_raise_catching = True
+
+    def needsLocalRaiseCatching( self ):
+        return self.local_raise_catching
+
     def isStatementAborting( self ):
         tried_block = self.getBlockTry()
 
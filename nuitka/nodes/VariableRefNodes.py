@@ -152,6 +152,13 @@ class ExpressionVariableRef( NodeBase, ExpressionMixin ):
     def isKnownToBeIterable( self, count ):
         return None
 
+    def getTypeShape( self ):
+        # Decided by constraint collection from all assignments, if possible.
+        return self.variable.getTypeShape()
+
+    def getIterationTypeShape( self ):
+        return self.variable.getIterationTypeShape()
+
     def mayProvideReference( self ):
         # Variables are capable of "asObject0".
         return False
@@ -248,6 +255,14 @@ class ExpressionTempVariableRef( NodeBase, ExpressionMixin ):
         # Can't happen
         return False
 
+    def getTypeShape( self ):
+        # Decided by constraint collection from all assignments, which is done
+        # for the temporary variable, not its references.
+        return self.variable.getReferenced().getTypeShape()
+
+    def getIterationTypeShape( self ):
+        return self.variable.getReferenced().getIterationTypeShape()
+
     def isKnownToBeIterableAtMin( self, count ):
         return None
 
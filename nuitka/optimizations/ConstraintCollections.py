@@ -87,6 +87,9 @@ class VariableTraceBase:
     def isUninitTrace( self ):
         return False
 
+    def isUnknownTrace( self ):
+        return False
+
 
 class VariableUninitTrace( VariableTraceBase ):
     def __init__( self, variable, version ):
@@ -118,6 +121,9 @@ class VariableUnknownTrace( VariableTraceBase ):
             version  = version
         )
 
+    def isUnknownTrace( self ):
+        return True
+
     def dump( self ):
         debug( "Trace of %s %d:", self.variable, self.version )
         debug( "  Starts unknown" )
@@ -351,6 +357,12 @@ class ConstraintCollectionBase( CollectionTracingMixin ):
 
         self.parent = parent
 
+        # The module collection is the root of all collections.
+        if parent is None:
+            self.module_collection = self
+        else:
+            self.module_collection = parent.module_collection
+
         self.variables = {}
 
         # Trust variable_traces, should go away later on, for now we use it to
@@ -602,6 +614,8 @@ class ConstraintCollectionBase( CollectionTracingMixin ):
 
         assert expression.isExpression(), expression
 
+        self.module_collection.visited_nodes += 1
+
         # Now compute this expression, allowing it to replace itself with
         # something else as part of a local peephole optimization.
         r = expression.computeExpressionRaw( self )
@@ -650,6 +664,12 @@ class ConstraintCollectionBase( CollectionTracingMixin ):
 
         return new_node
 
+    def onFunctionBody( self, function_body ):
+        # Function bodies that did not change, are not looked at again.
+        if self.module_collection.shallProcessFunctionBody( function_body ):
+            collector = ConstraintCollectionFunction( self )
+            collector.process( function_body )
+
     def onModuleVariableAssigned( self, variable, value_friend ):
         self.parent.onModuleVariableAssigned( variable, value_friend )
 
@@ -751,6 +771,8 @@ Side effects of assignments promoted to statements."""
         try:
             assert statement.isStatement(), statement
 
+            self.module_collection.visited_nodes += 1
+
             new_statement, change_tags, change_desc = statement.computeStatement( self )
 
             if new_statement is not statement:
@@ -898,6 +920,10 @@ class ConstraintCollectionFunction( CollectionStartpointMixin,
         assert function_body.isExpressionFunctionBody()
         self.function_body = function_body
 
+        self.signalChange = self.module_collection.getBodySignalChange(
+            function_body
+        )
+
         statements_sequence = function_body.getBody()
 
         if statements_sequence is not None and \
@@ -935,6 +961,7 @@ class ConstraintCollectionFunction( CollectionStartpointMixin,
                 function_body.setBody( result )
 
         self.setIndications()
+        self.setTypeShapes()
 
         if not Options.isExperimental() or self.removes_knowledge:
             return
@@ -978,6 +1005,83 @@ class ConstraintCollectionFunction( CollectionStartpointMixin,
                             )
 
 
+    def setTypeShapes( self ):
+        """ Decide the type shapes of variables, for code generation to use.
+
+            All assignments of a variable must be known, and their values have
+            the same shape. Values may depend on the variable itself, as with
+            "total += value", so shapes are assumed first, and then removed
+            again, until they agree with all assignments. Only "int" shapes are
+            decided, as only these have specialized code.
+        """
+
+        function_body = self.function_body
+
+        assignments = {}
+        unknown = set()
+
+        for variable_trace in self.variable_traces.values():
+            variable = variable_trace.getVariable()
+
+            # Temporary variables are only assigned in the temporary block, and
+            # local variables only in the function, unless they are shared.
+            if variable.isTempVariableReference() and \
+               not variable.isClosureReference():
+                variable = variable.getReferenced()
+            elif not variable.isLocalVariable() or variable.isShared():
+                continue
+
+            variable.setTypeShape( None )
+            variable.setIterationTypeShape( None )
+
+            if variable_trace.isAssignTrace():
+                assignments.setdefault( variable, [] ).append(
+                    variable_trace.getAssignNode().parent.getAssignSource()
+                )
+            elif variable_trace.isUnknownTrace():
+                unknown.add( variable )
+
+        # Cannot know all assignments, if an "exec" may change the locals, but
+        # "locals" and "eval" cannot change them, so these don't matter.
+        if function_body.isUnoptimized() or function_body.hasLocalsDict() or \
+           function_body.isClassDictCreation():
+            return
+
+        variables = [
+            variable
+            for variable in
+            assignments
+            if variable not in unknown
+        ]
+
+        for variable in variables:
+            variable.setTypeShape( int )
+            variable.setIterationTypeShape( int )
+
+        changed = True
+
+        while changed:
+            changed = False
+
+            for variable in variables:
+                sources = assignments[ variable ]
+
+                if variable.getTypeShape() is not None:
+                    for source in sources:
+                        if source.getTypeShape() is not int:
+                            variable.setTypeShape( None )
+                            changed = True
+
+                            break
+
+                if variable.getIterationTypeShape() is not None:
+                    for source in sources:
+                        if source.getIterationTypeShape() is not int:
+                            variable.setIterationTypeShape( None )
+                            changed = True
+
+                            break
+
     def onLocalVariableAssigned( self, variable, value_friend ):
         self._getVariableUsage( variable ).markAsWrittenTo( value_friend )
 
@@ -1002,7 +1106,7 @@ class ConstraintCollectionModule( CollectionStartpointMixin,
                                   ConstraintCollectionBase,
                                   VariableUsageTrackingMixin,
                                    ):
-    def __init__( self, signal_change ):
+    def __init__( self, signal_change, process_bodies = None ):
         CollectionStartpointMixin.__init__( self )
 
         ConstraintCollectionBase.__init__(
@@ -1013,23 +1117,42 @@ class ConstraintCollectionModule( CollectionStartpointMixin,
 
         VariableUsageTrackingMixin.__init__( self )
 
-
         self.module = None
 
+        self.module_signal_change = signal_change
+
+        # The module and function bodies to process, "None" means all of them.
+        self.process_bodies = process_bodies
+
+        # The module and function bodies, that signalled a change.
+        self.changed_bodies = set()
+
+        # Number of statements and expressions visited.
+        self.visited_nodes = 0
+
     def process( self, module ):
         assert module.isPythonModule()
         self.module = module
 
+        self.signalChange = self.getBodySignalChange( module )
+
         module_body = module.getBody()
 
         for variable in module.getVariables():
             self.initVariableUnknown( variable.makeReference( module ) )
 
-        if module_body is not None:
-            result = self.onStatementsSequence( module_body )
+        if self.shallProcessFunctionBody( module ):
+            if module_body is not None:
+                result = self.onStatementsSequence( module_body )
 
-            if result is not module_body:
-                module.setBody( result )
+                if result is not module_body:
+                    module.setBody( result )
+        else:
+            # Only functions changed, visit these without the module body.
+            for function_body in module.getFunctions():
+                if function_body in self.process_bodies and \
+                   function_body.getParentVariableProvider() is module:
+                    self.onFunctionBody( function_body )
 
         self.setIndications()
 
@@ -1062,6 +1185,25 @@ class ConstraintCollectionModule( CollectionStartpointMixin,
                         "Recursed to module package."
                     )
 
+    def shallProcessFunctionBody( self, body ):
+        return self.process_bodies is None or body in self.process_bodies
+
+    def getBodySignalChange( self, body ):
+        """ Make a change signal function that notes the body as changed. """
+
+        def signalChange( tags, source_ref, message ):
+            self.changed_bodies.add( body )
+
+            self.module_signal_change( tags, source_ref, message )
+
+        return signalChange
+
+    def getChangedBodies( self ):
+        return self.changed_bodies
+
+    def getVisitedNodeCount( self ):
+        return self.visited_nodes
+
     def onModuleVariableAssigned( self, variable, value_friend ):
         while variable.isModuleVariableReference():
             variable = variable.getReferenced()
@@ -24,7 +24,7 @@ make others possible.
 
 from .Tags import TagSet
 
-from nuitka import Options, Variables
+from nuitka import Options, Timing, Variables
 from nuitka.tree import Building
 
 from nuitka.Tracing import printLine
@@ -35,7 +35,7 @@ from logging import debug
 
 _progress = Options.isShowProgress()
 
-def _optimizeModulePass( module, tag_set ):
+def _optimizeModulePass( module, tag_set, process_bodies, written_variables ):
     def signalChange( tags, source_ref, message ):
         """ Indicate a change to the optimization framework.
 
@@ -44,10 +44,18 @@ def _optimizeModulePass( module, tag_set ):
 
         tag_set.onSignal( tags )
 
-    constraint_collection = ConstraintCollectionModule( signalChange )
+    constraint_collection = ConstraintCollectionModule(
+        signal_change  = signalChange,
+        process_bodies = process_bodies
+    )
     constraint_collection.process( module = module )
 
-    written_variables = constraint_collection.getWrittenVariables()
+    # Writes are only known for the processed bodies, the others still do
+    # what they did in the previous pass.
+    if process_bodies is None:
+        written_variables.clear()
+
+    written_variables.update( constraint_collection.getWrittenVariables() )
 
     for variable in module.getVariables():
         old_value = variable.getReadOnlyIndicator()
@@ -65,24 +73,90 @@ def _optimizeModulePass( module, tag_set ):
 
             variable.setReadOnlyIndicator( new_value )
 
+    return constraint_collection
+
+def _getAffectedBodies( changed_bodies ):
+    """ Get the bodies to process again, after the given ones changed.
+
+        Function bodies are only reached through the body providing them, so
+        these are processed again too, the module body only if it changed
+        itself.
+    """
+
+    result = set()
+
+    for body in changed_bodies:
+        if body.isPythonModule():
+            result.add( body )
+
+        while not body.isPythonModule() and body not in result:
+            result.add( body )
+
+            body = body.getParentVariableProvider()
+
+    return result
 
 def optimizeModule( module ):
     if _progress:
         printLine( "Doing module local optimizations for '%s'." % module.getFullName() )
 
+    start_times = Timing.getTimes()
+
     tag_set = TagSet()
 
+    # Start with all of the module, then only process what changed, unless
+    # the change may have effects everywhere.
+    process_bodies = None
+    written_variables = set()
+
+    passes = 0
+    visited_nodes = 0
+    revisited_nodes = 0
+
     while True:
         tag_set.clear()
 
-        _optimizeModulePass(
-            module  = module,
-            tag_set = tag_set
+        constraint_collection = _optimizeModulePass(
+            module            = module,
+            tag_set           = tag_set,
+            process_bodies    = process_bodies,
+            written_variables = written_variables
         )
 
+        visited_nodes += constraint_collection.getVisitedNodeCount()
+
+        if passes > 0:
+            revisited_nodes += constraint_collection.getVisitedNodeCount()
+
+        passes += 1
+
         if not tag_set:
             break
 
+        if tag_set.check( "new_code read_only_mvar" ):
+            process_bodies = None
+        else:
+            process_bodies = _getAffectedBodies(
+                constraint_collection.getChangedBodies()
+            )
+
+    if _progress:
+        printLine(
+            "Optimized module '%s' in %d passes, revisiting %d nodes." % (
+                module.getFullName(),
+                passes,
+                revisited_nodes
+            )
+        )
+
+    Timing.addModuleTimes(
+        module_name = module.getFullName(),
+        step        = "optimization",
+        times       = Timing.getTimesSince( start_times )
+    )
+    Timing.addModuleValue( module.getFullName(), "optimization_passes", passes )
+    Timing.addModuleValue( module.getFullName(), "visited_nodes", visited_nodes )
+
     return module
 
 def getImportedModules():
@@ -43,6 +43,7 @@ from nuitka import (
     SourceCodeReferences,
     SyntaxErrors,
     Options,
+    Timing,
     Utils
 )
 
@@ -95,7 +96,10 @@ from .VariableClosure import completeVariableClosures
 
 # Classes are handled in a separate file. They are re-formulated into functions
 # producing dictionaries used to call the metaclass with.
-from .ReformulationClasses import buildClassNode
+from .ReformulationClasses import (
+    noteModuleClassUsages,
+    buildClassNode
+)
 
 # Try/except/else statements are handled in a separate file. They are
 # re-formulated into using a temporary variable to track if the else branch
@@ -833,6 +837,8 @@ def buildParseTree( provider, source_code, source_ref, is_module ):
     body = ast.parse( source_code, source_ref.getFilename() )
     assert getKind( body ) == "Module"
 
+    noteModuleClassUsages( body )
+
     line_offset = source_ref.getLineNumber() - 1
 
     if line_offset > 0:
@@ -1044,6 +1050,8 @@ def buildModuleTree( filename, package, is_top, is_main ):
 
     assert package is None or type( package ) is str
 
+    start_times = Timing.getTimes()
+
     if is_main and Utils.isDir( filename ):
         source_filename = Utils.joinpath( filename, "__main__.py" )
 
@@ -1171,4 +1179,10 @@ def buildModuleTree( filename, package, is_top, is_main ):
 
     completeVariableClosures( result )
 
+    Timing.addModuleTimes(
+        module_name = result.getFullName(),
+        step        = "building",
+        times       = Timing.getTimesSince( start_times )
+    )
+
     return result
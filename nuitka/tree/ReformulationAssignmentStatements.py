@@ -485,66 +485,25 @@ def buildDeleteNode( provider, node, source_ref ):
         source_ref = source_ref
     )
 
-def _buildInplaceAssignVariableNode( result, variable_ref, tmp_variable1, tmp_variable2,
-                                     operator, expression, source_ref ):
+def _buildInplaceAssignVariableNode( variable_ref, operator, expression,
+                                     source_ref ):
     assert variable_ref.isExpressionTargetVariableRef(), variable_ref
 
-    return (
-        # First assign the target value to a temporary variable.
-        StatementAssignmentVariable(
-            variable_ref = ExpressionTargetTempVariableRef(
-                variable   = tmp_variable1.makeReference( result ),
-                source_ref = source_ref
-            ),
-            source     = ExpressionVariableRef(
+    # Variables are assigned even if the value doesn't change, just like CPython
+    # does it. Not holding the value in a temporary variable also allows code
+    # generation to update the value in place, e.g. for strings.
+    return StatementAssignmentVariable(
+        variable_ref = variable_ref,
+        source     = ExpressionOperationBinaryInplace(
+            operator   = operator,
+            left       = ExpressionVariableRef(
                 variable_name = variable_ref.getVariableName(),
                 source_ref    = source_ref
             ),
+            right      = expression,
             source_ref = source_ref
         ),
-        # Second assign the inplace result to a temporary variable.
-        StatementAssignmentVariable(
-            variable_ref = ExpressionTargetTempVariableRef(
-                variable   = tmp_variable2.makeReference( result ),
-                source_ref = source_ref
-            ),
-            source     = ExpressionOperationBinaryInplace(
-                operator   = operator,
-                left       = ExpressionTempVariableRef(
-                    variable   = tmp_variable1.makeReference( result ),
-                    source_ref = source_ref
-                ),
-                right      = expression,
-                source_ref = source_ref
-            ),
-            source_ref = source_ref
-        ),
-        # Copy it over, if the reference values change, i.e. IsNot is true.
-        StatementConditional(
-            condition = ExpressionComparisonIsNOT(
-                left       = ExpressionTempVariableRef(
-                    variable   = tmp_variable1.makeReference( result ),
-                    source_ref = source_ref
-                ),
-                right      = ExpressionTempVariableRef(
-                    variable   = tmp_variable2.makeReference( result ),
-                    source_ref = source_ref
-                ),
-                source_ref = source_ref
-            ),
-            yes_branch = makeStatementsSequenceFromStatement(
-                statement = StatementAssignmentVariable(
-                    variable_ref = variable_ref.makeCloneAt( source_ref ),
-                    source     = ExpressionTempVariableRef(
-                        variable   = tmp_variable2.makeReference( result ),
-                        source_ref = source_ref
-                    ),
-                    source_ref = source_ref
-                )
-            ),
-            no_branch = None,
-            source_ref = source_ref
-        )
+        source_ref = source_ref
     )
 
 def _buildInplaceAssignAttributeNode( result, lookup_source, attribute_name, tmp_variable1,
@@ -774,17 +733,12 @@ def buildInplaceAssignNode( provider, node, source_ref ):
     if kind == "Name":
         variable_ref = detail
 
-        tmp_variable1 = result.getTempVariable( "inplace_start" )
-        tmp_variable2 = result.getTempVariable( "inplace_end" )
-
-        statements = _buildInplaceAssignVariableNode(
-            result        = result,
-            variable_ref  = variable_ref,
-            tmp_variable1 = tmp_variable1,
-            tmp_variable2 = tmp_variable2,
-            operator      = operator,
-            expression    = expression,
-            source_ref    = source_ref
+        # No temporary variables needed, so no need for the block.
+        return _buildInplaceAssignVariableNode(
+            variable_ref = variable_ref,
+            operator     = operator,
+            expression   = expression,
+            source_ref   = source_ref
         )
     elif kind == "Attribute":
         lookup_source, attribute_name = detail
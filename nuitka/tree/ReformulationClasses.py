@@ -83,7 +83,9 @@ from .Helpers import (
     getKind
 )
 
-from nuitka import Utils
+from nuitka import Options, Utils
+
+import ast
 
 # TODO: Once we start to modify these, we should make sure, the copy is not
 # shared.
@@ -97,6 +99,283 @@ make_class_parameters = ParameterSpec(
 )
 
 
+# Names of classes that are used as one of several bases, in all modules of the
+# program. These cannot get inferred slots, as the instance layouts of several
+# bases with slots would conflict.
+_multiple_inheritance_bases = set()
+
+# If the program assigns "__class__" of objects, the layouts of the classes
+# involved must not differ, so no slots are inferred at all.
+_class_assignment_in_program = False
+
+# The statements added for inferred slots, per class name. Modules are built
+# as they are discovered during optimization, so whether they conflict can only
+# be decided when all are known, see "removeConflictingSlots".
+_inferred_slots_statements = []
+
+def _getBaseName( base ):
+    kind = getKind( base )
+
+    if kind == "Name":
+        return base.id
+    elif kind == "Attribute":
+        return base.attr
+    else:
+        return None
+
+def noteModuleClassUsages( tree ):
+    # Program wide state, pylint: disable=W0603
+    global _class_assignment_in_program
+
+    if not Options.shallInferSlots():
+        return
+
+    for node in ast.walk( tree ):
+        kind = getKind( node )
+
+        if kind == "ClassDef" and len( node.bases ) > 1:
+            for base in node.bases:
+                _multiple_inheritance_bases.add( _getBaseName( base ) )
+        elif kind == "Attribute" and node.attr == "__class__" and \
+             getKind( node.ctx ) == "Store":
+            _class_assignment_in_program = True
+
+def removeConflictingSlots():
+    """ Remove inferred slots of classes, that turned out to conflict.
+
+        This must be called when all modules of the program are built, as
+        only then it is known, which classes are used as one of several bases,
+        or if "__class__" is assigned anywhere.
+    """
+
+    for class_name, statements in _inferred_slots_statements:
+        if _class_assignment_in_program or \
+           class_name in _multiple_inheritance_bases:
+            for statement in statements:
+                statement.parent.removeStatement( statement )
+
+    del _inferred_slots_statements[:]
+
+def _getSelfAttributeNames( function ):
+    """ Attribute names assigned to "self" in a method.
+
+        Returns "None" if "self" is assigned, or special attributes are.
+    """
+
+    for decorator in function.decorator_list:
+        if getKind( decorator ) == "Name" and \
+           decorator.id in ( "staticmethod", "classmethod" ):
+            return ()
+
+    if not function.args.args:
+        return ()
+
+    self_arg = function.args.args[0]
+
+    if Utils.python_version >= 300:
+        self_name = self_arg.arg
+    elif getKind( self_arg ) == "Name":
+        self_name = self_arg.id
+    else:
+        return ()
+
+    result = set()
+
+    for node in ast.walk( function ):
+        kind = getKind( node )
+
+        if kind == "Name" and node.id == self_name and \
+           getKind( node.ctx ) in ( "Store", "Del" ):
+            return None
+
+        if kind == "Attribute" and getKind( node.value ) == "Name" and \
+           node.value.id == self_name and \
+           getKind( node.ctx ) in ( "Store", "Del" ):
+            if node.attr.startswith( "__" ) and node.attr.endswith( "__" ):
+                return None
+
+            result.add( node.attr )
+
+    return result
+
+def _getClassLevelNames( statement ):
+    kind = getKind( statement )
+
+    if kind in ( "FunctionDef", "ClassDef" ):
+        return ( statement.name, )
+    elif kind in ( "Import", "ImportFrom" ):
+        return tuple(
+            ( alias.asname or alias.name ).split( "." )[0]
+            for alias in
+            statement.names
+        )
+    else:
+        return tuple(
+            node.id
+            for node in
+            ast.walk( statement )
+            if getKind( node ) == "Name" and getKind( node.ctx ) == "Store"
+        )
+
+def _getInferredSlots( node ):
+    """ Slots for a class, from the attributes its methods assign to "self".
+
+        Only done with "--infer-slots", for classes deriving from "object"
+        only, that don't deal with "__dict__", their layout, or metaclasses.
+        Names of the class itself are left to the instance dictionary, which
+        is kept along with weak references, but only made when used.
+    """
+
+    if not Options.shallInferSlots():
+        return None
+
+    if node.decorator_list:
+        return None
+
+    if Utils.python_version >= 300:
+        if node.keywords or getattr( node, "starargs", None ) or \
+           getattr( node, "kwargs", None ):
+            return None
+
+        if node.bases and \
+           [ _getBaseName( base ) for base in node.bases ] != [ "object" ]:
+            return None
+    else:
+        # Old style classes have no slots.
+        if [ _getBaseName( base ) for base in node.bases ] != [ "object" ]:
+            return None
+
+    for sub_node in ast.walk( node ):
+        kind = getKind( sub_node )
+
+        if kind == "Attribute" and sub_node.attr == "__dict__":
+            return None
+
+        if kind == "Name" and sub_node.id in ( "vars", "__dict__" ):
+            return None
+
+        if kind == "Exec":
+            return None
+
+    class_names = set()
+    slots = set()
+
+    for statement in node.body:
+        class_names.update( _getClassLevelNames( statement ) )
+
+        if getKind( statement ) == "FunctionDef":
+            attribute_names = _getSelfAttributeNames( statement )
+
+            if attribute_names is None:
+                return None
+
+            slots.update( attribute_names )
+
+    if "__slots__" in class_names or "__metaclass__" in class_names:
+        return None
+
+    slots -= class_names
+
+    if not slots:
+        return None
+
+    return tuple( sorted( slots ) ) + ( "__dict__", "__weakref__" )
+
+# Pickling with protocols before 2 refuses objects with "__slots__", unless
+# they have "__getstate__", so these are provided, using the same state as if
+# the class had no slots.
+_slots_getstate_template = """\
+def __getstate__( self ):
+    state = {}
+
+    for name in %(slots)r:
+        try:
+            state[ name ] = object.__getattribute__( self, name )
+        except AttributeError:
+            pass
+
+    state.update( self.__dict__ )
+
+    return state
+"""
+
+_slots_setstate_template = """\
+def __setstate__( self, state ):
+    for name, value in state.items():
+        if name in %(slots)r:
+            object.__setattr__( self, name, value )
+        else:
+            self.__dict__[ name ] = value
+"""
+
+def _getMangledSlotName( class_name, slot_name ):
+    # The names in "__slots__" are mangled by the class creation.
+    if not slot_name.startswith( "__" ) or slot_name.endswith( "__" ) or \
+       not class_name.lstrip( "_" ):
+        return slot_name
+    else:
+        return "_" + class_name.lstrip( "_" ) + slot_name
+
+def _makeSlotsStatements( provider, node, source_ref ):
+    slots = _getInferredSlots( node )
+
+    if slots is None:
+        return []
+
+    class_names = set()
+
+    for statement in node.body:
+        class_names.update( _getClassLevelNames( statement ) )
+
+    state_slots = tuple(
+        _getMangledSlotName( node.name, slot )
+        for slot in
+        slots
+        if slot not in ( "__dict__", "__weakref__" )
+    )
+
+    pickling_source = ""
+
+    if "__getstate__" not in class_names:
+        pickling_source += _slots_getstate_template % { "slots" : state_slots }
+
+    if "__setstate__" not in class_names:
+        pickling_source += _slots_setstate_template % { "slots" : state_slots }
+
+    pickling_nodes = ast.parse( pickling_source ).body
+
+    for pickling_node in pickling_nodes:
+        for sub_node in ast.walk( pickling_node ):
+            if "lineno" in sub_node._attributes:
+                ast.copy_location( sub_node, node )
+
+    statements = [
+        StatementAssignmentVariable(
+            variable_ref = ExpressionTargetVariableRef(
+                variable_name = "__slots__",
+                source_ref    = source_ref
+            ),
+            source        = ExpressionConstantRef(
+                constant      = slots,
+                source_ref    = source_ref,
+                user_provided = True
+            ),
+            source_ref   = source_ref.atInternal()
+        )
+    ]
+
+    if pickling_nodes:
+        statements += buildStatementsNode(
+            provider   = provider,
+            nodes      = pickling_nodes,
+            source_ref = source_ref
+        ).getStatements()
+
+    _inferred_slots_statements.append( ( node.name, statements ) )
+
+    return statements
+
+
 def _buildClassNode3( provider, node, source_ref ):
     # Many variables, due to the huge re-formulation that is going on here,
     # which just has the complexity, pylint: disable=R0914
@@ -197,6 +476,12 @@ def _buildClassNode3( provider, node, source_ref ):
             )
         )
 
+    statements += _makeSlotsStatements(
+        provider   = class_creation_function,
+        node       = node,
+        source_ref = source_ref
+    )
+
     statements += [
         body,
         StatementAssignmentVariable(
@@ -568,6 +853,12 @@ def _buildClassNode2( provider, node, source_ref ):
             )
         )
 
+    statements += _makeSlotsStatements(
+        provider   = class_creation_function,
+        node       = node,
+        source_ref = source_ref
+    )
+
     statements += [
         body,
         StatementReturn(
@@ -0,0 +1,152 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+from __future__ import print_function
+
+# Attribute lookups remember what the type gave for the name, these must notice
+# all the changes that can make that outdated.
+
+class Value( object ):
+    class_attr = "class value"
+
+    def __init__( self, value ):
+        self.value = value
+
+    def method( self ):
+        return "method of", self.value
+
+    @property
+    def prop( self ):
+        return "property of", self.value
+
+def lookups( obj ):
+    result = []
+
+    for _i in range( 3 ):
+        result.append( obj.value )
+        result.append( obj.class_attr )
+        result.append( obj.method() )
+        result.append( obj.prop )
+
+    return result
+
+print( "Plain lookups:", lookups( Value( 1 ) ) )
+print( "Other instance:", lookups( Value( 2 ) ) )
+
+def lookupClassAttr( obj ):
+    return obj.class_attr
+
+obj = Value( 3 )
+print( "Class attribute:", lookupClassAttr( obj ) )
+obj.class_attr = "instance value"
+print( "Shadowed by instance:", lookupClassAttr( obj ) )
+del obj.class_attr
+print( "Shadow deleted:", lookupClassAttr( obj ) )
+Value.class_attr = "changed class value"
+print( "Class changed:", lookupClassAttr( obj ) )
+
+class Derived( Value ):
+    pass
+
+obj = Derived( 4 )
+print( "Derived class attribute:", lookupClassAttr( obj ) )
+Value.class_attr = "changed base value"
+print( "Base changed:", lookupClassAttr( obj ) )
+Derived.class_attr = "derived value"
+print( "Derived changed:", lookupClassAttr( obj ) )
+
+def lookupMethod( obj ):
+    return obj.method()
+
+print( "Method:", lookupMethod( obj ) )
+Value.method = lambda self : ( "replaced method of", self.value )
+print( "Method replaced:", lookupMethod( obj ) )
+obj.method = lambda : "instance function"
+print( "Method shadowed:", lookupMethod( obj ) )
+
+class Other( object ):
+    class_attr = "other class value"
+
+obj = Value( 5 )
+print( "Before class change:", lookupClassAttr( obj ) )
+obj.__class__ = Other
+print( "After class change:", lookupClassAttr( obj ) )
+
+class DataDescriptor( object ):
+    def __get__( self, obj, cls ):
+        return "data descriptor"
+
+    def __set__( self, obj, value ):
+        pass
+
+class WithDescriptor( object ):
+    class_attr = DataDescriptor()
+
+obj = WithDescriptor()
+obj.__dict__[ "class_attr" ] = "in instance dict"
+print( "Data descriptor wins:", lookupClassAttr( obj ) )
+del WithDescriptor.class_attr
+print( "Descriptor removed:", lookupClassAttr( obj ) )
+
+class WithGetattr( object ):
+    def __getattr__( self, name ):
+        return "getattr " + name
+
+print( "With __getattr__:", lookupClassAttr( WithGetattr() ) )
+
+class Late( object ):
+    pass
+
+obj = Late()
+
+try:
+    lookupClassAttr( obj )
+except AttributeError as e:
+    print( "Missing attribute:", e )
+
+Late.__getattr__ = lambda self, name : "late getattr " + name
+print( "Added __getattr__:", lookupClassAttr( obj ) )
+
+class Slotted( object ):
+    __slots__ = ( "class_attr", )
+
+obj = Slotted()
+
+try:
+    lookupClassAttr( obj )
+except AttributeError as e:
+    print( "Unset slot:", e )
+
+obj.class_attr = "slot value"
+print( "Slot:", lookupClassAttr( obj ) )
+
+import os
+print( "Module attribute:", lookupClassAttr.__name__, os.path.join( "a", "b" ) )
+
+def lookupModuleAttr( module ):
+    return module.sep
+
+print( "Module attribute:", lookupModuleAttr( os ), lookupModuleAttr( os.path ) )
+
+def lookupValues( objs ):
+    return [ obj.value for obj in objs ]
+
+objs = [ Value( i ) for i in range( 5 ) ]
+objs[ 2 ].other = 1
+objs[ 3 ].__dict__.clear()
+objs[ 3 ].value = "re-added"
+print( "Many instances:", lookupValues( objs ) )
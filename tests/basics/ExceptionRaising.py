@@ -465,3 +465,154 @@ print "Check exception given when value is raised with value", raiseValueWithVal
 
 a = IOError
 print repr(a)
+
+print "Check exceptions raised and caught in the same function:"
+
+def raiseCaughtLocally():
+    results = []
+
+    for value in range( 4 ):
+        try:
+            if value == 0:
+                raise KeyError
+            elif value == 1:
+                raise KeyError( value )
+            elif value == 2:
+                raise KeyError, value
+            else:
+                raise TypeError( value )
+        except KeyError as e:
+            results.append( ( "KeyError", repr( e ), sys.exc_info()[0] ) )
+        except TypeError:
+            results.append( ( "TypeError", sys.exc_info()[1].args ) )
+
+    return results
+
+print raiseCaughtLocally()
+
+def raiseCaughtLocallyUnmatched():
+    try:
+        raise ValueError( "unmatched" )
+    except KeyError:
+        print "Should not happen"
+
+try:
+    raiseCaughtLocallyUnmatched()
+except ValueError as e:
+    print "Unmatched local raise gave", repr( e ), sys.exc_info()[2].tb_next.tb_frame.f_code.co_name
+
+def raiseCaughtLocallyReraised():
+    try:
+        raise ValueError( "reraised" )
+    except ValueError:
+        raise
+
+try:
+    raiseCaughtLocallyReraised()
+except ValueError as e:
+    print "Local raise re-raised gave", repr( e )
+
+def raiseCaughtLocallyNested():
+    try:
+        try:
+            raise KeyError( "inner" )
+        except ValueError:
+            print "Should not happen"
+        finally:
+            print "Inner finally executed"
+    except KeyError as e:
+        print "Outer handler got", repr( e )
+
+    try:
+        try:
+            raise KeyError( "inner" )
+        except KeyError:
+            raise ValueError( "from handler" )
+    except ValueError as e:
+        print "Outer handler got", repr( e )
+
+    try:
+        for x in range( 3 ):
+            while True:
+                raise IndexError( x )
+    except IndexError as e:
+        print "Raised out of loops", repr( e )
+
+raiseCaughtLocallyNested()
+
+def raiseCaughtLocallyBad():
+    try:
+        raise 1
+    except TypeError as e:
+        print "Raising a non exception gave", repr( e )
+
+raiseCaughtLocallyBad()
+
+def raiseCaughtLocallyTraceback():
+    try:
+        raise KeyError( 1 )
+    except KeyError:
+        tb = sys.exc_info()[2]
+
+        print "Traceback of local raise", tb.tb_frame.f_code.co_name, tb.tb_lineno - tb.tb_frame.f_code.co_firstlineno, tb.tb_next
+
+    try:
+        raise KeyError, 2, tb
+    except KeyError as e:
+        print "Local raise with traceback gave", repr( e )
+
+raiseCaughtLocallyTraceback()
+
+print "Check errors of lookups and next caught in the same function:"
+
+def lookupsCaughtLocally( d, l, it ):
+    for key in ( "a", "b", 1 ):
+        try:
+            value = d[ key ]
+            print "Found", value
+        except KeyError as e:
+            tb = sys.exc_info()[2]
+
+            print "KeyError", repr( e ), tb.tb_lineno - tb.tb_frame.f_code.co_firstlineno, tb.tb_next
+
+    try:
+        l[ 5 ]
+    except IndexError as e:
+        print "IndexError", repr( e )
+
+    try:
+        value = l[ "x" ]
+    except TypeError as e:
+        print "TypeError", repr( e )
+
+    try:
+        while True:
+            value = next( it )
+            print "Iterated", value
+    except StopIteration as e:
+        print "StopIteration", repr( e )
+
+    try:
+        try:
+            next( it )
+        except KeyError:
+            print "Should not happen"
+    except StopIteration:
+        print "Unmatched inner handler passed on StopIteration"
+
+lookupsCaughtLocally( { "a" : 1 }, [ 1, 2 ], iter( "ab" ) )
+
+def nextCaughtLocallyGeneratorError():
+    def generator():
+        yield 1
+        raise ValueError( "from generator" )
+
+    it = generator()
+
+    try:
+        next( it )
+        next( it )
+    except ValueError as e:
+        print "Generator error", repr( e ), sys.exc_info()[2].tb_next.tb_frame.f_code.co_name
+
+nextCaughtLocallyGeneratorError()
@@ -45,3 +45,54 @@ def func2( arg1, arg2 = "default_arg2", arg3 = "default_arg3" ):
    pass
 
 print "func_defaults", func2.__defaults__, func2.func_defaults
+
+def makeClosures( count ):
+   # Closures of different sizes, created and released in turns, so function
+   # objects get re-used for contexts of other sizes.
+   result = []
+
+   for x in range( count ):
+      a = x
+      b = x * 2
+      c = x * 3
+
+      def small():
+         return a
+
+      def large():
+         return a, b, c
+
+      result.append( small() + sum( large() ) )
+      result.append( ( lambda : b )() )
+
+   return result
+
+print "Closures created in a loop", makeClosures( 5 )
+
+def keepClosures():
+   kept = []
+
+   for x in range( 3 ):
+      def closure():
+         return x, kept
+
+      kept.append( closure )
+
+   return [ closure()[0] for closure in kept ]
+
+print "Closures kept alive", keepClosures()
+
+def generatorsInLoop():
+   result = []
+
+   for x in range( 3 ):
+      def gen():
+         yield x
+         yield x + 1
+
+      result.append( list( gen() ) )
+      result.append( list( y * 2 for y in gen() ) )
+
+   return result
+
+print "Generators created in a loop", generatorsInLoop()
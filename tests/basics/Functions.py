@@ -536,6 +536,53 @@ d = { "other" : 7, "c" : 3 }
 
 print "Dual star args consuming function", posDoubleStarArgsFunction( 1,  *l, **d )
 
+def moduleFunction( a, b ):
+    return a + b
+
+def callModuleFunction():
+    return moduleFunction( 1, 2 )
+
+print "Calling module function", callModuleFunction(), moduleFunction( "a", "b" )
+
+def replacementFunction( a, b ):
+    return a - b
+
+# Changing module functions through the module dictionary must be seen by calls.
+globals()[ "moduleFunction" ] = replacementFunction
+print "Calling replaced module function", callModuleFunction()
+
+import sys
+
+setattr( sys.modules[ __name__ ], "moduleFunction", lambda a, b : ( a, b ) )
+print "Calling module function replaced by lambda", callModuleFunction()
+
+globals()[ "moduleFunction" ] = len
+try:
+    callModuleFunction()
+except TypeError as e:
+    print "Calling module function replaced by builtin gives", repr( e )
+
+def recursiveModuleFunction( n ):
+    if n > 0:
+        return n + recursiveModuleFunction( n - 1 )
+    else:
+        return 0
+
+print "Calling recursive module function", recursiveModuleFunction( 100 )
+
+def moduleFunctionWithDefault( a, b = 2 ):
+    return a, b
+
+print "Calling module function with default", moduleFunctionWithDefault( 1 ), moduleFunctionWithDefault( 1, 3 )
+
+def raisingModuleFunction( a ):
+    raise ValueError( a )
+
+try:
+    raisingModuleFunction( "raised" )
+except ValueError as e:
+    print "Calling raising module function gives", repr( e )
+
 import inspect, sys
 
 for value in sorted( dir() ):
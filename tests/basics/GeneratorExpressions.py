@@ -216,3 +216,59 @@ def strangeLambdaGeneratorExpression():
     print list(x)
 
 strangeLambdaGeneratorExpression()
+
+def generatorStatementsAfterYield():
+    def gen():
+        yield 1
+        print "After first yield"
+        x = 2
+        yield x
+        raise ValueError( "from generator" )
+
+    it = gen()
+    print "Statements after yield", next( it ), next( it )
+
+    try:
+        next( it )
+    except ValueError as e:
+        print "Raised", e
+
+generatorStatementsAfterYield()
+
+def generatorStackStatistics():
+    import sys
+
+    # Compiled programs have the counters of their run time in this module,
+    # for CPython, there is nothing to check.
+    nuitka_module = sys.modules.get( "__nuitka__" )
+
+    if nuitka_module is None or \
+       not hasattr( nuitka_module, "getFiberStackStatistics" ):
+        return True, True, True
+
+    # Receiving values makes the generator run on a stack of its own.
+    def gen():
+        value = yield 1
+        yield value
+
+    before = nuitka_module.getFiberStackStatistics()
+
+    generators = [ gen() for _count in range( 20 ) ]
+
+    for generator in generators:
+        next( generator )
+
+    during = nuitka_module.getFiberStackStatistics()
+
+    del generator
+    del generators
+
+    after = nuitka_module.getFiberStackStatistics()
+
+    return (
+        during[ "live" ] == before[ "live" ] + 20,
+        during[ "peak_live" ] >= during[ "live" ],
+        after[ "live" ] == before[ "live" ] and after[ "pooled" ] >= 20
+    )
+
+print "Generator stack statistics live, peak, released", generatorStackStatistics()
@@ -174,3 +174,33 @@ print f()
 
 global global_already
 global_already = 1
+
+# Module variables that fall back to built-ins, read repeatedly, while the
+# module and built-ins change in different ways.
+if len( sys.argv ) > 100:
+    hex = None
+
+def readHex():
+    return hex( 255 )
+
+print "Global falling back to built-in", readHex(), readHex()
+globals()[ "hex" ] = lambda value : "globals dict"
+print "Global set via globals()", readHex(), readHex()
+del globals()[ "hex" ]
+print "Global deleted via globals()", readHex(), readHex()
+setattr( sys.modules[ __name__ ], "hex", lambda value : "module attribute" )
+print "Global set as module attribute", readHex(), readHex()
+exec "del hex"
+print "Global deleted via exec", readHex(), readHex()
+
+import __builtin__
+original_hex = __builtin__.hex
+__builtin__.hex = lambda value : "changed built-in"
+print "Built-in changed", readHex(), readHex()
+__builtin__.hex = original_hex
+print "Built-in restored", readHex(), readHex()
+
+for count in range( 100 ):
+    globals()[ "filler%d" % count ] = count
+
+print "Global after module dict grew", readHex()
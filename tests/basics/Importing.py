@@ -64,3 +64,67 @@ def localImportFailure():
     print "but path was", path
 
 print "From import that fails in the middle", localImportFailure()
+
+def importRepeatedly():
+    import sys
+    import os.path
+    from xml import dom
+
+    return sys, os, dom
+
+print "Repeated imports give same results:", importRepeatedly() == importRepeatedly()
+
+def importChanged():
+    import sys
+
+    result = []
+
+    for count in range( 3 ):
+        import types
+        result.append( types.__name__ )
+
+        if count == 0:
+            # Replace the module in "sys.modules", the import must see it.
+            sys.modules[ "types" ] = sys
+
+    return result
+
+import sys
+types_module = sys.modules[ "types" ]
+print "Import after change in sys.modules gives", importChanged()
+sys.modules[ "types" ] = types_module
+
+def importOverloaded():
+    import __builtin__
+
+    original_import = __builtin__.__import__
+
+    def my_import( name, *args ):
+        print "Overloaded import of", name,
+
+        return original_import( name, *args )
+
+    for count in range( 2 ):
+        if count == 1:
+            __builtin__.__import__ = my_import
+
+        import os
+        local_value = count
+
+    __builtin__.__import__ = original_import
+
+    return os.__name__
+
+print "Import with overloaded __import__", importOverloaded()
+
+def importSubmoduleRemoved():
+    import xml.dom.minidom
+    from xml import dom
+
+    return xml.__name__, dom.__name__
+
+print "Import of submodule", importSubmoduleRemoved()
+del sys.modules[ "xml.dom" ]
+import xml
+del xml.dom
+print "Import of submodule after its removal", importSubmoduleRemoved()
@@ -0,0 +1,128 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+from __future__ import print_function
+
+# With "--infer-slots", some of these classes get slots for the attributes that
+# their methods assign, these must behave as if they had none.
+
+import copy, weakref, pickle
+
+class Record( object ):
+    default = "class default"
+
+    def __init__( self, a, b ):
+        self.a = a
+        self.b = b
+        self.__private = "private"
+
+    def update( self, c ):
+        self.c = c
+        self.default = "instance default"
+
+    def clear( self ):
+        del self.a
+
+    def getPrivate( self ):
+        return self.__private
+
+    def __repr__( self ):
+        return "Record(%r, %r)" % ( self.a, self.b )
+
+record = Record( 1, 2 )
+print( "Record:", record, record.default, record.getPrivate() )
+
+try:
+    record.c
+except AttributeError as e:
+    print( "Unassigned:", type( e ).__name__ )
+
+record.update( 3 )
+print( "Updated:", record.c, record.default )
+
+record.other = "other"
+print( "Assigned from outside:", record.other, getattr( record, "other" ) )
+
+setattr( record, "a", "set" )
+print( "Set attribute:", record.a, hasattr( record, "c" ), hasattr( record, "d" ) )
+
+record.clear()
+
+try:
+    record.a
+except AttributeError as e:
+    print( "Deleted:", type( e ).__name__ )
+
+print( "Weak reference:", weakref.ref( record )() is record )
+
+copied = copy.copy( Record( 4, 5 ) )
+print( "Copied:", copied, copy.deepcopy( copied ) )
+
+# Slots must not prevent pickling, with any protocol, and the state is the same
+# as without them.
+for protocol in range( pickle.HIGHEST_PROTOCOL + 1 ):
+    pickled = pickle.loads( pickle.dumps( Record( 8, 9 ), protocol ) )
+    print( "Pickled:", protocol, pickled, pickled.getPrivate(), pickled.default )
+
+pickle_record = Record( 10, 11 )
+pickle_record.update( 12 )
+pickle_record.other = "other"
+del pickle_record.b
+
+print( "Pickle state:", sorted( pickle_record.__reduce_ex__( 2 )[2].items() ) )
+
+pickled = pickle.loads( pickle.dumps( pickle_record, 0 ) )
+print( "Pickled updated:", pickled.a, pickled.c, pickled.default, pickled.other, hasattr( pickled, "b" ) )
+
+class Derived( Record ):
+    def __init__( self, a, b ):
+        Record.__init__( self, a, b )
+        self.d = "derived"
+
+derived = Derived( 6, 7 )
+print( "Derived:", derived, derived.d, isinstance( derived, Record ) )
+
+# Classes used as one of several bases get no slots, their layouts would
+# conflict.
+class First( object ):
+    def __init__( self ):
+        self.e = "first"
+
+class Second( object ):
+    def setup( self ):
+        self.f = "second"
+
+class Both( First, Second ):
+    pass
+
+both = Both()
+both.setup()
+print( "Several bases:", both.e, both.f )
+
+class Properties( object ):
+    def __init__( self, value ):
+        self.value = value
+
+    def _getValue( self ):
+        return self._value
+
+    def _setValue( self, value ):
+        self._value = value * 2
+
+    value = property( _getValue, _setValue )
+
+print( "Property:", Properties( 5 ).value )
@@ -53,3 +53,25 @@ print "List sclice inplace [y:]", h
 h[:] += (5,5,5)
 
 print "List sclice inplace [:]", h
+
+import sys
+
+for value in ( 1, sys.maxint, -sys.maxint - 1, 2**70, 1.5, "a" ):
+    x = value
+    x += 1 if type( value ) is not str else "b"
+    y = value
+    y *= 2
+    print "Inplace with int constants", value, x, y
+
+x = sys.maxint
+x += 1
+x -= 1
+x %= 1000
+
+print "Inplace int overflow", x
+
+try:
+    x = []
+    x += 1
+except TypeError as e:
+    print "Inplace type error", repr( e )
@@ -74,3 +74,30 @@ def lambdaWithcontraction( x ):
    print locals()
 
 lambdaWithcontraction( 3 )
+
+def contractionLineNumbers():
+   import sys
+
+   def fails( x ):
+      if x == 2:
+         raise ValueError( x )
+
+      return x
+
+   try:
+      r = [ fails( x ) for x in range( 3 ) ]
+   except ValueError:
+      tb = sys.exc_info()[2]
+      print "Contraction raised at line", tb.tb_lineno - tb.tb_frame.f_code.co_firstlineno
+
+   try:
+      r = [
+         x
+         for x in range( 3 )
+         if [ fails( y ) for y in range( x + 1 ) ]
+      ]
+   except ValueError:
+      tb = sys.exc_info()[2]
+      print "Nested contraction raised at line", tb.tb_lineno - tb.tb_frame.f_code.co_firstlineno
+
+contractionLineNumbers()
@@ -145,3 +145,73 @@ def loopingFunction( a = 1*2 ):
         print "Executed else branch of while loop without break"
 
 loopingFunction()
+
+def rangeLoopingFunction( low, high, step ):
+    import sys
+
+    print "Range loop with arguments", low, high, step
+
+    for x in range( high ):
+        print x,
+    print
+
+    for x in range( low, high ):
+        print x,
+    print
+
+    for x in range( high, low, -step ):
+        print x,
+    print
+
+    print "Range loop near maximum int values:",
+    for x in range( sys.maxint - high, sys.maxint, step ):
+        print x,
+    print
+
+    print "Range loop near minimum int values:",
+    for x in range( -sys.maxint - 1 + high, -sys.maxint - 2, -step ):
+        print x,
+    print
+
+    print "Range loop with long values:",
+    for x in range( 2**100 + low, 2**100 + high, step ):
+        print x,
+    print
+
+    print "Range contraction", [ x * 2 for x in range( low, high, step ) ]
+
+    class IntLike:
+        def __int__( self ):
+            print "Converted IntLike"
+            return high
+
+    print "Range loop with int convertible object:",
+    for x in range( IntLike() ):
+        print x,
+    print
+
+    try:
+        print "Range loop with float argument:",
+        for x in range( float( high ) ):
+            print x,
+    except TypeError, e:
+        print "gives exception:", e
+
+    try:
+        print "Range loop with zero step:",
+        for x in range( low, high, step - step ):
+            print x,
+    except ValueError, e:
+        print "gives exception:", e
+
+    try:
+        print "Range loop with too many values:",
+        for x in range( -sys.maxint - 1, sys.maxint, step ):
+            break
+    except (OverflowError, MemoryError), e:
+        print "gives exception:", repr( e )
+
+    iterator = iter( range( low, high ) )
+    print "Range iterator next", next( iterator ), list( iterator ), list( iterator )
+
+rangeLoopingFunction( 1, 5, 2 )
@@ -0,0 +1,132 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+from __future__ import print_function
+
+# Calls of attributes with positional arguments only call functions of the type
+# without making a bound method, these must behave like the bound method call.
+
+class Calls( object ):
+    def __init__( self, name ):
+        self.name = name
+
+    def noArgs( self ):
+        return self.name
+
+    def withArgs( self, a, b, c = "default" ):
+        return self.name, a, b, c
+
+    def withStarArgs( self, *args ):
+        return self.name, args
+
+    @staticmethod
+    def static( a ):
+        return "static", a
+
+    @classmethod
+    def klass( cls, a ):
+        return cls.__name__, a
+
+def callAll( obj ):
+    return (
+        obj.noArgs(),
+        obj.withArgs( 1, 2 ),
+        obj.withArgs( 1, 2, 3 ),
+        obj.withStarArgs( 1, 2, 3, 4, 5 ),
+        obj.static( 1 ),
+        obj.klass( 2 )
+    )
+
+print( "Calls:", callAll( Calls( "first" ) ) )
+print( "Other instance:", callAll( Calls( "second" ) ) )
+
+obj = Calls( "shadowed" )
+obj.noArgs = lambda : "instance attribute"
+print( "Shadowed by instance:", callAll( obj ) )
+
+def replacement( self ):
+    return "replaced", self.name
+
+Calls.noArgs = replacement
+print( "Replaced in class:", callAll( Calls( "third" ) ) )
+
+exec( """
+def uncompiled( self, a ):
+    return "uncompiled", self.name, a
+""" )
+
+Calls.uncompiled = uncompiled
+print( "Uncompiled function:", Calls( "fourth" ).uncompiled( 1 ) )
+
+try:
+    Calls( "fifth" ).withArgs()
+except TypeError as e:
+    print( "Too few arguments:", e )
+
+try:
+    Calls( "sixth" ).missing( 1 )
+except AttributeError as e:
+    print( "Missing attribute:", e )
+
+# The attribute is looked up before the arguments are evaluated.
+def changeMethod():
+    Calls.noArgs = lambda self : "changed"
+
+    return "argument"
+
+Calls.noArgs = replacement
+
+try:
+    Calls( "seventh" ).noArgs( changeMethod() )
+except TypeError as e:
+    print( "Lookup before arguments:", e )
+
+try:
+    Calls( "eighth" ).missing( 1 / 0 )
+except AttributeError as e:
+    print( "Lookup error before argument error:", e )
+
+# Calls from the same place while the arguments are evaluated, with another
+# type there.
+class Leaf( object ):
+    def visit( self ):
+        return "leaf"
+
+class Branch( object ):
+    def __init__( self, child ):
+        self.child = child
+
+    def visit( self ):
+        return "branch", self.child.visit()
+
+    def combine( self, value ):
+        return "combined", value
+
+def walk( node ):
+    if type( node ) is Branch:
+        return node.combine( walk( node.child ) )
+    else:
+        return node.visit()
+
+print( "Nested calls:", walk( Branch( Branch( Leaf() ) ) ) )
+
+class OldStyle:
+    def method( self, a ):
+        return "old style", a
+
+print( "Old style class:", OldStyle().method( 1 ) )
+print( "Built-in methods:", ", ".join( [ "a", "b" ] ), [ 1, 2 ].index( 2 ) )
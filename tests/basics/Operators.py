@@ -91,3 +91,56 @@ n = None
 print l[n:n]
 print l[3:n]
 print l[n:3]
+
+print "Operations of variables with int constants:"
+
+import sys
+
+def intOperations( a ):
+    return a + 1, 1 + a, a - 1, 1 - a, a * 3, 3 * a, a % 7, 7 % a if a else None
+
+for value in ( 0, 5, -5, sys.maxint, -sys.maxint - 1, 2**70, 1.5, True ):
+    print value, intOperations( value )
+
+class IntSubclass( int ):
+    def __add__( self, other ):
+        return "IntSubclass.__add__"
+
+    def __radd__( self, other ):
+        return "IntSubclass.__radd__"
+
+print intOperations( IntSubclass( 3 ) )[:2]
+print "%d %s" % ( 1, "int formatting" ), "list" * 2, [ 1 ] * 2
+
+m = -sys.maxint - 1
+print "Remainder overflow", m % -1, m * -1
+
+try:
+    print 5 % ( sys.maxint - sys.maxint )
+except ZeroDivisionError as e:
+    print "Remainder by zero", repr( e )
+
+try:
+    print [] - 1
+except TypeError as e:
+    print "Type error", repr( e )
+
+def inferredIntOperations():
+    # Variables only assigned "int" values, these can still overflow to "long"
+    # values, as can the values of "range" loops.
+    x = 1
+
+    for count in range( 70 ):
+        x = x * 2 + count % 3 - 1
+
+    total = 0
+
+    for price in range( sys.maxint - 2, sys.maxint + 3 ):
+        for quantity in range( 3 ):
+            total += price * quantity
+            total %= 2**80 - 1
+
+    return x, total, len( "abc" ) * sys.maxint
+
+print "Operations of variables with inferred int values:"
+print inferredIntOperations()
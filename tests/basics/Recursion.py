@@ -26,3 +26,77 @@ def recurse():
       recurse()
 
 recurse()
+
+print "Recursion depth reached", count
+
+import sys
+
+def recurseFrames( depth ):
+    if depth == 0:
+        frame = sys._getframe()
+        names = []
+
+        while frame is not None and frame.f_code.co_name == "recurseFrames":
+            names.append( frame.f_code.co_name )
+            frame = frame.f_back
+
+        return len( names )
+    else:
+        return recurseFrames( depth - 1 )
+
+print "Frames seen in recursion", recurseFrames( 20 ), recurseFrames( 5 )
+
+def recurseRaising( depth ):
+    if depth == 0:
+        raise ValueError( depth )
+    else:
+        return recurseRaising( depth - 1 )
+
+def catchTraceback( depth ):
+    try:
+        recurseRaising( depth )
+    except ValueError:
+        return sys.exc_info()[2]
+
+# Keep frames referenced by tracebacks, while recursing more, so that released
+# frames get re-used, and check the kept ones are not affected.
+tracebacks = [ catchTraceback( depth ) for depth in range( 10 ) ]
+
+recurseFrames( 30 )
+
+for tb in tracebacks:
+    names = []
+
+    while tb is not None:
+        names.append( tb.tb_frame.f_code.co_name )
+        tb = tb.tb_next
+
+    print "Traceback kept", len( names ), names[ : 2 ], names[ -1 ]
+
+def getFrameStatistics():
+    # Compiled programs have the counters of their run time in this module,
+    # for CPython, there is nothing to check.
+    nuitka_module = sys.modules.get( "__nuitka__" )
+
+    if nuitka_module is None:
+        return None
+
+    return nuitka_module.getFrameStatistics()
+
+def checkFrameStatistics():
+    before = getFrameStatistics()
+
+    if before is None:
+        return True, True, True
+
+    recurseFrames( 30 )
+
+    after = getFrameStatistics()
+
+    return (
+        after[ "missed" ] >= before[ "missed" ] + 30,
+        after[ "reused" ] > before[ "reused" ],
+        0 <= after[ "pooled" ] <= after[ "allocated" ]
+    )
+
+print "Frame statistics missed, re-used, pooled", checkFrameStatistics()
@@ -0,0 +1,170 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+def loopConcatenation( value ):
+    s = ""
+
+    for count in range( 5 ):
+        s += value
+        s = s + str( count )
+
+    return s
+
+print "Inplace str concatenation:", loopConcatenation( "a" )
+print "Inplace unicode concatenation:", repr( loopConcatenation( u"\u20ac" ) )
+
+def parameterConcatenation( s, t, delete ):
+    for count in range( 3 ):
+        s += t
+        t = t + str( count )
+
+    if delete:
+        del t
+
+    return s
+
+print "Parameter concatenation:", parameterConcatenation( "p", "q", True )
+
+def mixedConcatenation():
+    s = "a" * 3
+    s += u"b"
+    s += "c"
+
+    return s
+
+print "Mixed str and unicode concatenation:", repr( mixedConcatenation() )
+
+def selfConcatenation():
+    s = "ab" * 2
+
+    s += s
+    s = s + s
+
+    return s
+
+print "Self concatenation:", selfConcatenation()
+
+def aliasedConcatenation():
+    s = "x" * 3
+    t = s
+
+    s += "y"
+
+    d = { s : 1 }
+    s += "z"
+
+    return s, t, d
+
+print "Aliased concatenation:", aliasedConcatenation()
+
+def hashedConcatenation():
+    s = "hash" * 2
+    h1 = hash( s )
+
+    s += "ed"
+
+    return h1 == hash( "hashhash" ), hash( s ) == hash( "hashhashed" )
+
+print "Hash after concatenation:", hashedConcatenation()
+
+def internedConcatenation():
+    s = intern( "".join( [ "inter", "ned" ] ) )
+
+    s += "!"
+
+    return s, intern( "interned" ), intern( "interned" ) == "interned"
+
+print "Interned concatenation:", internedConcatenation()
+
+def otherTypes():
+    l = [ 1 ]
+    l += [ 2 ]
+    l = l + [ 3 ]
+
+    t = ( 1, )
+    t += ( 2, )
+
+    b = bytearray( "ab" )
+    b += "c"
+
+    n = 1
+    n += 2.5
+
+    return l, t, b, n
+
+print "Other types:", otherTypes()
+
+class Adder:
+    def __init__( self, value ):
+        self.value = value
+
+    def __add__( self, other ):
+        return Adder( self.value + "+" + other )
+
+    def __iadd__( self, other ):
+        self.value += other
+        return self
+
+def objectConcatenation():
+    a = Adder( "a" )
+    b = a
+
+    a += "b"
+    a = a + "c"
+
+    return a.value, b.value
+
+print "Object concatenation:", objectConcatenation()
+
+def failingSide():
+    raise ValueError
+
+def exceptionConcatenation():
+    s = "keep" * 2
+
+    try:
+        s += failingSide()
+    except ValueError:
+        pass
+
+    return s
+
+print "Exception on the right side:", exceptionConcatenation()
+
+def unassignedConcatenation():
+    try:
+        s += failingSide()
+    except UnboundLocalError:
+        print "Unbound local raised first"
+
+    s = 1
+
+unassignedConcatenation()
+
+def typeErrorConcatenation():
+    s = "x" * 2
+
+    try:
+        s += 1
+    except TypeError as e:
+        print "Type error", e
+
+    return s
+
+result = typeErrorConcatenation()
+
+print "Left after type error:", result
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+""" Time clean builds with and without precompiled header and unity build.
+
+By default, Nuitka itself is compiled with "--recurse-all", like it is done
+by "tests/reflected/compile_itself.py", but as one program only. Another
+main program can be given instead. Each build uses a fresh output directory,
+and the compile cache is not used, so every build is a clean one.
+
+Usage: time_builds.py [main_program] [jobs]
+"""
+
+from __future__ import print_function
+
+import os, sys, time, shutil, tempfile, subprocess
+
+nuitka_main_path = os.path.abspath(
+    os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), "..", "..", "..", "bin", "nuitka" )
+)
+
+main_filename = os.path.abspath( sys.argv[1] ) if len( sys.argv ) > 1 else None
+jobs = int( sys.argv[2] ) if len( sys.argv ) > 2 else None
+
+tmp_dir = tempfile.gettempdir()
+
+# Try to avoid RAM disk /tmp and use the disk one instead.
+if tmp_dir == "/tmp" and os.path.exists( "/var/tmp" ):
+    tmp_dir = "/var/tmp"
+
+stage_dir = os.path.join( tmp_dir, "time_builds" )
+
+variants = (
+    ( "default", [] ),
+    ( "--pch", [ "--pch" ] ),
+    ( "--unity-build", [ "--unity-build" ] ),
+    ( "--pch --unity-build", [ "--pch", "--unity-build" ] ),
+)
+
+def prepareStage():
+    if os.path.exists( stage_dir ):
+        shutil.rmtree( stage_dir )
+
+    os.makedirs( stage_dir )
+
+    if main_filename is not None:
+        return main_filename
+
+    # The "bin/nuitka" has no ".py" suffix, which the compiled program needs,
+    # and it must find the "nuitka" package next to it to recurse into it.
+    result = os.path.join( stage_dir, "nuitka.py" )
+    shutil.copyfile( nuitka_main_path, result )
+
+    os.environ[ "PYTHONPATH" ] = os.path.dirname( os.path.dirname( nuitka_main_path ) )
+
+    return result
+
+def timeBuild( filename, options ):
+    output_dir = os.path.join( stage_dir, "output" )
+
+    if os.path.exists( output_dir ):
+        shutil.rmtree( output_dir )
+
+    command = [
+        sys.executable,
+        nuitka_main_path,
+        "--exe",
+        "--recurse-all",
+        "--output-dir",
+        output_dir
+    ]
+
+    if jobs is not None:
+        command.append( "--jobs=%d" % jobs )
+
+    command += os.environ.get( "NUITKA_EXTRA_OPTIONS", "" ).split()
+    command += options
+
+    command.append( filename )
+
+    start = time.time()
+    subprocess.check_call( command )
+
+    return time.time() - start
+
+filename = prepareStage()
+
+timings = []
+
+for name, options in variants:
+    print( "Building with %s ..." % name )
+    timings.append( ( name, timeBuild( filename, options ) ) )
+
+print( "Clean builds of %s:" % os.path.basename( filename ) )
+
+for name, timing in timings:
+    print( "%-20s %7.1fs" % ( name, timing ) )
+
+shutil.rmtree( stage_dir )
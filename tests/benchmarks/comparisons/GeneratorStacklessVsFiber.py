@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+
+# The first pipeline can be compiled to stackless generators, that resume at
+# their "yield" statements, while the "yield" inside "try/except" forces the
+# second one to run on fibers.
+
+b = range(10000)
+
+def source():
+   for i in b:
+      yield i
+
+def stage( iterable ):
+   for i in iterable:
+      if i % 3 != 1:
+         yield i * 2
+
+def sourceFiber():
+   for i in b:
+      try:
+         yield i
+      except GeneratorExit:
+         raise
+
+def stageFiber( iterable ):
+   for i in iterable:
+      try:
+         if i % 3 != 1:
+            yield i * 2
+      except GeneratorExit:
+         raise
+
+
+import time
+
+start = time.time()
+
+for x in range( 1000 ):
+   r = sum( stage( source() ) )
+
+end = time.time()
+
+stackless_time = end - start
+
+start = time.time()
+
+for x in range( 1000 ):
+   r = sum( stageFiber( sourceFiber() ) )
+
+end = time.time()
+
+fiber_time = end - start
+
+print "Stackless generator pipeline took", stackless_time
+print "Fiber generator pipeline took", fiber_time
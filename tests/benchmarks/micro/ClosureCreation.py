@@ -0,0 +1,66 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+def closures( n ):
+    # Each iteration creates a closure, and a lambda with it.
+    total = 0
+
+    for x in xrange( n ):
+        def adder( y ):
+            return x + y
+
+        total += adder( 1 ) + ( lambda : x )()
+
+    return total
+
+def mixedClosures( n ):
+    # Each iteration creates functions without context, and closures of
+    # different sizes, in turns.
+    total = 0
+
+    for x in xrange( n ):
+        a = x
+        b = x + 1
+        c = x + 2
+
+        def plain( y ):
+            return y
+
+        def small():
+            return a
+
+        def large():
+            return a + b + c
+
+        total += plain( 1 ) + small() + large()
+
+    return total
+
+def generators( n ):
+    # Each iteration creates a generator object.
+    total = 0
+
+    for x in xrange( n ):
+        total += sum( y for y in ( x, x ) )
+
+    return total
+
+closures( 1000000 )
+mixedClosures( 1000000 )
+generators( 1000000 )
@@ -0,0 +1,41 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import sys
+
+module_value = 1
+
+# Makes these module variables, that are normally read from the built-ins.
+if len( sys.argv ) > 100:
+    abs = None
+    min = None
+    max = None
+
+def helper( x ):
+    return x
+
+def reader():
+    # Module variables, and several built-ins, read in a loop.
+    for x in range( 1000000 ):
+        helper( module_value )
+        abs( x )
+        min( x, module_value )
+        max( x, module_value )
+
+reader()
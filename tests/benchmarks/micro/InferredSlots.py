@@ -0,0 +1,42 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+# Compile with "--infer-slots" to compare, the records then need no dictionary.
+
+class Record( object ):
+    def __init__( self, key, value, weight ):
+        self.key = key
+        self.value = value
+        self.weight = weight
+
+    def score( self ):
+        return self.value * self.weight
+
+def records( n ):
+    result = [ Record( i, i % 7, 2 ) for i in xrange( n ) ]
+
+    total = 0
+
+    for _i in xrange( 10 ):
+        for record in result:
+            total += record.score()
+
+    return total
+
+records( 500000 )
@@ -0,0 +1,44 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+def calculate( values ):
+    # Integer arithmetic with constants in a loop.
+    total = 0
+
+    for value in values:
+        total += value * 3 + 1
+        total %= 1000003
+
+    return total
+
+def pricing( count ):
+    # Integer arithmetic with variables of "range" loops, no constants.
+    total = 0
+
+    for price in range( count ):
+        for quantity in range( 10 ):
+            total += price * quantity
+
+    return total
+
+values = range( 100000 )
+
+for x in range( 50 ):
+    calculate( values )
+    pricing( 10000 )
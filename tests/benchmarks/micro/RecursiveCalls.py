@@ -0,0 +1,43 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+def fib( n ):
+    # Recursive calls, each one needs a frame of its own.
+    if n < 2:
+        return n
+    else:
+        return fib( n - 1 ) + fib( n - 2 )
+
+def raising( n ):
+    # Exceptions keep frames referenced by their tracebacks.
+    if n == 0:
+        raise KeyError( n )
+    else:
+        raising( n - 1 )
+
+def catching():
+    try:
+        raising( 5 )
+    except KeyError:
+        pass
+
+fib( 27 )
+
+for x in range( 100000 ):
+    catching()
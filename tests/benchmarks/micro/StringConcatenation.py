@@ -0,0 +1,37 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+def concatenate( pieces, unicode_pieces, n ):
+    # Building strings piece by piece, as often done, without having to copy
+    # the string built so far each time.
+    for _i in xrange( n ):
+        s = ""
+
+        for piece in pieces:
+            s += piece
+            s = s + piece
+
+        u = u""
+
+        for piece in unicode_pieces:
+            u += piece
+
+pieces = [ str( x ) * 8 for x in range( 1000 ) ]
+
+concatenate( pieces, [ unicode( piece ) for piece in pieces ], 500 )
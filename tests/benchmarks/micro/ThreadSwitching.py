@@ -0,0 +1,43 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import threading, time
+
+stop = False
+
+def watchdog():
+    # Mostly sleeping thread, that only rarely wants the GIL.
+    while not stop:
+        time.sleep( 0.1 )
+
+thread = threading.Thread( target = watchdog )
+thread.start()
+
+def worker():
+    # Hot loop in the main thread.
+    values = range( 10000 )
+
+    for y in range( 3000 ):
+        for x in values:
+            pass
+
+worker()
+
+stop = True
+thread.join()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Softwar where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+""" Time the startup of a program with many embedded modules.
+
+The modules are generated, each one also imports a module that does not
+exist, so the loader of embedded modules is asked for names it doesn't have
+as well. The program is compiled with "--recurse-all", and the time of its
+imports compared with CPython.
+
+Usage: time_many_modules.py [module_count] [runs]
+"""
+
+from __future__ import print_function
+
+import os, sys, shutil, tempfile, subprocess
+
+module_count = int( sys.argv[1] ) if len( sys.argv ) > 1 else 1000
+runs = int( sys.argv[2] ) if len( sys.argv ) > 2 else 5
+
+tmp_dir = tempfile.gettempdir()
+
+# Try to avoid RAM disk /tmp and use the disk one instead.
+if tmp_dir == "/tmp" and os.path.exists( "/var/tmp" ):
+    tmp_dir = "/var/tmp"
+
+stage_dir = os.path.join( tmp_dir, "time_many_modules" )
+
+module_template = """\
+# Generated by time_many_modules.py, do not edit.
+import sys, os, re
+
+try:
+    import missing_module_%(index)04d
+except ImportError:
+    pass
+
+value = %(index)d
+"""
+
+main_template = """\
+# Generated by time_many_modules.py, do not edit.
+import time
+
+start = time.time()
+
+%(imports)s
+
+print( time.time() - start )
+"""
+
+def generateProgram():
+    if os.path.exists( stage_dir ):
+        shutil.rmtree( stage_dir )
+
+    package_dir = os.path.join( stage_dir, "some_package" )
+    os.makedirs( package_dir )
+
+    open( os.path.join( package_dir, "__init__.py" ), "w" ).close()
+
+    for index in range( module_count ):
+        module_filename = os.path.join( package_dir, "Module%04d.py" % index )
+
+        with open( module_filename, "w" ) as module_file:
+            module_file.write( module_template % { "index" : index } )
+
+    main_filename = os.path.join( stage_dir, "ManyModulesMain.py" )
+
+    with open( main_filename, "w" ) as main_file:
+        main_file.write(
+            main_template % {
+                "imports" : "\n".join(
+                    "import some_package.Module%04d" % index
+                    for index in
+                    range( module_count )
+                )
+            }
+        )
+
+    return main_filename
+
+def compileProgram( main_filename ):
+    command = [
+        sys.executable,
+        os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), "..", "..", "..", "bin", "nuitka" ),
+        "--exe",
+        "--recurse-all",
+        "--output-dir",
+        stage_dir
+    ]
+
+    command += os.environ.get( "NUITKA_EXTRA_OPTIONS", "" ).split()
+
+    command.append( main_filename )
+
+    subprocess.check_call( command )
+
+    return main_filename.replace( ".py", ".exe" )
+
+def timeImports( command ):
+    # The program reports the time its imports took, the minimum of all runs
+    # is used. The first run is not counted, it may create ".pyc" files.
+    timings = []
+
+    for _count in range( runs + 1 ):
+        output = subprocess.Popen(
+            command,
+            stdout = subprocess.PIPE,
+            cwd    = tmp_dir
+        ).communicate()[0]
+
+        timings.append( float( output ) )
+
+    return min( timings[1:] )
+
+main_filename = generateProgram()
+exe_filename = compileProgram( main_filename )
+
+# Running from another directory, so CPython cannot find the modules without
+# being told, but compiled ones are embedded.
+os.environ[ "PYTHONPATH" ] = stage_dir
+
+print( "Importing %d modules, minimum of %d runs:" % ( module_count, runs ) )
+print( "CPython  %.3fs" % timeImports( [ sys.executable, main_filename ] ) )
+
+del os.environ[ "PYTHONPATH" ]
+
+print( "Compiled %.3fs" % timeImports( [ exe_filename ] ) )
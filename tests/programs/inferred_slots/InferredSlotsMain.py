@@ -0,0 +1,33 @@
+#     Copyright 2013, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+# The classes of "Records" are used as several bases only in a module that is
+# imported later, from a function. With "--infer-slots", their layouts must
+# still not conflict.
+import Records
+
+def combine():
+    import Combined
+
+    return Combined.Both()
+
+both = combine()
+both.setup()
+
+print( "Several bases from another module:", both.a, both.b )
+print( "Single record:", Records.First().a )
@@ -62,6 +62,44 @@ os.environ[ "PYTHONPATH" ] = os.getcwd()
 
 print( "Using concrete python", python_version )
 
+def checkTimingReport( report_filename, profile_dir ):
+    """ Check the report and profiles of "--report-timing" and "--profile-compiler".
+
+    """
+
+    import json
+
+    with open( report_filename ) as report_file:
+        report = json.load( report_file )
+
+    phases = dict(
+        ( phase[ "name" ], phase[ "parent" ] )
+        for phase in
+        report[ "phases" ]
+    )
+
+    expected_phases = {
+        "building"         : None,
+        "optimization"     : None,
+        "source_directory" : None,
+        "finalization"     : "source_directory",
+        "code_generation"  : "source_directory",
+        "scons"            : None
+    }
+
+    if phases != expected_phases:
+        sys.exit( "Error, unexpected phases in timing report: %r" % phases )
+
+    for module_name in ( "__main__", "TimingReportHelper" ):
+        if "generated_size" not in report[ "modules" ].get( module_name, {} ):
+            sys.exit( "Error, no statistics for module %s in timing report." % module_name )
+
+    profile_filenames = sorted( os.listdir( profile_dir ) )
+    expected_filenames = sorted( name + ".prof" for name in expected_phases )
+
+    if profile_filenames != expected_filenames:
+        sys.exit( "Error, unexpected profiles: %r" % profile_filenames )
+
 for filename in sorted( os.listdir( "." ) ):
     if not os.path.isdir( filename ) or filename.endswith( ".build" ):
         continue
@@ -93,6 +131,15 @@ for filename in sorted( os.listdir( "." ) ):
 
         if filename == "plugin_import":
             os.environ[ "NUITKA_EXTRA_OPTIONS" ] = "--recurse-all --recurse-directory=%s/some_package" % filename
+        elif filename == "inferred_slots":
+            os.environ[ "NUITKA_EXTRA_OPTIONS" ] = "--recurse-all --infer-slots"
+        elif filename == "timing_report":
+            report_dir = tempfile.mkdtemp()
+
+            os.environ[ "NUITKA_EXTRA_OPTIONS" ] = "--recurse-all --report-timing=%s --profile-compiler=%s" % (
+                os.path.join( report_dir, "report.json" ),
+                os.path.join( report_dir, "profiles" )
+            )
         else:
             os.environ[ "NUITKA_EXTRA_OPTIONS" ] = "--recurse-all"
 
@@ -122,6 +169,15 @@ for filename in sorted( os.listdir( "." ) ):
             sys.stderr.write( "Interruped, with CTRL-C\n" )
             sys.exit( 2 )
 
+        if filename == "timing_report":
+            if result == 0:
+                checkTimingReport(
+                    report_filename = os.path.join( report_dir, "report.json" ),
+                    profile_dir     = os.path.join( report_dir, "profiles" )
+                )
+
+            shutil.rmtree( report_dir )
+
         if result != 0 and search_mode:
             print( "Error exit!", result )
             sys.exit( result )